@@ -4,23 +4,66 @@
 `__main__` implementation, can be run directly or with `python -m cdd`
 """
 
+import sys
 from argparse import ArgumentParser, Namespace, _SubParsersAction
 from codecs import decode
-from collections import deque
+from collections import OrderedDict, deque
+from importlib import import_module
 from itertools import chain, filterfalse
 from operator import eq
 from os import path
+from typing import List
 
 from cdd import __description__, __version__
-from cdd.compound.doctrans import doctrans
-from cdd.compound.exmod import exmod
-from cdd.compound.gen import gen
-from cdd.compound.openapi.gen_openapi import openapi_bulk
-from cdd.compound.openapi.gen_routes import gen_routes, upsert_routes
-from cdd.compound.sync_properties import sync_properties
-from cdd.shared.conformance import ground_truth
-from cdd.shared.docstring_parsers import Style
+from cdd.shared.docstring_utils import Style
+from cdd.shared.ir_cache import default_ir_cache_dir, set_ir_cache_dir
 from cdd.shared.pure_utils import pluralise, rpartial
+from cdd.shared.tracing import (
+    disable_tracing,
+    enable_tracing,
+    tracing_summary,
+    write_chrome_trace,
+)
+
+
+def _lazy(module, name):
+    """
+    Stand-in for `from module import name` that only imports the module once called; so each subcommand imports
+    only what it needs, and `python -m cdd` starts quickly
+
+    :param module: Module name, like `"cdd.compound.gen"`
+    :type module: ```str```
+
+    :param name: Name of the function within `module`
+    :type name: ```str```
+
+    :return: Function that imports `module` then calls its `name` with the arguments given
+    :rtype: ```Callable[[...], Any]```
+    """
+
+    def call(*args, **kwargs):
+        """
+        :return: What `module.name` returns
+        :rtype: ```Any```
+        """
+        return getattr(import_module(module), name)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    return call
+
+
+batch = _lazy("cdd.compound.batch", "batch")
+doctrans_filenames = _lazy("cdd.compound.doctrans", "doctrans_filenames")
+doctrans_files = _lazy("cdd.compound.doctrans", "doctrans_files")
+exmod = _lazy("cdd.compound.exmod", "exmod")
+gen = _lazy("cdd.compound.gen", "gen")
+gen_routes = _lazy("cdd.compound.openapi.gen_routes", "gen_routes")
+forward = _lazy("cdd.compound.serve", "forward")
+ground_truth = _lazy("cdd.shared.conformance", "ground_truth")
+openapi_bulk = _lazy("cdd.compound.openapi.gen_openapi", "openapi_bulk")
+serve = _lazy("cdd.compound.serve", "serve")
+sync_properties = _lazy("cdd.compound.sync_properties", "sync_properties")
+upsert_routes = _lazy("cdd.compound.openapi.gen_routes", "upsert_routes")
 
 parse_emit_types = (
     "argparse",
@@ -50,6 +93,33 @@ def _build_parser():
         action="version",
         version="%(prog)s {__version__}".format(__version__=__version__),
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Cache parsed IR on disk, across invocations, in this directory."
+        " Defaults to `$XDG_CACHE_HOME/cdd` when given without a value.",
+        nargs="?",
+        const=default_ir_cache_dir(),
+        default=None,
+    )
+    parser.add_argument(
+        "--server",
+        help="Forward the command to the `serve` daemon listening on this Unix domain socket.",
+        metavar="SOCKET",
+        default=None,
+    )
+    parser.add_argument(
+        "--timings",
+        help="Print how long each phase took—parse, emit, format, write, &etc.—and counters of the files parsed,"
+        " symbols emitted, cache hits, and bytes written; to stderr.",
+        action="store_true",
+        dest="print_timings",
+    )
+    parser.add_argument(
+        "--trace-out",
+        help="Write the phases and counters to this file, as Chrome-trace JSON (for `chrome://tracing` or Perfetto).",
+        metavar="TRACE_FILE",
+        default=None,
+    )
 
     subparsers: _SubParsersAction[ArgumentParser] = parser.add_subparsers()
     subparsers.required = True
@@ -238,7 +308,11 @@ def _build_parser():
         dest="emit_name",
     )
     gen_parser.add_argument(
-        "-o", "--output-filename", help="Output file to write to.", required=True
+        "-o",
+        "--output-filename",
+        help="Output file to write to. For SQLalchemy, an existing directory instead gets a file per model,"
+        " with imports and foreign keys resolved (no phases 1 and 2 needed).",
+        required=True,
     )
     gen_parser.add_argument(
         "--emit-call",
@@ -323,6 +397,7 @@ def _build_parser():
     openapi_parser.add_argument(
         "--model-paths",
         help="Python module resolution (foo.models) or filepath (foo/models)",
+        nargs="*",
         required=True,
     )
     openapi_parser.add_argument(
@@ -331,6 +406,13 @@ def _build_parser():
         nargs="*",
         required=True,
     )
+    openapi_parser.add_argument(
+        "-j",
+        "--jobs",
+        help="Number of worker processes to parse the files on. Defaults to serial execution.",
+        type=int,
+        default=None,
+    )
 
     ############
     # doctrans #
@@ -344,9 +426,13 @@ def _build_parser():
 
     doctrans_parser.add_argument(
         "--filename",
-        help="Python file to convert docstrings within. Edited in place.",
+        help="Python file, directory (its `.py` files, recursively), or glob to convert docstrings within;"
+        " specifiable multiple times. Edited in place.",
         type=str,
         required=True,
+        action="append",
+        dest="filenames",
+        metavar="FILENAME",
     )
     doctrans_parser.add_argument(
         "--format",
@@ -374,6 +460,18 @@ def _build_parser():
         help="Whether word-wrap is disabled (on emission). None enables word-wrap. Defaults to None.",
         action="store_true",
     )
+    doctrans_parser.add_argument(
+        "-j",
+        "--jobs",
+        help="Number of worker processes to convert files on. Defaults to serial execution.",
+        type=int,
+        default=None,
+    )
+    doctrans_parser.add_argument(
+        "--check",
+        help="Don't write any file; exit with 1 if any would change.",
+        action="store_true",
+    )
 
     #########
     # exmod #
@@ -451,6 +549,54 @@ def _build_parser():
         help="Show what would be created; don't actually write to the filesystem.",
         action="store_true",
     )
+    exmod_parser.add_argument(
+        "--incremental",
+        help="Only regenerate outputs whose source changed since the last run; tracked by a manifest in"
+        " `--output-directory`. Outputs of sources that no longer exist are removed.",
+        action="store_true",
+    )
+    exmod_parser.add_argument(
+        "-j",
+        "--jobs",
+        help="Number of worker processes to spread the per-folder work over. Defaults to serial execution.",
+        type=int,
+        default=None,
+    )
+
+    #########
+    # batch #
+    #########
+    batch_parser: ArgumentParser = subparsers.add_parser(
+        "batch",
+        help="Run the jobs of a manifest in one process—ordered by the files each reads & writes—sharing imports"
+        " and caches",
+    )
+    batch_parser.add_argument(
+        "manifest",
+        help="JSON or YAML file listing the jobs; each a `command` with its arguments, named as on the CLI.",
+    )
+    batch_parser.add_argument(
+        "-j",
+        "--jobs",
+        help="Number of worker processes to run independent jobs on. Defaults to serial execution.",
+        type=int,
+        default=None,
+    )
+
+    #########
+    # serve #
+    #########
+    serve_parser: ArgumentParser = subparsers.add_parser(
+        "serve",
+        help="Serve the commands over JSON-RPC from a long-running process, keeping imports and caches warm",
+    )
+    serve_parser.add_argument(
+        "--socket",
+        help="Listen on this Unix domain socket. Defaults to stdin & stdout.",
+        dest="socket_path",
+        metavar="SOCKET",
+        default=None,
+    )
 
     return parser
 
@@ -471,61 +617,54 @@ def main(cli_argv=None, return_args=False):
     _parser: ArgumentParser = _build_parser()
     args: Namespace = _parser.parse_args(args=cli_argv)
     command: str = args.command
-    args_dict = {k: v for k, v in vars(args).items() if k != "command"}
-    if command == "sync":
-        args: Namespace = Namespace(
-            **{
-                k: (
-                    v
-                    if k in frozenset(("truth", "no_word_wrap"))
-                    or isinstance(v, list)
-                    or v is None
-                    else [v]
-                )
-                for k, v in args_dict.items()
-            }
+    if args.server is not None and command != "serve" and not return_args:
+        return _forward(args.server, sys.argv[1:] if cli_argv is None else cli_argv)
+    if args.cache_dir is not None:
+        set_ir_cache_dir(args.cache_dir)
+    args_dict = {
+        k: v
+        for k, v in vars(args).items()
+        if k
+        not in frozenset(
+            ("command", "cache_dir", "server", "print_timings", "trace_out")
         )
+    }
+    tracing = (
+        args.print_timings or args.trace_out is not None
+    ) and not return_args  # type: bool
+    if tracing:
+        enable_tracing()
+    try:
+        return _run_command(_parser, args, args_dict, return_args)
+    finally:
+        if tracing:
+            _report_tracing(args.print_timings, args.trace_out)
+
+
+def _run_command(_parser, args, args_dict, return_args):
+    """
+    Internal function to run the subcommand
 
-        truth_file: str = getattr(args, pluralise(args.truth))
-        require_file_existent(
-            _parser, truth_file[0] if truth_file else truth_file, name="truth"
-        )
-        truth_file: str = path.realpath(path.expanduser(truth_file[0]))
+    :param _parser: The argparse parser
+    :type _parser: ```ArgumentParser```
 
-        number_of_files: int = sum(
-            len(val)
-            for key, val in vars(args).items()
-            if isinstance(val, list) and not key.endswith("_names")
-        )
+    :param args: Parsed CLI arguments
+    :type args: ```Namespace```
 
-        if number_of_files < 2:
-            _parser.error(
-                "Two or more of `--argparse-function`, `--class`, and `--function` must"
-                " be specified"
-            )
-        require_file_existent(_parser, truth_file, name="truth")
+    :param args_dict: Parsed CLI arguments, without the global ones
+    :type args_dict: ```dict```
 
-        return args if return_args else ground_truth(args, truth_file)
-    elif command == "sync_properties":
-        deque(
-            (
-                setattr(
-                    args,
-                    filename,
-                    path.realpath(path.expanduser(getattr(args, filename))),
-                )
-                for filename in ("input_filename", "output_filename")
-                if path.isfile(getattr(args, filename))
-            ),
-            maxlen=0,
-        )
+    :param return_args: Primarily use is for tests. Returns the args rather than executing anything.
+    :type return_args: ```bool```
 
-        for filename, arg_name in (args.input_filename, "input-file"), (
-            args.output_filename,
-            "output-file",
-        ):
-            require_file_existent(_parser, filename, name=arg_name)
-        sync_properties(**args_dict)
+    :return: the args if `return_args`, else None
+    :rtype: ```Optional[Namespace]```
+    """
+    command: str = args.command
+    if command == "sync":
+        return _sync(_parser, args_dict, return_args)
+    elif command == "sync_properties":
+        _sync_properties(_parser, args, args_dict)
     elif command == "gen":
         if path.isfile(args.output_filename) and args.phase == 0:
             raise IOError(
@@ -534,32 +673,11 @@ def main(cli_argv=None, return_args=False):
             )
         gen(**args_dict)
     elif command == "gen_routes":
-        if args.route is None:
-            args.route = "/api/{model_name}".format(model_name=args.model_name.lower())
-
-        (
-            lambda routes__primary_key: upsert_routes(
-                app=args.app_name,
-                route=args.route,
-                routes=routes__primary_key[0],
-                routes_path=getattr(args, "routes_path", None),
-                primary_key=routes__primary_key[1],
-            )
-        )(
-            gen_routes(
-                app=args.app_name,
-                crud=args.crud,
-                model_name=args.model_name,
-                model_path=args.model_path,
-                route=args.route,
-            )
-        )
+        _gen_routes(args)
     elif command == "openapi":
         openapi_bulk(**args_dict)
     elif command == "doctrans":
-        require_file_existent(_parser, args.filename, name="filename")
-        args_dict["docstring_format"] = args_dict.pop("format")
-        doctrans(**args_dict)
+        _doctrans(_parser, args_dict)
         # except:
         #     import sys
         #     print("#", args_dict["filename"], file=sys.stderr)
@@ -569,6 +687,213 @@ def main(cli_argv=None, return_args=False):
             mock_imports=False,  # This option is really only useful for tests IMHO
             **args_dict
         )
+    elif command == "batch":
+        _batch(args_dict)
+    elif command == "serve":
+        serve(**args_dict)
+
+
+def _report_tracing(print_timings, trace_out):
+    """
+    Internal function to stop tracing, then print its summary and/or write its Chrome trace
+
+    :param print_timings: Whether to print the summary table to stderr
+    :type print_timings: ```bool```
+
+    :param trace_out: Path to write the Chrome trace to
+    :type trace_out: ```Optional[str]```
+    """
+    disable_tracing()
+    if print_timings:
+        print(tracing_summary(), file=sys.stderr)
+    if trace_out is not None:
+        write_chrome_trace(trace_out)
+
+
+def _batch(args_dict):
+    """
+    Internal function to run the `batch` subcommand, exiting non-zero if any job failed or was skipped
+
+    :param args_dict: Parsed CLI arguments, without the global ones
+    :type args_dict: ```dict```
+    """
+    _, failed, skipped = batch(**args_dict)
+    if failed or skipped:
+        raise SystemExit(1)
+
+
+def _sync_properties(_parser, args, args_dict):
+    """
+    Internal function to resolve & check the files of the `sync_properties` subcommand then run it
+
+    :param _parser: The argparse parser
+    :type _parser: ```ArgumentParser```
+
+    :param args: Parsed CLI arguments
+    :type args: ```Namespace```
+
+    :param args_dict: Parsed CLI arguments, without the global ones
+    :type args_dict: ```dict```
+    """
+    deque(
+        (
+            setattr(
+                args,
+                filename,
+                path.realpath(path.expanduser(getattr(args, filename))),
+            )
+            for filename in ("input_filename", "output_filename")
+            if path.isfile(getattr(args, filename))
+        ),
+        maxlen=0,
+    )
+
+    for filename, arg_name in (args.input_filename, "input-file"), (
+        args.output_filename,
+        "output-file",
+    ):
+        require_file_existent(_parser, filename, name=arg_name)
+    sync_properties(**args_dict)
+
+
+def _sync(_parser, args_dict, return_args):
+    """
+    Internal function to check the arguments of the `sync` subcommand then run `ground_truth`
+
+    :param _parser: The argparse parser
+    :type _parser: ```ArgumentParser```
+
+    :param args_dict: Parsed arguments of the `sync` subcommand
+    :type args_dict: ```dict```
+
+    :param return_args: Primarily use is for tests. Returns the args rather than executing anything.
+    :type return_args: ```bool```
+
+    :return: the args if `return_args`, else what `ground_truth` returns
+    :rtype: ```Union[Namespace, OrderedDict]```
+    """
+    args: Namespace = Namespace(
+        **{
+            k: (
+                v
+                if k in frozenset(("truth", "no_word_wrap"))
+                or isinstance(v, list)
+                or v is None
+                else [v]
+            )
+            for k, v in args_dict.items()
+        }
+    )
+
+    truth_file: str = getattr(args, pluralise(args.truth))
+    require_file_existent(
+        _parser, truth_file[0] if truth_file else truth_file, name="truth"
+    )
+    truth_file: str = path.realpath(path.expanduser(truth_file[0]))
+
+    number_of_files: int = sum(
+        len(val)
+        for key, val in vars(args).items()
+        if isinstance(val, list) and not key.endswith("_names")
+    )
+
+    if number_of_files < 2:
+        _parser.error(
+            "Two or more of `--argparse-function`, `--class`, and `--function` must"
+            " be specified"
+        )
+    require_file_existent(_parser, truth_file, name="truth")
+
+    return args if return_args else ground_truth(args, truth_file)
+
+
+def _gen_routes(args):
+    """
+    Internal function to generate the routes then upsert them, for the `gen_routes` subcommand
+
+    :param args: Parsed arguments of the `gen_routes` subcommand
+    :type args: ```Namespace```
+    """
+    if args.route is None:
+        args.route = "/api/{model_name}".format(model_name=args.model_name.lower())
+
+    (
+        lambda routes__primary_key: upsert_routes(
+            app=args.app_name,
+            route=args.route,
+            routes=routes__primary_key[0],
+            routes_path=getattr(args, "routes_path", None),
+            primary_key=routes__primary_key[1],
+        )
+    )(
+        gen_routes(
+            app=args.app_name,
+            crud=args.crud,
+            model_name=args.model_name,
+            model_path=args.model_path,
+            route=args.route,
+        )
+    )
+
+
+def _forward(server, cli_argv):
+    """
+    Internal function to run the command on the `serve` daemon, rather than in this process.
+    Raise SystemExit if it exited non-zero.
+
+    :param server: Path of the Unix domain socket the daemon listens on
+    :type server: ```str```
+
+    :param cli_argv: CLI arguments, i.e., without the program name
+    :type cli_argv: ```list[str]```
+    """
+    exit_code = forward(server, _without_server(cli_argv))  # type: Union[int, str]
+    if exit_code:
+        raise SystemExit(exit_code)
+
+
+def _without_server(cli_argv):
+    """
+    Internal function to remove `--server SOCKET` from the CLI arguments, as the daemon is to run the command itself
+
+    :param cli_argv: CLI arguments, i.e., without the program name
+    :type cli_argv: ```list[str]```
+
+    :return: CLI arguments without `--server`
+    :rtype: ```list[str]```
+    """
+    without_server = []  # type: list[str]
+    arguments = iter(cli_argv)
+    for argument in arguments:
+        if argument == "--server":
+            next(arguments, None)
+        elif not argument.startswith("--server="):
+            without_server.append(argument)
+    return without_server
+
+
+def _doctrans(_parser, args_dict):
+    """
+    Internal function to expand the files, directories, and globs then `doctrans` them.
+    Raise SystemExit(1) if any file failed, or—with `--check`—would change.
+
+    :param _parser: The argparse parser
+    :type _parser: ```ArgumentParser```
+
+    :param args_dict: Parsed arguments of the `doctrans` subcommand
+    :type args_dict: ```dict```
+    """
+    filenames = []  # type: list[str]
+    for filename in args_dict["filenames"]:
+        filename_matches: List[str] = doctrans_filenames(filename)
+        if not filename_matches:
+            require_file_existent(_parser, filename, name="filename")
+        filenames += filename_matches
+    args_dict["filenames"] = list(OrderedDict.fromkeys(filenames))
+    args_dict["docstring_format"] = args_dict.pop("format")
+    changed, failed = doctrans_files(**args_dict)
+    if failed or args_dict["check"] and changed:
+        raise SystemExit(1)
 
 
 def require_file_existent(_parser, filename, name):
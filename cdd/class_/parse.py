@@ -24,6 +24,7 @@ import cdd.docstring.parse
 import cdd.function.parse
 import cdd.shared.ast_utils
 import cdd.shared.docstring_parsers
+import cdd.shared.ir_cache
 import cdd.shared.parse.utils.parser_utils
 import cdd.shared.source_transformer
 from cdd.class_.utils.parse_utils import get_source
@@ -31,6 +32,7 @@ from cdd.shared.pure_utils import rpartial, simple_types
 from cdd.shared.types import IntermediateRepr
 
 
+@cdd.shared.ir_cache.cached_parser
 def class_(
     class_def,
     class_name=None,
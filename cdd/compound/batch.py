@@ -0,0 +1,514 @@
+"""
+Run a manifest of jobs—`gen`, `sync`, `doctrans`, &etc.—in one process (or one pool of them); ordered by the files
+each reads & writes, with the independent jobs run concurrently, sharing imports and the parse cache.
+"""
+
+import json
+from argparse import _SubParsersAction
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import redirect_stderr, redirect_stdout
+from functools import partial
+from heapq import heapify, heappop, heappush
+from importlib import import_module
+from io import StringIO
+from itertools import chain
+from os import path
+from time import perf_counter
+
+import cdd.shared.ir_cache
+import cdd.shared.source_transformer
+from cdd.shared.pure_utils import filename_from_mod_or_filename
+
+BatchJob = namedtuple("BatchJob", ("name", "command", "argv", "reads", "writes"))
+
+# Command to the arguments (`dest`s) it reads, writes, and edits in place
+JOB_PATHS = {
+    "doctrans": ((), (), ("filenames",)),
+    "exmod": (("module",), ("output_directory",), ()),
+    "gen": (("input_mapping", "imports_from_file"), ("output_filename",), ()),
+    "gen_routes": (("model_path",), (), ("routes_path",)),
+    "openapi": (("model_paths", "routes_paths"), (), ()),
+    "sync": ((), (), ("argparse_functions", "classes", "functions")),
+    "sync_properties": (("input_filename",), (), ("output_filename",)),
+}  # type: dict[str, tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]]
+
+
+def load_manifest(filename):
+    """
+    Load the jobs of the manifest: a list of them—or a dict with them under `"jobs"`—in JSON or YAML.
+    Each job is a dict of its `command`, an optional `name`, and its arguments, named as on the CLI, e.g.,
+    `{"command": "gen", "name-tpl": "{name}Config", "input-mapping": "foo.bar", "emit": "class", "o": "out.py"}`.
+    Underscores may replace dashes, and an argument given many times is given as a list.
+
+    :param filename: Path of the manifest; YAML if it ends with `.yaml` or `.yml`, else JSON
+    :type filename: ```str```
+
+    :return: Jobs, in the order of the manifest
+    :rtype: ```list[BatchJob]```
+    """
+    with open(filename, "rt") as f:
+        manifest = (
+            import_module("yaml").safe_load(f)
+            if path.splitext(filename)[1] in frozenset((".yaml", ".yml"))
+            else json.load(f)
+        )
+    parser = import_module("cdd.__main__")._build_parser()
+    subparsers = next(
+        action for action in parser._actions if isinstance(action, _SubParsersAction)
+    ).choices  # type: dict[str, ArgumentParser]
+    return list(
+        map(
+            lambda index_job: batch_job(parser, subparsers, *index_job),
+            enumerate(
+                manifest["jobs"] if isinstance(manifest, dict) else manifest, start=1
+            ),
+        )
+    )
+
+
+def batch_job(parser, subparsers, index, job):
+    """
+    Convert the job of the manifest to the CLI arguments that run it, and the files it reads & writes
+
+    :param parser: CLI parser, as built by `cdd.__main__._build_parser`
+    :type parser: ```ArgumentParser```
+
+    :param subparsers: Command to its subparser
+    :type subparsers: ```dict[str, ArgumentParser]```
+
+    :param index: Position of the job in the manifest, starting from 1
+    :type index: ```int```
+
+    :param job: Job of the manifest; its `command`, optional `name`, and its arguments
+    :type job: ```dict```
+
+    :return: Job, ready to run
+    :rtype: ```BatchJob```
+    """
+    command = job.get("command")  # type: Optional[str]
+    name = job.get("name", "{command} #{index:d}".format(command=command, index=index))
+    if command not in JOB_PATHS:
+        raise ValueError(
+            "{name}: `command` must be one of: {commands}".format(
+                name=name, commands=", ".join(sorted(JOB_PATHS))
+            )
+        )
+    subparser = subparsers[command]
+    argv = [command]  # type: list[str]
+    for key, value in job.items():
+        if key in frozenset(("command", "name")):
+            continue
+        action = _find_action(subparser, key)
+        if action is None:
+            raise ValueError(
+                "{name}: `{command}` has no argument {key!r}".format(
+                    name=name, command=command, key=key
+                )
+            )
+        option = action.option_strings[-1]  # type: str
+        if action.nargs == 0:
+            argv += [option] if value else []
+        elif action.nargs in frozenset(("*", "+")):
+            argv += [option] + list(
+                map(str, value if isinstance(value, list) else [value])
+            )
+        else:
+            argv += chain.from_iterable(
+                map(
+                    lambda val: (option, str(val)),
+                    value if isinstance(value, list) else [value],
+                )
+            )
+    try:
+        args = parser.parse_args(argv)  # type: Namespace
+    except SystemExit:
+        raise ValueError(
+            "{name}: invalid arguments to `{command}`".format(
+                name=name, command=command
+            )
+        )
+    reads, writes, edits = map(
+        lambda dests: frozenset(
+            chain.from_iterable(map(partial(_paths_of, args), dests))
+        ),
+        JOB_PATHS[command],
+    )
+    return BatchJob(
+        name=name,
+        command=command,
+        argv=argv,
+        reads=reads | edits,
+        writes=writes | edits,
+    )
+
+
+def _find_action(subparser, key):
+    """
+    Internal function to find the argument of the subparser named `key`; by its option, without dashes, or its `dest`
+
+    :param subparser: Subparser of the command
+    :type subparser: ```ArgumentParser```
+
+    :param key: Name of the argument, e.g., `"output-filename"`, `"output_filename"`, or `"o"`
+    :type key: ```str```
+
+    :return: Argument, if found
+    :rtype: ```Optional[Action]```
+    """
+    option = key.replace("_", "-")  # type: str
+    return subparser._option_string_actions.get(
+        "{dashes}{option}".format(
+            dashes="-" if len(option) == 1 else "--", option=option
+        ),
+        next(filter(lambda action: action.dest == key, subparser._actions), None),
+    )
+
+
+def _paths_of(args, dest):
+    """
+    Internal function to resolve the value(s) of the argument to real paths; modules to their file (or directory)
+
+    :param args: Parsed CLI arguments
+    :type args: ```Namespace```
+
+    :param dest: Name of the argument within `args`
+    :type dest: ```str```
+
+    :return: Real paths the argument names
+    :rtype: ```Iterator[str]```
+    """
+    value = getattr(args, dest, None)  # type: Optional[Union[str, list[str]]]
+    for mod_or_filename in filter(None, value if isinstance(value, list) else [value]):
+        try:
+            filename = (
+                filename_from_mod_or_filename(mod_or_filename) or mod_or_filename
+            )  # type: str
+        except ImportError:
+            filename = mod_or_filename  # type: str
+        if path.basename(filename) == "__init__{extsep}py".format(extsep=path.extsep):
+            filename = path.dirname(filename)  # type: str
+        yield path.realpath(filename)
+
+
+def _overlaps(paths0, paths1):
+    """
+    Internal function to check whether any of the paths are the same, or one is within the other
+
+    :param paths0: Real paths
+    :type paths0: ```frozenset[str]```
+
+    :param paths1: Real paths
+    :type paths1: ```frozenset[str]```
+
+    :return: Whether any of the paths are the same, or one is within the other
+    :rtype: ```bool```
+    """
+    return any(
+        path0 == path1
+        or path0.startswith(path1 + path.sep)
+        or path1.startswith(path0 + path.sep)
+        for path0 in paths0
+        for path1 in paths1
+    )
+
+
+def _produces(job0, job1):
+    """
+    Internal function to check whether the first job creates—rather than edits in place—what the second reads or
+    writes
+
+    :param job0: Job
+    :type job0: ```BatchJob```
+
+    :param job1: Job
+    :type job1: ```BatchJob```
+
+    :return: Whether `job0` creates what `job1` reads or writes
+    :rtype: ```bool```
+    """
+    return _overlaps(job0.writes - job0.reads, job1.reads | job1.writes)
+
+
+def _precedes(i, job0, j, job1):
+    """
+    Internal function to check whether the job at index `i` must complete before that at index `j` starts
+
+    :param i: Index of `job0` within the manifest
+    :type i: ```int```
+
+    :param job0: Job
+    :type job0: ```BatchJob```
+
+    :param j: Index of `job1` within the manifest
+    :type j: ```int```
+
+    :param job1: Job
+    :type job1: ```BatchJob```
+
+    :return: Whether `job0` must complete before `job1` starts
+    :rtype: ```bool```
+    """
+    produces, produced = _produces(job0, job1), _produces(job1, job0)
+    return (
+        produces
+        if produces != produced
+        else i < j
+        and (
+            _overlaps(job0.writes, job1.reads | job1.writes)
+            or _overlaps(job1.writes, job0.reads | job0.writes)
+        )
+    )
+
+
+def job_dependencies(jobs):
+    """
+    Which jobs each job waits on: a job creating a file precedes the jobs reading or writing it, wherever they are
+    in the manifest. Other jobs touching the same files—e.g., editing one in place—run in the order of the manifest.
+
+    :param jobs: Jobs, in the order of the manifest
+    :type jobs: ```list[BatchJob]```
+
+    :return: For each job, the indices of the jobs it waits on
+    :rtype: ```list[frozenset[int]]```
+    """
+    dependencies = list(
+        map(
+            lambda j_job: frozenset(
+                i
+                for i, job in enumerate(jobs)
+                if i != j_job[0] and _precedes(i, job, *j_job)
+            ),
+            enumerate(jobs),
+        )
+    )  # type: list[frozenset[int]]
+    waiting_on = list(map(set, dependencies))  # type: list[set[int]]
+    ready = [i for i, deps in enumerate(waiting_on) if not deps]  # type: list[int]
+    while ready:
+        i = ready.pop()  # type: int
+        for j, deps in enumerate(waiting_on):
+            if i in deps:
+                deps.remove(i)
+                if not deps:
+                    ready.append(j)
+    cyclic = [
+        job.name for job, deps in zip(jobs, waiting_on) if deps
+    ]  # type: list[str]
+    if cyclic:
+        raise ValueError(
+            "Jobs wait on each other: {names}".format(names=", ".join(cyclic))
+        )
+    return dependencies
+
+
+def _run_job(argv):
+    """
+    Internal function to run the job, as `python -m cdd` would with `argv`, timing it and capturing its output
+
+    :param argv: CLI arguments, i.e., without the program name
+    :type argv: ```list[str]```
+
+    :return: Whether it succeeded, seconds taken, what it printed, error (None on success)
+    :rtype: ```tuple[bool, float, str, Optional[str]]```
+    """
+    output = StringIO()
+    start = perf_counter()  # type: float
+    error = None  # type: Optional[str]
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            import_module("cdd.__main__").main(cli_argv=argv)
+        except SystemExit as e:
+            if e.code:
+                error = "exit code {code}".format(code=e.code)  # type: str
+        except Exception as e:
+            error = "{type_name}: {e}".format(type_name=type(e).__name__, e=e)
+    return error is None, perf_counter() - start, output.getvalue(), error
+
+
+def _init_worker(ir_cache_dir):
+    """
+    Internal function to initialise a worker process: the IR cache of the parent, and a parse cache of its own
+
+    :param ir_cache_dir: Directory of the IR cache; None if disabled
+    :type ir_cache_dir: ```Optional[str]```
+    """
+    cdd.shared.ir_cache.set_ir_cache_dir(ir_cache_dir)
+    if cdd.shared.source_transformer.parse_cache_info() is None:
+        cdd.shared.source_transformer.enable_parse_cache(maxsize=1024)
+
+
+def _complete(jobs, statuses, waiting_on, ready, i, succeeded, seconds, output, error):
+    """
+    Internal function to record & print the result of the job; readying the jobs waiting on it, marking them to be
+    skipped if it didn't succeed
+
+    :param jobs: Jobs, in the order of the manifest
+    :type jobs: ```list[BatchJob]```
+
+    :param statuses: Status of each job; None until it completes, `"skipping"` once marked to be skipped
+    :type statuses: ```list[Optional[str]]```
+
+    :param waiting_on: For each job, the indices of the jobs it still waits on
+    :type waiting_on: ```list[set[int]]```
+
+    :param ready: Heap of the indices of the jobs ready to run
+    :type ready: ```list[int]```
+
+    :param i: Index of the job
+    :type i: ```int```
+
+    :param succeeded: Whether the job succeeded; None if skipped
+    :type succeeded: ```Optional[bool]```
+
+    :param seconds: Seconds the job took
+    :type seconds: ```float```
+
+    :param output: What the job printed
+    :type output: ```str```
+
+    :param error: Why the job failed or was skipped; None on success
+    :type error: ```Optional[str]```
+    """
+    statuses[i] = (
+        "skipped" if succeeded is None else "succeeded" if succeeded else "failed"
+    )
+    print(
+        "{status:<10}{seconds:8.3f}s  {name}{error}".format(
+            status=statuses[i],
+            seconds=seconds,
+            name=jobs[i].name,
+            error="" if error is None else "\t{error}".format(error=error),
+        )
+    )
+    if succeeded is False and output:
+        print(output, end="" if output.endswith("\n") else "\n")
+    for j, deps in enumerate(waiting_on):
+        if i in deps:
+            deps.remove(i)
+            if statuses[i] != "succeeded":
+                statuses[j] = "skipping"
+            if not deps:
+                heappush(ready, j)
+
+
+def _next_ready(jobs, statuses, waiting_on, ready):
+    """
+    Internal function to pop the next job ready to run, in the order of the manifest; skipping those marked so
+
+    :param jobs: Jobs, in the order of the manifest
+    :type jobs: ```list[BatchJob]```
+
+    :param statuses: Status of each job; None until it completes, `"skipping"` once marked to be skipped
+    :type statuses: ```list[Optional[str]]```
+
+    :param waiting_on: For each job, the indices of the jobs it still waits on
+    :type waiting_on: ```list[set[int]]```
+
+    :param ready: Heap of the indices of the jobs ready to run
+    :type ready: ```list[int]```
+
+    :return: Index of the next job to run; None if none is ready
+    :rtype: ```Optional[int]```
+    """
+    while ready:
+        i = heappop(ready)  # type: int
+        if statuses[i] != "skipping":
+            return i
+        _complete(
+            jobs,
+            statuses,
+            waiting_on,
+            ready,
+            i,
+            None,
+            0.0,
+            "",
+            "a job it depends on didn't succeed",
+        )
+    return None
+
+
+def run_batch(jobs, max_workers=None):
+    """
+    Run the jobs, each after the jobs it depends on—see `job_dependencies`—printing a status line per job as it
+    completes. Jobs depending on one that didn't succeed are skipped.
+
+    :param jobs: Jobs, in the order of the manifest
+    :type jobs: ```list[BatchJob]```
+
+    :param max_workers: Number of worker processes to run independent jobs on. None or 1 runs them in this process.
+    :type max_workers: ```Optional[int]```
+
+    :return: Number of jobs that succeeded, failed, and were skipped
+    :rtype: ```tuple[int, int, int]```
+    """
+    waiting_on = list(map(set, job_dependencies(jobs)))  # type: list[set[int]]
+    ready = [i for i, deps in enumerate(waiting_on) if not deps]  # type: list[int]
+    heapify(ready)
+    schedule = jobs, [None] * len(jobs), waiting_on, ready
+    start = perf_counter()  # type: float
+
+    if max_workers is None or max_workers < 2 or len(jobs) < 2:
+        _init_worker(cdd.shared.ir_cache.IR_CACHE_DIR)
+        i = _next_ready(*schedule)  # type: Optional[int]
+        while i is not None:
+            _complete(*schedule, i, *_run_job(jobs[i].argv))
+            i = _next_ready(*schedule)  # type: Optional[int]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(cdd.shared.ir_cache.IR_CACHE_DIR,),
+        ) as executor:
+            running = {}  # type: dict[Future, int]
+            while True:
+                i = _next_ready(*schedule)  # type: Optional[int]
+                while i is not None:
+                    running[executor.submit(_run_job, jobs[i].argv)] = i
+                    i = _next_ready(*schedule)  # type: Optional[int]
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _complete(*schedule, running.pop(future), *future.result())
+
+    succeeded, failed, skipped = map(
+        schedule[1].count, ("succeeded", "failed", "skipped")
+    )
+    print(
+        "{jobs:d} job(s): {succeeded:d} succeeded, {failed:d} failed, {skipped:d} skipped in {seconds:.3f}s".format(
+            jobs=len(jobs),
+            succeeded=succeeded,
+            failed=failed,
+            skipped=skipped,
+            seconds=perf_counter() - start,
+        )
+    )
+    return succeeded, failed, skipped
+
+
+def batch(manifest, jobs=None):
+    """
+    Run the jobs of the manifest, see `load_manifest` and `run_batch`
+
+    :param manifest: Path of the manifest, in JSON or YAML
+    :type manifest: ```str```
+
+    :param jobs: Number of worker processes to run independent jobs on. None or 1 runs them in this process.
+    :type jobs: ```Optional[int]```
+
+    :return: Number of jobs that succeeded, failed, and were skipped
+    :rtype: ```tuple[int, int, int]```
+    """
+    return run_batch(load_manifest(manifest), max_workers=jobs)
+
+
+__all__ = [
+    "BatchJob",
+    "JOB_PATHS",
+    "batch",
+    "batch_job",
+    "job_dependencies",
+    "load_manifest",
+    "run_batch",
+]  # type: list[str]
@@ -3,17 +3,31 @@ Helper to traverse the AST of the input file, extract the docstring out, parse a
 """
 
 from ast import Module, fix_missing_locations
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from functools import partial
+from glob import glob
+from itertools import chain
 from operator import attrgetter
-from typing import List, NamedTuple
+from os import path, walk
+from time import perf_counter
 
+import cdd.shared.ir_cache
+import cdd.shared.tracing
 from cdd.compound.doctrans_utils import DocTrans, doctransify_cst, has_type_annotations
 from cdd.shared.ast_utils import cmp_ast
 from cdd.shared.cst import cst_parse
+from cdd.shared.cst_utils import CstIndex
+from cdd.shared.ir_cache import (
+    get_ir_cache_entry,
+    ir_cache_key,
+    set_ir_cache_dir,
+    set_ir_cache_entry,
+)
 from cdd.shared.source_transformer import ast_parse
 
 
-def doctrans(filename, docstring_format, type_annotations, no_word_wrap):
+def doctrans(filename, docstring_format, type_annotations, no_word_wrap, check=False):
     """
     Transform the docstrings found within provided filename to intended docstring_format
 
@@ -28,31 +42,220 @@ def doctrans(filename, docstring_format, type_annotations, no_word_wrap):
 
     :param no_word_wrap: Whether word-wrap is disabled (on emission).
     :type no_word_wrap: ```Optional[Literal[True]]```
+
+    :param check: Only report whether the file would change; don't write it
+    :type check: ```bool```
+
+    :return: Whether the file changed (or, with `check`, would change)
+    :rtype: ```bool```
     """
     with open(filename, "rt") as f:
         original_source: str = f.read()
-    node: Module = ast_parse(original_source, skip_docstring_remit=False)
+    # Files found to conform already are remembered—when a cache directory is set—so not even parsed again
+    conformant_key: str = ir_cache_key(
+        "cdd.compound.doctrans.doctrans",
+        original_source,
+        (docstring_format, type_annotations, no_word_wrap),
+    )
+    if get_ir_cache_entry(conformant_key, False):
+        return False
+    cdd.shared.tracing.count("files parsed")
+    with cdd.shared.tracing.span("parse"):
+        node: Module = ast_parse(original_source, skip_docstring_remit=False)
     original_module: Module = deepcopy(node)
 
-    node: Module = fix_missing_locations(
-        DocTrans(
-            docstring_format=docstring_format,
-            word_wrap=no_word_wrap is None,
-            type_annotations=type_annotations,
-            existing_type_annotations=has_type_annotations(node),
-            whole_ast=original_module,
-        ).visit(node)
-    )
+    with cdd.shared.tracing.span("doctrans.transform"):
+        node: Module = fix_missing_locations(
+            DocTrans(
+                docstring_format=docstring_format,
+                word_wrap=no_word_wrap is None,
+                type_annotations=type_annotations,
+                existing_type_annotations=has_type_annotations(node),
+                whole_ast=original_module,
+            ).visit(node)
+        )
+
+    if cmp_ast(node, original_module):
+        set_ir_cache_entry(conformant_key, True)
+        return False
 
-    if not cmp_ast(node, original_module):
-        cst_list: List[NamedTuple] = list(cst_parse(original_source))
+    with cdd.shared.tracing.span("doctrans.rewrite"):
+        cst_list: CstIndex = CstIndex(cst_parse(original_source))
 
         # Carefully replace only docstrings, function return annotations, assignment and annotation assignments.
         # Maintaining all other existing whitespace, comments, &etc.
         doctransify_cst(cst_list, node)
 
-        with open(filename, "wt") as f:
-            f.write("".join(map(attrgetter("value"), cst_list)))
+        new_source: str = "".join(map(attrgetter("value"), cst_list))
+    if new_source == original_source:
+        set_ir_cache_entry(conformant_key, True)
+        return False
+    if not check:
+        with cdd.shared.tracing.span("write"), open(filename, "wt") as f:
+            f.write(new_source)
+        cdd.shared.tracing.count_write(new_source)
+    return True
+
+
+def doctrans_filenames(filename):
+    """
+    Expand a file, directory, or glob into the Python files to `doctrans`.
+    Directories—including those a glob matches—give their `.py` files, recursively.
+
+    :param filename: File, directory, or glob
+    :type filename: ```str```
+
+    :return: Filenames, in order within each directory and glob; empty when nothing exists there
+    :rtype: ```list[str]```
+    """
+    if path.isfile(filename):
+        return [filename]
+    elif path.isdir(filename):
+        filenames = []  # type: list[str]
+        for dirpath, dirnames, names in walk(filename):
+            dirnames.sort()  # Walk subdirectories in order too
+            filenames += (
+                path.join(dirpath, name)
+                for name in sorted(names)
+                if path.splitext(name)[1] == "{extsep}py".format(extsep=path.extsep)
+            )
+        return filenames
+    return list(
+        chain.from_iterable(
+            map(
+                lambda match: (
+                    doctrans_filenames(match) if path.exists(match) else iter(())
+                ),
+                sorted(glob(filename, recursive=True)),
+            )
+        )
+    )
+
+
+def _doctrans_timed(filename, **doctrans_kwargs):
+    """
+    Internal function to `doctrans` one file for `doctrans_files`, timing it and catching its error
+
+    :param filename: Python file to convert docstrings within
+    :type filename: ```str```
+
+    :param doctrans_kwargs: Keyword arguments to `doctrans`
+    :type doctrans_kwargs: ```dict```
+
+    :return: filename, whether it changed (None on error), seconds taken, error (None on success)
+    :rtype: ```tuple[str, Optional[bool], float, Optional[str]]```
+    """
+    start: float = perf_counter()
+    try:
+        changed, error = doctrans(filename, **doctrans_kwargs), None
+    except Exception as e:
+        changed, error = None, "{type_name}: {e}".format(
+            type_name=type(e).__name__, e=e
+        )
+    return filename, changed, perf_counter() - start, error
+
+
+@cdd.shared.tracing.traced("doctrans")
+def doctrans_files(
+    filenames,
+    docstring_format,
+    type_annotations,
+    no_word_wrap,
+    jobs=None,
+    check=False,
+):
+    """
+    `doctrans` each of the files, maybe on a pool of worker processes, printing a summary line per file as it completes
+
+    :param filenames: Python files to convert docstrings within. Edited in place.
+    :type filenames: ```list[str]```
+
+    :param docstring_format: Format of docstring
+    :type docstring_format: ```Literal['rest', 'numpydoc', 'google']```
+
+    :param type_annotations: True to have type annotations (3.6+), False to place in docstring
+    :type type_annotations: ```bool```
+
+    :param no_word_wrap: Whether word-wrap is disabled (on emission).
+    :type no_word_wrap: ```Optional[Literal[True]]```
+
+    :param jobs: Number of worker processes to convert files on. None or 1 converts them in this process.
+    :type jobs: ```Optional[int]```
+
+    :param check: Only report which files would change; don't write any
+    :type check: ```bool```
+
+    :return: Number of files changed (or, with `check`, that would change), and number that failed
+    :rtype: ```tuple[int, int]```
+    """
+    worker = partial(
+        _doctrans_timed,
+        docstring_format=docstring_format,
+        type_annotations=type_annotations,
+        no_word_wrap=no_word_wrap,
+        check=check,
+    )
+    start: float = perf_counter()
+    if jobs is None or jobs < 2 or len(filenames) < 2:
+        changed, failed = _print_doctrans_results(map(worker, filenames), check)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=set_ir_cache_dir,
+            initargs=(cdd.shared.ir_cache.IR_CACHE_DIR,),
+        ) as executor:
+            changed, failed = _print_doctrans_results(
+                executor.map(
+                    worker, filenames, chunksize=max(1, len(filenames) // (jobs * 4))
+                ),
+                check,
+            )
+    print(
+        "{files:d} file(s): {changed:d} {changed_status}, {unchanged:d} unchanged, {failed:d} failed"
+        " in {seconds:.3f}s".format(
+            files=len(filenames),
+            changed=changed,
+            changed_status="would change" if check else "changed",
+            unchanged=len(filenames) - changed - failed,
+            failed=failed,
+            seconds=perf_counter() - start,
+        )
+    )
+    return changed, failed
+
+
+def _print_doctrans_results(results, check):
+    """
+    Internal function to print a summary line per `_doctrans_timed` result, as each completes
+
+    :param results: Results of `_doctrans_timed`
+    :type results: ```Iterable[tuple[str, Optional[bool], float, Optional[str]]]```
+
+    :param check: Whether files were only checked, not written
+    :type check: ```bool```
+
+    :return: Number of files changed (or, with `check`, that would change), and number that failed
+    :rtype: ```tuple[int, int]```
+    """
+    changed = failed = 0
+    for filename, file_changed, seconds, error in results:
+        if error is not None:
+            failed += 1
+            status: str = "failed"
+        elif file_changed:
+            changed += 1
+            status: str = "would change" if check else "changed"
+        else:
+            status: str = "unchanged"
+        print(
+            "{status:<13}{seconds:8.3f}s  {filename}{error}".format(
+                status=status,
+                seconds=seconds,
+                filename=filename,
+                error="" if error is None else "\t{error}".format(error=error),
+            )
+        )
+    return changed, failed
 
 
-__all__ = ["doctrans"]  # type: list[str]
+__all__ = ["doctrans", "doctrans_files", "doctrans_filenames"]  # type: list[str]
@@ -34,7 +34,7 @@ from cdd.shared.ast_utils import (
     to_annotation,
     to_type_comment,
 )
-from cdd.shared.cst_utils import reindent_block_with_pass_body
+from cdd.shared.cst_utils import CstIndex, reindent_block_with_pass_body
 from cdd.shared.docstring_parsers import parse_docstring
 from cdd.shared.pure_utils import (
     PY_GTE_3_8,
@@ -353,42 +353,45 @@ def doctransify_cst(cst_list, node):
     (maintaining all other existing whitespace, comments, &etc.); and only when cdd has changed them
 
     :param cst_list: List of `namedtuple`s with at least ("line_no_start", "line_no_end", "value") attributes
-    :type cst_list: ```list[NamedTuple]```
+    :type cst_list: ```Union[CstIndex, list[NamedTuple]]```
 
     :param node: AST node with a `.body`, probably the `ast.Module`
     :type node: ```AST```
     """
+    cst_index: CstIndex = (
+        cst_list if isinstance(cst_list, CstIndex) else CstIndex(cst_list)
+    )
     for _node in filter(rpartial(hasattr, "_location"), walk(node)):
         is_func: bool = isinstance(_node, (AsyncFunctionDef, FunctionDef))
         if isinstance(_node, ClassDef) or is_func:
             cst_idx, cst_node = cdd.shared.ast_cst_utils.find_cst_at_ast(
-                cst_list, _node
+                cst_index, _node
             )
 
             if cst_node is None:
                 continue
 
             cdd.shared.ast_cst_utils.maybe_replace_doc_str_in_function_or_class(
-                _node, cst_idx, cst_list
+                _node, cst_idx, cst_index
             )
 
             if not is_func:
                 continue
 
             cur_ast_node: AST = ast_parse(
-                reindent_block_with_pass_body(cst_list[cst_idx].value),
+                reindent_block_with_pass_body(cst_index[cst_idx].value),
                 skip_annotate=True,
                 skip_docstring_remit=True,
             ).body[0]
 
             cdd.shared.ast_cst_utils.maybe_replace_function_return_type(
-                _node, cur_ast_node, cst_idx, cst_list
+                _node, cur_ast_node, cst_idx, cst_index
             )
             cdd.shared.ast_cst_utils.maybe_replace_function_args(
-                _node, cur_ast_node, cst_idx, cst_list
+                _node, cur_ast_node, cst_idx, cst_index
             )
             # cdd.shared.ast_cst_utils.maybe_replace_body(
-            #     _node, cur_ast_node, cst_idx, cst_list
+            #     _node, cur_ast_node, cst_idx, cst_index
             # )
 
         # TODO: AnnAssign|Assign
@@ -400,6 +403,9 @@ def doctransify_cst(cst_list, node):
         #     )
         #     print_ast(_node)
 
+    if cst_index is not cst_list:
+        cst_list[:] = cst_index
+
 
 __all__ = [
     "DocTrans",
@@ -14,20 +14,22 @@ from ast import (
     Name,
     Store,
     alias,
-    parse,
 )
-from collections import deque
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial, reduce
+from importlib.util import resolve_name
 from itertools import chain, groupby
-from operator import attrgetter, itemgetter
+from operator import attrgetter, itemgetter, methodcaller
 from os import makedirs, mkdir, path
-from typing import Optional, Tuple, cast
+from typing import Tuple, cast
 
 from setuptools import find_packages
 
 import cdd.class_.parse
 import cdd.compound.exmod_utils
 import cdd.shared.emit.file
+import cdd.shared.tracing
 from cdd.shared.ast_utils import (
     construct_module_with_symbols,
     deduplicate_sorted_imports,
@@ -40,10 +42,9 @@ from cdd.shared.pure_utils import (
     INIT_FILENAME,
     PY_GTE_3_8,
     find_module_filepath,
-    read_file_to_str,
     rpartial,
 )
-from cdd.shared.source_transformer import ast_parse, to_code
+from cdd.shared.source_transformer import ast_parse, ast_parse_file, to_code
 from cdd.sqlalchemy.utils.emit_utils import (
     generate_create_tables_mod,
     mock_engine_base_metadata_str,
@@ -55,6 +56,7 @@ else:
     from typing_extensions import TypedDict
 
 
+@cdd.shared.tracing.traced("exmod")
 def exmod(
     emit_name,
     module,
@@ -70,6 +72,8 @@ def exmod(
     dry_run,
     filesystem_layout="as_input",
     extra_modules_to_all=None,
+    jobs=None,
+    incremental=False,
 ):
     """
     Expose module as `emit` types into `output_directory`
@@ -116,6 +120,13 @@ def exmod(
 
     :param extra_modules_to_all: Internal arg. Prepended to symbol resolver. E.g., `(("ast", {"List"}),)`.
     :type extra_modules_to_all: ```Optional[tuple[tuple[str, frozenset], ...]]```
+
+    :param jobs: Number of worker processes to spread the per-folder work over. None or 1 runs serially.
+    :type jobs: ```Optional[int]```
+
+    :param incremental: Only regenerate outputs whose source changed since the last run, tracked by a manifest in
+      `output_directory`. Outputs of sources that no longer exist are removed. Ignored when `dry_run`.
+    :type incremental: ```bool```
     """
     output_directory = path.realpath(output_directory)
     extra_modules_to_all = (
@@ -123,50 +134,23 @@ def exmod(
         if extra_modules is not None and extra_modules_to_all is None
         else tuple()
     )  # type: tuple[tuple[str, frozenset], ...]
-    if not isinstance(emit_name, str):
-        deque(
-            map(
-                partial(
-                    exmod,
-                    module=module,
-                    blacklist=blacklist,
-                    whitelist=whitelist,
-                    mock_imports=mock_imports,
-                    filesystem_layout=filesystem_layout,
-                    emit_sqlalchemy_submodule=emit_sqlalchemy_submodule,
-                    extra_modules=extra_modules,
-                    no_word_wrap=no_word_wrap,
-                    output_directory=output_directory,
-                    target_module_name=target_module_name,
-                    recursive=recursive,
-                    dry_run=dry_run,
-                    extra_modules_to_all=extra_modules_to_all,
-                ),
-                emit_name or iter(()),
-            ),
-            maxlen=0,
-        )
-    elif dry_run:
+    # Every symbol is discovered & parsed to IR once, then handed to each of these emitters in turn
+    emit_names: Tuple[str, ...] = (
+        (emit_name,) if isinstance(emit_name, str) else tuple(emit_name or iter(()))
+    )
+    emit_name: typing.Union[str, Tuple[str, ...]] = (
+        emit_names[0] if len(emit_names) == 1 else emit_names
+    )
+    if dry_run:
         print(
             "mkdir\t'{output_directory}'".format(
                 output_directory=path.normcase(output_directory)
             ),
-            file=cdd.compound.exmod_utils.EXMOD_OUT_STREAM,
+            file=cdd.compound.exmod_utils._exmod_out_stream(),
         )
     elif not path.isdir(output_directory):
         makedirs(output_directory)
 
-    emit_name: Optional[str] = (
-        emit_name[0]
-        if emit_name is not None
-        and len(emit_name) == 1
-        and isinstance(emit_name, (list, tuple))
-        else emit_name
-    )
-    assert isinstance(
-        emit_name, (str, type(None))
-    ), "Expected `str` got `{emit_name_type!r}`".format(emit_name_type=type(emit_name))
-
     module_root, _, submodule = module.rpartition(".")
     module_name, new_module_name = (
         module,
@@ -183,7 +167,14 @@ def exmod(
     ] = partial(path.join, output_directory, "sqlalchemy_mod")
     sqlalchemy_mod_dir = sqlalchemy_mod_dir_join()
     make_sqlalchemy_mod: bool = (
-        emit_name in frozenset(("sqlalchemy", "sqlalchemy_hybrid", "sqlalchemy_table"))
+        any(
+            map(
+                frozenset(
+                    ("sqlalchemy", "sqlalchemy_hybrid", "sqlalchemy_table")
+                ).__contains__,
+                emit_names,
+            )
+        )
         and emit_sqlalchemy_submodule
         and not path.isdir(sqlalchemy_mod_dir)
     )
@@ -204,6 +195,27 @@ def exmod(
     except AssertionError as e:
         raise ModuleNotFoundError(e)
 
+    manifest = (
+        cdd.compound.exmod_utils.read_exmod_manifest(output_directory)
+        if incremental and not dry_run
+        else None
+    )  # type: Optional[dict]
+    options_digest: str = cdd.compound.exmod_utils.exmod_options_digest(
+        emit_name=emit_name,
+        filesystem_layout=filesystem_layout,
+        mock_imports=mock_imports,
+        new_module_name=new_module_name,
+        no_word_wrap=no_word_wrap,
+        extra_modules_to_all=extra_modules_to_all,
+    )
+    manifest_sources = (
+        None
+        if manifest is None
+        else _previous_manifest_sources(
+            manifest, ",".join(emit_names), options_digest, output_directory
+        )
+    )  # type: Optional[dict]
+
     _exmod_single_folder = partial(
         exmod_single_folder,
         emit_name=emit_name,
@@ -217,6 +229,8 @@ def exmod(
         filesystem_layout=filesystem_layout,
         extra_modules_to_all=extra_modules_to_all,
         first_output_directory=output_directory,
+        manifest_sources=manifest_sources,
+        symbol_table={},
     )
     packages: typing.List[str] = find_packages(
         module_root_dir,
@@ -224,12 +238,15 @@ def exmod(
         exclude=blacklist if blacklist else iter(()),
     )
 
-    _exmod_single_folder(
+    root_sources = _exmod_single_folder(
         module=module,
         module_name=module_name,
         module_root_dir=module_root_dir,
         output_directory=output_directory,
-    )
+    )  # type: Optional[dict]
+    if manifest_sources is not None and root_sources:
+        # So the root is not regenerated again below
+        manifest_sources.update(root_sources)
     output_directory_basename = path.basename(output_directory)
     imports = (
         [output_directory_basename] if make_sqlalchemy_mod else None
@@ -290,18 +307,87 @@ def exmod(
     if make_sqlalchemy_mod:
         _add_imports_to_sqlalchemy_create_all(imports, sqlalchemy_mod_dir_join)
 
-    # This could be executed in parallel for efficiency
-    deque(
-        map(
-            lambda kwargs: _exmod_single_folder(**kwargs),
-            _exmod_single_folder_kwargs,
-        ),
-        maxlen=0,
-    )
+    if jobs is None or jobs < 2 or dry_run or len(_exmod_single_folder_kwargs) < 2:
+        folders_sources = tuple(
+            map(
+                lambda kwargs: _exmod_single_folder(**kwargs),
+                _exmod_single_folder_kwargs,
+            )
+        )  # type: tuple[Optional[dict], ...]
+    else:
+        # Every folder writes to its own output subdirectory; results are awaited in submission order
+        # so that errors surface deterministically. `create_tables.py` was already written above.
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            folders_sources = tuple(
+                map(
+                    methodcaller("result"),
+                    tuple(
+                        map(
+                            lambda kwargs: executor.submit(
+                                _exmod_single_folder, **kwargs
+                            ),
+                            _exmod_single_folder_kwargs,
+                        )
+                    ),
+                )
+            )  # type: tuple[Optional[dict], ...]
+
+    if manifest is not None:
+        sources = reduce(
+            cdd.compound.exmod_utils.merge_exmod_manifest_sources,
+            filter(None, (root_sources,) + folders_sources),
+            {},
+        )  # type: dict[str, dict]
+        cdd.compound.exmod_utils.remove_exmod_outputs(
+            output_directory,
+            stale_sources={
+                source: entry
+                for source, entry in manifest_sources.items()
+                if source not in sources
+            },
+            kept_sources=sources,
+        )
+        manifest[",".join(emit_names)] = {
+            "cdd_version": cdd.__version__,
+            "options": options_digest,
+            "sources": sources,
+        }
+        cdd.compound.exmod_utils.write_exmod_manifest(output_directory, manifest)
 
     return
 
 
+def _previous_manifest_sources(manifest, emit_name, options_digest, output_directory):
+    """
+    Internal function to get the sources recorded by the last `--incremental` run. When the emit options or cdd
+    version differ every output of that run is removed, so that everything is regenerated.
+
+    :param manifest: emit_name to {"cdd_version": str, "options": str, "sources": {source: {"sha256", "outputs"}}}
+    :type manifest: ```dict```
+
+    :param emit_name: Which type(s) to generate, comma-separated.
+    :type emit_name: ```str```
+
+    :param options_digest: Digest of the current emit options, from `exmod_options_digest`
+    :type options_digest: ```str```
+
+    :param output_directory: Where the generated exposed interfaces are placed.
+    :type output_directory: ```str```
+
+    :return: Source to {"sha256": str, "outputs": list[str]} still valid for this run
+    :rtype: ```dict```
+    """
+    previous = manifest.get(emit_name, {})  # type: dict
+    if previous.get("options") == options_digest:
+        return previous["sources"]
+    cdd.compound.exmod_utils.remove_exmod_outputs(
+        output_directory,
+        stale_sources=previous.get("sources", {}),
+        kept_sources={},
+    )
+    return {}
+
+
 def _add_imports_to_sqlalchemy_create_all(imports, sqlalchemy_mod_dir_join):
     """
     Internal function to update the "create_all.py" file in the generated SQLalchemy module.
@@ -430,6 +516,8 @@ def exmod_single_folder(
     new_module_name,
     filesystem_layout,
     extra_modules_to_all,
+    manifest_sources=None,
+    symbol_table=None,
 ):
     """
     Expose module as `emit` types into `output_directory`. Single folder (non-recursive).
@@ -479,6 +567,17 @@ def exmod_single_folder(
 
     :param extra_modules_to_all: Internal arg. Prepended to symbol resolver. E.g., `(("ast", {"List"}),)`.
     :type extra_modules_to_all: ```Optional[tuple[tuple[str, frozenset], ...]]```
+
+    :param manifest_sources: Source to {"sha256": str, "outputs": list[str]} from the last `--incremental` run.
+      None when not incremental.
+    :type manifest_sources: ```Optional[dict]```
+
+    :param symbol_table: Filepath to parsed module accumulator shared across the folders of a run,
+      see `get_module_contents`
+    :type symbol_table: ```Optional[dict[str, tuple[tuple[int, int], Module, dict[str, AST]]]]```
+
+    :return: Source to {"sha256": str, "outputs": list[str]} for this folder when incremental, else None
+    :rtype: ```Optional[dict]```
     """
     mod_path: str = (
         module_name
@@ -495,8 +594,13 @@ def exmod_single_folder(
         )
     )
     if not proceed:
-        return
+        return None
 
+    sources = None if manifest_sources is None else {}  # type: Optional[dict]
+    # Generated files are merged in memory then written once each, rather than reparsed & rewritten per symbol
+    staged_modules = (
+        None if dry_run else OrderedDict()
+    )  # type: Optional[OrderedDict[str, cdd.compound.exmod_utils.StagedModule]]
     _emit_files_from_module_and_return_imports = partial(
         cdd.compound.exmod_utils.emit_files_from_module_and_return_imports,
         new_module_name=new_module_name,
@@ -508,6 +612,10 @@ def exmod_single_folder(
         dry_run=dry_run,
         filesystem_layout=filesystem_layout,
         extra_modules_to_all=extra_modules_to_all,
+        staged_modules=staged_modules,
+        manifest_sources=manifest_sources,
+        sources=sources,
+        symbol_table=symbol_table,
     )
 
     imports = _emit_files_from_module_and_return_imports(
@@ -516,8 +624,9 @@ def exmod_single_folder(
     if not imports:
         # Case: no obvious folder hierarchy, so parse the `__init__` file in root
         top_level_init = path.join(module_root_dir, INIT_FILENAME)
-        with open(top_level_init, "rt") as f:
-            mod: Module = parse(f.read(), filename=top_level_init)
+        mod: Module = ast_parse_file(
+            top_level_init, skip_annotate=True, skip_docstring_remit=True
+        )
 
         # TODO: Optimise these imports
         imports = list(
@@ -545,10 +654,10 @@ def exmod_single_folder(
                                             lambda module_filepath: (
                                                 (module_filepath, import_from.module),
                                                 construct_module_with_symbols(
-                                                    parse(
-                                                        read_file_to_str(
-                                                            module_filepath
-                                                        )
+                                                    ast_parse_file(
+                                                        module_filepath,
+                                                        skip_annotate=True,
+                                                        skip_docstring_remit=True,
                                                     ),
                                                     map(
                                                         attrgetter("name"),
@@ -558,7 +667,13 @@ def exmod_single_folder(
                                             )
                                         )(
                                             find_module_filepath(
-                                                *import_from.module.rsplit(".", 1)
+                                                *resolve_name(
+                                                    "{level}{module}".format(
+                                                        level="." * import_from.level,
+                                                        module=import_from.module or "",
+                                                    ),
+                                                    module,
+                                                ).rsplit(".", 1)
                                             )
                                         )
                                     ),
@@ -573,6 +688,9 @@ def exmod_single_folder(
             )
         )  # type: list[ImportFrom]
 
+    if staged_modules is not None:
+        cdd.compound.exmod_utils.flush_staged_modules(staged_modules)
+
     # assert imports, "Module contents are empty at {!r}".format(module_root_dir)
     modules_names: Tuple[str, ...] = cast(
         Tuple[str, ...],
@@ -611,7 +729,7 @@ def exmod_single_folder(
             "write\t'{init_filepath}'".format(
                 init_filepath=path.normcase(init_filepath)
             ),
-            file=cdd.compound.exmod_utils.EXMOD_OUT_STREAM,
+            file=cdd.compound.exmod_utils._exmod_out_stream(),
         )
     else:
         makedirs(path.dirname(init_filepath), exist_ok=True)
@@ -691,6 +809,7 @@ def exmod_single_folder(
             init_filepath,
             mode="wt",
         )
+    return sources
 
 
 __all__ = ["exmod"]  # type: list[str]
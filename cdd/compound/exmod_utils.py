@@ -3,13 +3,16 @@
 import sys
 from ast import AST, Assign, Expr, ImportFrom, List, Load, Module, Name, Store, alias
 from ast import walk as ast_walk
-from collections import OrderedDict, defaultdict, deque
+from collections import OrderedDict, defaultdict, deque, namedtuple
+from copy import deepcopy
 from functools import partial
+from hashlib import sha256
 from inspect import getfile, ismodule
 from itertools import chain
-from operator import attrgetter, eq
-from os import environ, extsep, makedirs, path
-from typing import Any, Dict, Optional, TextIO, cast
+from json import dump, load
+from operator import attrgetter, eq, itemgetter
+from os import environ, extsep, makedirs, path, remove, stat
+from typing import Any, Dict, Optional, TextIO, Tuple, cast
 
 import cdd.argparse_function.emit
 import cdd.class_
@@ -22,22 +25,70 @@ import cdd.json_schema.emit
 import cdd.pydantic.emit
 import cdd.shared.ast_utils
 import cdd.shared.emit.file
+import cdd.shared.tracing
 import cdd.sqlalchemy.emit
 from cdd.shared.parse.utils.parser_utils import get_parser
 from cdd.shared.pkg_utils import relative_filename
 from cdd.shared.pure_utils import (
     INIT_FILENAME,
-    read_file_to_str,
     rpartial,
     sanitise_emit_name,
 )
-from cdd.shared.source_transformer import ast_parse
-from cdd.tests.mocks import imports_header_ast
+from cdd.shared.source_transformer import ast_parse, ast_parse_file
+from cdd.shared.templates import imports_header_ast
 
-EXMOD_OUT_STREAM: TextIO = getattr(sys, environ.get("EXMOD_OUT_STREAM", "stdout"))
+# Stream exmod prints its plan & progress to. None is `sys.stdout`—or the `sys` stream `$EXMOD_OUT_STREAM` names—looked
+# up at print time, so it follows `redirect_stdout`, e.g., of each request `python -m cdd serve` answers
+EXMOD_OUT_STREAM: Optional[TextIO] = None
 
 
-def get_module_contents(obj, module_root_dir, current_module=None, _result={}):
+def _exmod_out_stream():
+    """
+    Stream for exmod to print to now, see `EXMOD_OUT_STREAM`
+
+    :return: `EXMOD_OUT_STREAM` if set, else the `sys` stream `$EXMOD_OUT_STREAM` names, defaulting to `sys.stdout`
+    :rtype: ```TextIO```
+    """
+    return (
+        getattr(sys, environ.get("EXMOD_OUT_STREAM", "stdout"))
+        if EXMOD_OUT_STREAM is None
+        else EXMOD_OUT_STREAM
+    )
+
+
+# Output module held in memory during an exmod run; `merged` when imports & `__all__` need reconciling on flush
+StagedModule = namedtuple("StagedModule", ("node", "modules_to_all", "merged"))
+
+EXMOD_MANIFEST_FILENAME: str = ".cdd_exmod_manifest{extsep}json".format(extsep=extsep)
+
+
+def _parse_module_file(filepath, symbol_table):
+    """
+    Parse the Python file once per `symbol_table`, reparsing only when its mtime or size changed
+
+    :param filepath: Python source filepath
+    :type filepath: ```str```
+
+    :param symbol_table: Filepath to ((mtime_ns, size), Module, symbol name to top-level node) accumulator
+    :type symbol_table: ```dict[str, tuple[tuple[int, int], Module, dict[str, AST]]]```
+
+    :return: Module and its symbol name to top-level node
+    :rtype: ```tuple[Module, dict[str, AST]]```
+    """
+    stat_result = stat(filepath)
+    mtime_size: Tuple[int, int] = stat_result.st_mtime_ns, stat_result.st_size
+    cached = symbol_table.get(filepath)
+    if cached is None or cached[0] != mtime_size:
+        mod: Module = ast_parse_file(filepath, skip_docstring_remit=True)
+        symbol_table[filepath] = cached = (
+            mtime_size,
+            mod,
+            {node.name: node for node in mod.body if hasattr(node, "name")},
+        )
+    return cached[1:]
+
+
+def get_module_contents(obj, module_root_dir, current_module=None, symbol_table=None):
     """
     Helper function to get the recursive inner module contents
 
@@ -50,24 +101,17 @@ def get_module_contents(obj, module_root_dir, current_module=None, _result={}):
     :param current_module: The current module
     :type current_module: ```Optional[str]```
 
-    :param _result: The result var (used internally as accumulator)
-    :type _result: ```dict```
+    :param symbol_table: Filepath to ((mtime_ns, size), Module, symbol name to top-level node). Share one across
+      calls so that every file is parsed once, however many names are re-exported from it.
+    :type symbol_table: ```Optional[dict[str, tuple[tuple[int, int], Module, dict[str, AST]]]]```
 
     :return: fully-qualified module name to values (could be modules, classes, and whatever other symbols are exposed)
     :rtype: ```Dict[str,Generator[Any]]```
     """
+    symbol_table = {} if symbol_table is None else symbol_table
     module_root_dir_init: str = path.join(module_root_dir, INIT_FILENAME)
-    # process_module_contents = partial(
-    #     _process_module_contents,
-    #     _result=_result,
-    #     current_module=current_module,
-    #     module_root_dir=module_root_dir,
-    # )
     if path.isfile(module_root_dir):
-        with open(module_root_dir, "rt") as f:
-            mod: Module = ast_parse(
-                f.read(), filename=module_root_dir, skip_docstring_remit=True
-            )
+        mod, mod_symbols = _parse_module_file(module_root_dir, symbol_table)
 
         # Bring in imported symbols that should be exposed based on `__all__`
         all_magic_var = next(
@@ -102,41 +146,36 @@ def get_module_contents(obj, module_root_dir, current_module=None, _result={}):
             "{module_name}{submodule_name}.{node_name}".format(
                 module_name="{}.".format(module_name) if module_name else "",
                 submodule_name=submodule_name,
-                node_name=node.name,
+                node_name=node_name,
             ): node
             for module_name, submodule_names in mod_to_symbol.items()
             for submodule_name in submodule_names
-            for node in (
+            for node_name, node in (
                 lambda module_filepath: (
                     iter(())
                     if module_filepath is None
-                    else ast_parse(
-                        read_file_to_str(module_filepath),
-                        module_filepath,
-                        skip_docstring_remit=True,
-                    ).body
+                    else _parse_module_file(module_filepath, symbol_table)[1].items()
                 )
             )(
                 cdd.shared.pure_utils.find_module_filepath(
                     module_name, submodule_name, none_when_no_spec=True
                 )
             )
-            if hasattr(node, "name")
         }
         res.update(
             dict(
                 map(
-                    lambda node: (
+                    lambda name_node: (
                         (
-                            node.name
+                            name_node[0]
                             if current_module is None
                             else "{current_module}.{name}".format(
-                                current_module=current_module, name=node.name
+                                current_module=current_module, name=name_node[0]
                             )
                         ),
-                        node,
+                        name_node[1],
                     ),
-                    filter(lambda node: hasattr(node, "name"), mod.body),
+                    mod_symbols.items(),
                 )
             )
         )
@@ -146,14 +185,14 @@ def get_module_contents(obj, module_root_dir, current_module=None, _result={}):
             obj=obj,
             module_root_dir=module_root_dir_init,
             current_module=current_module,
-            _result=_result,
+            symbol_table=symbol_table,
         )
     # assert not isinstance(
     #     obj, (int, float, complex, str, bool, type(None))
     # ), "module is unexpected type: {!r}".format(type(obj).__name__)
     # for name, symbol in no_magic_or_builtin_dir2attr(obj).items():
     #     process_module_contents(name=name, symbol=symbol)
-    return _result
+    return {}
 
 
 def _process_module_contents(_result, current_module, module_root_dir, name, symbol):
@@ -204,6 +243,7 @@ def emit_file_on_hierarchy(
     first_output_directory,
     no_word_wrap,
     dry_run,
+    staged_modules=None,
 ):
     """
     Generate Java-package—or match input—style file hierarchy from fully-qualified module name
@@ -242,6 +282,10 @@ def emit_file_on_hierarchy(
     :param dry_run: Show what would be created; don't actually write to the filesystem
     :type dry_run: ```bool```
 
+    :param staged_modules: Filename to `StagedModule` accumulator. When given, writes are deferred to
+      `flush_staged_modules` rather than done on every symbol.
+    :type staged_modules: ```Optional[dict[str, StagedModule]]```
+
     :return: (mod_name or None, relative_filename_path, ImportFrom) to generated module
     :rtype: ```Optional[Tuple[Optional[str], str, ImportFrom]]```
     """
@@ -267,17 +311,17 @@ def emit_file_on_hierarchy(
             ()
             if output_dir_is_module
             else (new_module_name, mod_name.replace(".", path.sep))
-        )
+        ),
     )
     # print("mkdir\t{mod_path!r}".format(mod_path=mod_path), file=EXMOD_OUT_STREAM)
     if not path.isdir(mod_path):
         if dry_run:
             print(
                 "mkdir\t'{mod_path}'".format(mod_path=path.normcase(mod_path)),
-                file=EXMOD_OUT_STREAM,
+                file=_exmod_out_stream(),
             )
         else:
-            makedirs(mod_path)
+            makedirs(mod_path, exist_ok=True)
 
     init_filepath: str = path.join(path.dirname(mod_path), INIT_FILENAME)
     if dry_run:
@@ -285,7 +329,7 @@ def emit_file_on_hierarchy(
             "touch\t'{init_filepath}'".format(
                 init_filepath=path.normcase(init_filepath)
             ),
-            file=EXMOD_OUT_STREAM,
+            file=_exmod_out_stream(),
         )
     else:
         open(init_filepath, "a").close()
@@ -295,7 +339,7 @@ def emit_file_on_hierarchy(
             partial(
                 path.join,
                 output_directory,
-                *() if output_dir_is_module else (new_module_name,)
+                *() if output_dir_is_module else (new_module_name,),
             ),
             (
                 relative_filename_path,
@@ -314,15 +358,23 @@ def emit_file_on_hierarchy(
             ),
         )
     )
-    symbol_in_file: bool = path.isfile(emit_filename)
+    staged_module: Optional[StagedModule] = (
+        None if staged_modules is None else staged_modules.get(emit_filename)
+    )
+    symbol_in_file: bool = staged_module is not None or path.isfile(emit_filename)
     isfile_emit_filename: bool = symbol_in_file
     existent_mod: Optional[Module] = None
     if isfile_emit_filename:
-        with open(emit_filename, "rt") as f:
-            emit_filename_contents: str = f.read()
-        existent_mod: Module = ast_parse(
-            emit_filename_contents, skip_docstring_remit=True, filename=emit_filename
-        )  # Also, useful as this catches syntax errors
+        if staged_module is None:
+            with open(emit_filename, "rt") as f:
+                emit_filename_contents: str = f.read()
+            existent_mod: Module = ast_parse(
+                emit_filename_contents,
+                skip_docstring_remit=True,
+                filename=emit_filename,
+            )  # Also, useful as this catches syntax errors
+        else:
+            existent_mod: Module = staged_module.node
         symbol_in_file: bool = any(
             filter(
                 partial(eq, name),
@@ -340,10 +392,10 @@ def emit_file_on_hierarchy(
                     "mkdir\t'{emit_filename_dir}'".format(
                         emit_filename_dir=path.normcase(emit_filename_dir)
                     ),
-                    file=EXMOD_OUT_STREAM,
+                    file=_exmod_out_stream(),
                 )
                 if dry_run
-                else makedirs(emit_filename_dir)
+                else makedirs(emit_filename_dir, exist_ok=True)
             )
 
     if not symbol_in_file and (ir.get("name") or ir["params"] or ir["returns"]):
@@ -362,6 +414,7 @@ def emit_file_on_hierarchy(
             no_word_wrap=no_word_wrap,
             first_output_directory=first_output_directory,
             dry_run=dry_run,
+            staged_modules=staged_modules,
         )
 
     # return (
@@ -398,6 +451,7 @@ def _emit_symbol(
     no_word_wrap,
     first_output_directory,
     dry_run,
+    staged_modules=None,
 ):
     """
     Emit symbol to file (or dry-run just print)
@@ -453,9 +507,14 @@ def _emit_symbol(
     :param dry_run: Show what would be created; don't actually write to the filesystem
     :type dry_run: ```bool```
 
+    :param staged_modules: Filename to `StagedModule` accumulator. When given, writes are deferred to
+      `flush_staged_modules` rather than done on every symbol.
+    :type staged_modules: ```Optional[dict[str, StagedModule]]```
+
     :return: Import to generated module
     :rtype: ```ImportFrom```
     """
+    cdd.shared.tracing.count("symbols emitted")
     emitter = (
         lambda sanitised_emit_name: getattr(
             getattr(
@@ -486,8 +545,8 @@ def _emit_symbol(
                     }.get(emit_name, emit_name)
                 ): name
             },
-            **{"function_type": "static"} if emit_name == "function" else {}
-        )
+            **{"function_type": "static"} if emit_name == "function" else {},
+        ),
     )
     modules_to_all = (extra_modules_to_all or tuple()) + (
         cdd.shared.ast_utils.DEFAULT_MODULES_TO_ALL_SQL_FIRST
@@ -504,7 +563,7 @@ def _emit_symbol(
         ),
         expr=None,
         lineno=None,
-        **cdd.shared.ast_utils.maybe_type_comment
+        **cdd.shared.ast_utils.maybe_type_comment,
     )
     if not isinstance(gen_node, Module):
         gen_node: Module = Module(
@@ -543,67 +602,121 @@ def _emit_symbol(
     if isfile_emit_filename:
         if existent_mod is not None:
             gen_node: Module = cdd.shared.ast_utils.merge_modules(
-                cast(Module, existent_mod), gen_node
-            )
-            inferred_imports = cdd.shared.ast_utils.infer_imports(
-                gen_node, modules_to_all=modules_to_all
+                cast(Module, existent_mod),
+                gen_node,
+                inplace=staged_modules is not None,
             )
-            if inferred_imports:
-                gen_node.body = list(
-                    chain.from_iterable(
-                        ((gen_node.body[0],), inferred_imports, gen_node.body[1:])
-                    )
-                )
-                gen_node = cdd.shared.ast_utils.deduplicate_sorted_imports(gen_node)
-        cdd.shared.ast_utils.merge_assignment_lists(gen_node, "__all__")
+            if staged_modules is None:
+                gen_node: Module = _prepend_inferred_imports(gen_node, modules_to_all)
+        if staged_modules is None:
+            cdd.shared.ast_utils.merge_assignment_lists(gen_node, "__all__")
     if dry_run:
         print(
             "write\t{emit_filename!r}".format(emit_filename=emit_filename),
-            file=EXMOD_OUT_STREAM,
+            file=_exmod_out_stream(),
         )
-    else:
+    elif staged_modules is None:
         cdd.shared.emit.file.file(gen_node, filename=emit_filename, mode="wt")
-    if name != "__init__" and not path.isfile(init_filepath):
+    else:
+        staged_modules[emit_filename] = StagedModule(
+            node=gen_node, modules_to_all=modules_to_all, merged=isfile_emit_filename
+        )
+    if (
+        name != "__init__"
+        and (staged_modules is None or init_filepath not in staged_modules)
+        and not path.isfile(init_filepath)
+    ):
         if dry_run:
             print(
                 "write\t{emit_filename!r}".format(emit_filename=emit_filename),
-                file=EXMOD_OUT_STREAM,
+                file=_exmod_out_stream(),
             )
         else:
             module = path.splitext(
                 emit_filename[len(path.dirname(first_output_directory)) + 1 :]
             )[0].replace(path.sep, ".")
-            cdd.shared.emit.file.file(
-                Module(
-                    body=[
-                        Expr(
-                            cdd.shared.ast_utils.set_value(
-                                "\n__init__ to expose internals of this module\n"
-                            ),
-                            lineno=None,
-                            col_offset=None,
-                        ),
-                        ImportFrom(
-                            module=module,
-                            names=[
-                                alias(
-                                    name=name,
-                                    asname=None,
-                                    identifier=None,
-                                    identifier_name=None,
-                                ),
-                            ],
-                            level=0,
-                            identifier=None,
+            init_mod: Module = Module(
+                body=[
+                    Expr(
+                        cdd.shared.ast_utils.set_value(
+                            "\n__init__ to expose internals of this module\n"
                         ),
-                        __all___node,
-                    ],
-                    stmt=None,
-                    type_ignores=[],
-                ),
-                filename=init_filepath,
-                mode="wt",
+                        lineno=None,
+                        col_offset=None,
+                    ),
+                    ImportFrom(
+                        module=module,
+                        names=[
+                            alias(
+                                name=name,
+                                asname=None,
+                                identifier=None,
+                                identifier_name=None,
+                            ),
+                        ],
+                        level=0,
+                        identifier=None,
+                    ),
+                    __all___node,
+                ],
+                stmt=None,
+                type_ignores=[],
             )
+            if staged_modules is None:
+                cdd.shared.emit.file.file(init_mod, filename=init_filepath, mode="wt")
+            else:
+                staged_modules[init_filepath] = StagedModule(
+                    node=init_mod, modules_to_all=modules_to_all, merged=False
+                )
+
+
+def _prepend_inferred_imports(module, modules_to_all):
+    """
+    Infer the imports `module` needs, place them after its docstring, and deduplicate the import block
+
+    :param module: Module whose first statement is its docstring
+    :type module: ```Module```
+
+    :param modules_to_all: Tuple of module_name to __all__ of module; (str) to FrozenSet[str]
+    :type modules_to_all: ```tuple[tuple[str, frozenset], ...]```
+
+    :return: `module` with inferred imports
+    :rtype: ```Module```
+    """
+    inferred_imports = cdd.shared.ast_utils.infer_imports(
+        module, modules_to_all=modules_to_all
+    )
+    if inferred_imports:
+        module.body = list(
+            chain.from_iterable(((module.body[0],), inferred_imports, module.body[1:]))
+        )
+        module = cdd.shared.ast_utils.deduplicate_sorted_imports(module)
+    return module
+
+
+def flush_staged_modules(staged_modules):
+    """
+    Write every staged module to its file; imports are inferred and `__all__` merged once per file
+
+    :param staged_modules: Filename to `StagedModule` accumulator, emptied by this function
+    :type staged_modules: ```dict[str, StagedModule]```
+    """
+
+    def _flush_staged_module(filename_staged_module):
+        """
+        :param filename_staged_module: Filename and its staged module
+        :type filename_staged_module: ```tuple[str, StagedModule]```
+        """
+        filename, staged_module = filename_staged_module
+        node: Module = staged_module.node
+        if staged_module.merged:
+            node: Module = _prepend_inferred_imports(node, staged_module.modules_to_all)
+            cdd.shared.ast_utils.merge_assignment_lists(node, "__all__")
+        cdd.shared.emit.file.file(node, filename=filename, mode="wt")
+
+    with cdd.shared.tracing.span("exmod.flush"):
+        deque(map(_flush_staged_module, staged_modules.items()), maxlen=0)
+    staged_modules.clear()
 
 
 def emit_files_from_module_and_return_imports(
@@ -619,10 +732,15 @@ def emit_files_from_module_and_return_imports(
     dry_run,
     filesystem_layout,
     extra_modules_to_all,
+    staged_modules=None,
+    manifest_sources=None,
+    sources=None,
+    symbol_table=None,
 ):
     """
     Emit type `emit_name` of all files in `module_root_dir` into `output_directory`
     on `new_module_name` hierarchy. Then return the new imports.
+    Each symbol is parsed to IR once, then emitted as every one of `emit_name` in order.
 
     :param module_name: Name of existing module
     :type module_name: ```str```
@@ -661,12 +779,28 @@ def emit_files_from_module_and_return_imports(
     :param extra_modules_to_all: Internal arg. Prepended to symbol resolver. E.g., `(("ast", {"List"}),)`.
     :type extra_modules_to_all: ```Optional[tuple[tuple[str, frozenset], ...]]```
 
+    :param staged_modules: Filename to `StagedModule` accumulator. When given, writes are deferred to
+      `flush_staged_modules` rather than done on every symbol.
+    :type staged_modules: ```Optional[dict[str, StagedModule]]```
+
+    :param manifest_sources: Source to {"sha256": str, "outputs": list[str]} from the last `--incremental` run.
+      Symbols whose source is unchanged—and whose outputs exist—are skipped. Requires `staged_modules`.
+    :type manifest_sources: ```Optional[dict]```
+
+    :param sources: Source to {"sha256": str, "outputs": list[str]} accumulator for this `--incremental` run
+    :type sources: ```Optional[dict]```
+
+    :param symbol_table: Filepath to parsed module accumulator, see `get_module_contents`
+    :type symbol_table: ```Optional[dict[str, tuple[tuple[int, int], Module, dict[str, AST]]]]```
+
     :return: List of (mod_name or None, relative_filename_path, ImportFrom) to generated module(s)
     :rtype: ```list[Tuple[Optional[str], str, ImportFrom]]```
     """
+    emit_names: Tuple[str, ...] = (
+        (emit_name,) if isinstance(emit_name, str) else tuple(emit_name)
+    )
     _emit_file_on_hierarchy = partial(
         emit_file_on_hierarchy,
-        emit_name=emit_name,
         module_name=module_name,
         new_module_name=new_module_name,
         mock_imports=mock_imports,
@@ -676,68 +810,392 @@ def emit_files_from_module_and_return_imports(
         extra_modules_to_all=extra_modules_to_all,
         no_word_wrap=no_word_wrap,
         dry_run=dry_run,
+        staged_modules=staged_modules,
     )
 
     # Might need some `groupby` in case multiple files are in the one project; same for `get_module_contents`
-    return list(
-        filter(
-            None,
-            map(
-                _emit_file_on_hierarchy,
-                map(
-                    lambda name_source: (
-                        name_source[0],
-                        (
-                            path.join(output_directory, path.basename(module_root_dir))
-                            if path.isfile(module_root_dir)
-                            else (
-                                lambda filename: (
-                                    filename[len(module_name) + 1 :]
-                                    if filename.startswith(module_name)
-                                    else filename
-                                )
-                            )(
-                                relative_filename(
-                                    name_source[1].__file__
-                                    if hasattr(name_source[1], "__file__")
-                                    else getfile(name_source[1])
-                                )
-                            )
+    def emit_module_contents(module_contents):
+        """
+        :param module_contents: (name, node) pairs from `get_module_contents`
+        :type module_contents: ```Iterable[tuple[str, AST]]```
+
+        :return: List of (mod_name or None, relative_filename_path, ImportFrom) to generated module(s)
+        :rtype: ```list[Tuple[Optional[str], str, ImportFrom]]```
+        """
+        return list(
+            filter(
+                None,
+                chain.from_iterable(
+                    map(
+                        lambda name_orig_ir: map(
+                            lambda emit_name_idx: _emit_file_on_hierarchy(
+                                (
+                                    name_orig_ir
+                                    if emit_name_idx[0] == len(emit_names) - 1
+                                    else (
+                                        name_orig_ir[0],
+                                        name_orig_ir[1],
+                                        deepcopy(name_orig_ir[2]),
+                                    )
+                                ),
+                                emit_name=emit_name_idx[1],
+                            ),
+                            enumerate(emit_names),
                         ),
-                        (
-                            {"params": OrderedDict(), "returns": OrderedDict()}
-                            if dry_run
-                            else (
-                                lambda parser: (
-                                    partial(parser, merge_inner_function="__init__")
-                                    if parser is cdd.class_.parse.class_
-                                    else parser
-                                )
-                            )(get_parser(name_source[1], "infer"))(name_source[1])
+                        map(
+                            lambda name_source: (
+                                name_source[0],
+                                (
+                                    path.join(
+                                        output_directory, path.basename(module_root_dir)
+                                    )
+                                    if path.isfile(module_root_dir)
+                                    else (
+                                        lambda filename: (
+                                            filename[len(module_name) + 1 :]
+                                            if filename.startswith(module_name)
+                                            else filename
+                                        )
+                                    )(
+                                        relative_filename(
+                                            name_source[1].__file__
+                                            if hasattr(name_source[1], "__file__")
+                                            else getfile(name_source[1])
+                                        )
+                                    )
+                                ),
+                                (
+                                    {"params": OrderedDict(), "returns": OrderedDict()}
+                                    if dry_run
+                                    else (
+                                        lambda parser: (
+                                            partial(
+                                                parser, merge_inner_function="__init__"
+                                            )
+                                            if parser is cdd.class_.parse.class_
+                                            else parser
+                                        )
+                                    )(get_parser(name_source[1], "infer"))(
+                                        name_source[1]
+                                    )
+                                ),
+                            ),
+                            map(
+                                lambda name_source: (
+                                    (
+                                        name_source[0][len(module_name) + 1 :]
+                                        if name_source[0].startswith(module_name)
+                                        else name_source[0]
+                                    ),
+                                    name_source[1],
+                                ),
+                                module_contents,
+                            ),
                         ),
                     ),
+                ),
+            )
+        )
+
+    with cdd.shared.tracing.span("exmod.discover"):
+        module_contents = get_module_contents(
+            module, module_root_dir=module_root_dir, symbol_table=symbol_table
+        ).items()
+    with cdd.shared.tracing.span("exmod.emit"):
+        return (
+            emit_module_contents(module_contents)
+            if sources is None
+            else _emit_module_contents_incrementally(
+                emit_module_contents,
+                module_contents,
+                manifest_sources=manifest_sources,
+                sources=sources,
+                staged_modules=staged_modules,
+                output_directory=first_output_directory,
+            )
+        )
+
+
+def _emit_module_contents_incrementally(
+    emit_module_contents,
+    module_contents,
+    manifest_sources,
+    sources,
+    staged_modules,
+    output_directory,
+):
+    """
+    Emit module contents grouped by the source file of each symbol, skipping sources unchanged since the last
+    `--incremental` run. Previous outputs of a changed source are removed first, so changed and removed symbols
+    are regenerated rather than kept.
+
+    :param emit_module_contents: Emits (name, node) pairs, returning their imports
+    :type emit_module_contents: ```Callable[[Iterable[tuple[str, AST]]], list]```
+
+    :param module_contents: (name, node) pairs from `get_module_contents`
+    :type module_contents: ```Iterable[tuple[str, AST]]```
+
+    :param manifest_sources: Source to {"sha256": str, "outputs": list[str]} from the last run
+    :type manifest_sources: ```dict```
+
+    :param sources: Source to {"sha256": str, "outputs": list[str]} accumulator for this run
+    :type sources: ```dict```
+
+    :param staged_modules: Filename to `StagedModule` accumulator; its new keys are the outputs of a source
+    :type staged_modules: ```dict[str, StagedModule]```
+
+    :param output_directory: Initial output directory (e.g., direct from `--output-directory`)
+    :type output_directory: ```str```
+
+    :return: List of (mod_name or None, relative_filename_path, ImportFrom) to generated module(s)
+    :rtype: ```list[Tuple[Optional[str], str, ImportFrom]]```
+    """
+    source_to_contents = OrderedDict()  # type: OrderedDict[str, list[tuple[str, AST]]]
+    deque(
+        map(
+            lambda name_node: source_to_contents.setdefault(
+                name_node[1].__file__, []
+            ).append(name_node),
+            module_contents,
+        ),
+        maxlen=0,
+    )
+
+    def _emit_source(source_contents):
+        """
+        :param source_contents: Source filepath and its (name, node) pairs
+        :type source_contents: ```tuple[str, list[tuple[str, AST]]]```
+
+        :return: List of (mod_name or None, relative_filename_path, ImportFrom) to generated module(s)
+        :rtype: ```list[Tuple[Optional[str], str, ImportFrom]]```
+        """
+        source, contents = source_contents
+        previous: Optional[dict] = manifest_sources.get(source)
+        if source in sources:
+            if sources[source] is previous:
+                return []
+        elif (
+            previous is not None
+            and previous["sha256"] == exmod_source_digest(source)
+            and all(
+                map(
+                    path.isfile,
+                    map(partial(path.join, output_directory), previous["outputs"]),
+                )
+            )
+        ):
+            sources[source] = previous
+            return []
+        elif previous is not None:
+            remove_exmod_outputs(
+                output_directory,
+                stale_sources={source: previous},
+                kept_sources={
+                    other_source: entry
+                    for other_source, entry in manifest_sources.items()
+                    if other_source != source
+                },
+            )
+        staged_before = frozenset(staged_modules)
+        imports = emit_module_contents(contents)
+        sources[source] = {
+            "sha256": exmod_source_digest(source),
+            "outputs": sorted(
+                frozenset(sources.get(source, {}).get("outputs", iter(()))).union(
                     map(
-                        lambda name_source: (
-                            (
-                                name_source[0][len(module_name) + 1 :]
-                                if name_source[0].startswith(module_name)
-                                else name_source[0]
-                            ),
-                            name_source[1],
-                        ),
-                        get_module_contents(
-                            module, module_root_dir=module_root_dir
-                        ).items(),
+                        rpartial(path.relpath, output_directory),
+                        frozenset(staged_modules) - staged_before,
+                    )
+                )
+            ),
+        }
+        return imports
+
+    return list(chain.from_iterable(map(_emit_source, source_to_contents.items())))
+
+
+def exmod_options_digest(
+    emit_name,
+    filesystem_layout,
+    mock_imports,
+    new_module_name,
+    no_word_wrap,
+    extra_modules_to_all,
+):
+    """
+    Digest of the options—and cdd version—that determine what exmod emits, for `--incremental` reruns
+
+    :param emit_name: Which type to generate.
+    :type emit_name: ```Literal["argparse", "class", "function", "json_schema",
+                                "pydantic", "sqlalchemy", "sqlalchemy_table", "sqlalchemy_hybrid"]```
+
+    :param filesystem_layout: Hierarchy of folder and file names generated. "java" is file per package per name.
+    :type filesystem_layout: ```Literal["java", "as_input"]```
+
+    :param mock_imports: Whether to generate mock TensorFlow imports
+    :type mock_imports: ```bool```
+
+    :param new_module_name: Name of [new] module
+    :type new_module_name: ```str```
+
+    :param no_word_wrap: Whether word-wrap is disabled (on emission).
+    :type no_word_wrap: ```Optional[Literal[True]]```
+
+    :param extra_modules_to_all: Internal arg. Prepended to symbol resolver. E.g., `(("ast", {"List"}),)`.
+    :type extra_modules_to_all: ```Optional[tuple[tuple[str, frozenset], ...]]```
+
+    :return: Hex digest
+    :rtype: ```str```
+    """
+    return sha256(
+        repr(
+            (
+                cdd.__version__,
+                emit_name,
+                filesystem_layout,
+                bool(mock_imports),
+                new_module_name,
+                no_word_wrap is None,
+                tuple(
+                    map(
+                        lambda module_all: (module_all[0], sorted(module_all[1])),
+                        extra_modules_to_all or iter(()),
+                    )
+                ),
+            )
+        ).encode("utf8")
+    ).hexdigest()
+
+
+def exmod_source_digest(source):
+    """
+    Digest of an exmod source file
+
+    :param source: Python file
+    :type source: ```str```
+
+    :return: Hex digest
+    :rtype: ```str```
+    """
+    with open(source, "rb") as f:
+        return sha256(f.read()).hexdigest()
+
+
+def merge_exmod_manifest_sources(sources, other_sources):
+    """
+    Merge the `--incremental` sources of one folder into those of another; a source re-exported by multiple
+    folders keeps the union of its outputs
+
+    :param sources: Source to {"sha256": str, "outputs": list[str]}. Updated in-place.
+    :type sources: ```dict```
+
+    :param other_sources: Source to {"sha256": str, "outputs": list[str]}
+    :type other_sources: ```dict```
+
+    :return: `sources`
+    :rtype: ```dict```
+    """
+    deque(
+        map(
+            lambda source_entry: sources.__setitem__(
+                source_entry[0],
+                {
+                    "sha256": source_entry[1]["sha256"],
+                    "outputs": sorted(
+                        frozenset(
+                            sources.get(source_entry[0], {}).get("outputs", iter(()))
+                        ).union(source_entry[1]["outputs"])
+                    ),
+                },
+            ),
+            other_sources.items(),
+        ),
+        maxlen=0,
+    )
+    return sources
+
+
+def read_exmod_manifest(output_directory):
+    """
+    Read the `--incremental` manifest of `output_directory`
+
+    :param output_directory: Directory exmod emits into
+    :type output_directory: ```str```
+
+    :return: emit_name to {"cdd_version": str, "options": str, "sources": {source: {"sha256": str, "outputs": list}}}
+    :rtype: ```dict```
+    """
+    manifest_filepath: str = path.join(output_directory, EXMOD_MANIFEST_FILENAME)
+    if not path.isfile(manifest_filepath):
+        return {}
+    with open(manifest_filepath, "rt") as f:
+        return load(f)
+
+
+def write_exmod_manifest(output_directory, manifest):
+    """
+    Write the `--incremental` manifest of `output_directory`
+
+    :param output_directory: Directory exmod emits into
+    :type output_directory: ```str```
+
+    :param manifest: emit_name to {"cdd_version": str, "options": str, "sources": {source: {"sha256", "outputs"}}}
+    :type manifest: ```dict```
+    """
+    with open(path.join(output_directory, EXMOD_MANIFEST_FILENAME), "wt") as f:
+        dump(manifest, f, indent=2, sort_keys=True)
+
+
+def remove_exmod_outputs(output_directory, stale_sources, kept_sources):
+    """
+    Remove the outputs of `stale_sources` that no source in `kept_sources` also produced
+
+    :param output_directory: Directory exmod emits into; outputs are relative to this
+    :type output_directory: ```str```
+
+    :param stale_sources: Source to {"sha256": str, "outputs": list[str]} whose outputs are no longer valid
+    :type stale_sources: ```dict```
+
+    :param kept_sources: Source to {"sha256": str, "outputs": list[str]} whose outputs must be kept
+    :type kept_sources: ```dict```
+    """
+    kept_outputs = frozenset(
+        chain.from_iterable(map(itemgetter("outputs"), kept_sources.values()))
+    )
+    deque(
+        map(
+            remove,
+            filter(
+                path.isfile,
+                map(
+                    partial(path.join, output_directory),
+                    sorted(
+                        frozenset(
+                            chain.from_iterable(
+                                map(itemgetter("outputs"), stale_sources.values())
+                            )
+                        )
+                        - kept_outputs
                     ),
                 ),
             ),
-        )
+        ),
+        maxlen=0,
     )
 
 
 __all__ = [
+    "EXMOD_MANIFEST_FILENAME",
+    "StagedModule",
     "_emit_symbol",
     "emit_file_on_hierarchy",
     "emit_files_from_module_and_return_imports",
+    "exmod_options_digest",
+    "exmod_source_digest",
+    "flush_staged_modules",
     "get_module_contents",
+    "merge_exmod_manifest_sources",
+    "read_exmod_manifest",
+    "remove_exmod_outputs",
+    "write_exmod_manifest",
 ]  # type: list[str]
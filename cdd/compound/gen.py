@@ -13,10 +13,12 @@ from typing import Union
 import cdd.compound.openapi.utils.emit_utils
 import cdd.json_schema.emit
 import cdd.shared.parse.utils.parser_utils
+import cdd.shared.tracing
 import cdd.sqlalchemy.utils.emit_utils
 from cdd.compound.gen_utils import (
     file_to_input_mapping,
     gen_file,
+    gen_sqlalchemy_files,
     get_emit_kwarg,
     get_input_mapping_from_path,
     get_parser,
@@ -27,6 +29,7 @@ from cdd.shared.pure_utils import get_module, sanitise_emit_name
 from cdd.shared.source_transformer import to_code
 
 
+@cdd.shared.tracing.traced("gen")
 def gen(
     name_tpl,
     input_mapping,
@@ -59,7 +62,8 @@ def gen(
     :type emit_name: ```Literal["argparse", "class", "function", "json_schema",
                                 "pydantic", "sqlalchemy", "sqlalchemy_table", "sqlalchemy_hybrid"]```
 
-    :param output_filename: Output file to write to
+    :param output_filename: Output file to write to. For SQLalchemy, an existing directory instead writes a file per
+      model there, with their imports & foreign keys resolved in memory—so phases 1 & 2 aren't needed.
     :type output_filename: ```str```
 
     :param prepend: Prepend file with this. Use '\n' for newlines.
@@ -88,9 +92,10 @@ def gen(
     :type no_word_wrap: ```Optional[Literal[True]]```
     """
     extra_symbols = {}
-    if phase > 0 and emit_name in frozenset(
+    sqlalchemy_emit_names = frozenset(
         ("sqlalchemy", "sqlalchemy_hybrid", "sqlalchemy_table")
-    ):
+    )  # type: frozenset[str]
+    if phase > 0 and emit_name in sqlalchemy_emit_names:
         if phase == 1:
             return cdd.sqlalchemy.utils.emit_utils.update_with_imports_from_columns(
                 output_filename
@@ -182,67 +187,73 @@ def gen(
     module_path, _, symbol_name = input_mapping.rpartition(".")
 
     emit_name: str = sanitise_emit_name(emit_name)
-    if path.isfile(input_mapping):
-        input_mapping = file_to_input_mapping(input_mapping, parse_name)
-    elif path.isdir(input_mapping):
-        _input_mapping = {}
-        deque(
-            map(
-                _input_mapping.update,
+    with cdd.shared.tracing.span("gen.discover"):
+        if path.isfile(input_mapping):
+            input_mapping = file_to_input_mapping(input_mapping, parse_name)
+        elif path.isdir(input_mapping):
+            _input_mapping = {}
+            deque(
                 map(
-                    partial(
-                        file_to_input_mapping,
-                        parse_name=parse_name,
+                    _input_mapping.update,
+                    map(
+                        partial(
+                            file_to_input_mapping,
+                            parse_name=parse_name,
+                        ),
+                        map(partial(path.join, input_mapping), listdir(input_mapping)),
                     ),
-                    map(partial(path.join, input_mapping), listdir(input_mapping)),
                 ),
-            ),
-            maxlen=0,
-        )
-        input_mapping = _input_mapping
-        del _input_mapping
-    else:
-        input_mod = get_module(module_path, extra_symbols=extra_symbols)
-        input_mapping = (
-            getattr(input_mod, symbol_name)
-            if hasattr(input_mod, symbol_name)
-            else get_input_mapping_from_path(emit_name, module_path, symbol_name)
-        )
-    input_mapping_it = (
-        input_mapping.items() if hasattr(input_mapping, "items") else input_mapping
-    )
-
-    return (
-        cdd.json_schema.emit.json_schema_file(
-            {
-                name: get_emitter(emit_name)(
-                    get_parser(node, parse_name)(node),
-                    emit_default_doc=emit_default_doc,
-                    word_wrap=no_word_wrap is None,
-                    **get_emit_kwarg(
-                        decorator_list, emit_call, emit_name, name_tpl, name
-                    ),
-                )
-                for name, node in input_mapping_it
-            },
-            output_filename,
+                maxlen=0,
+            )
+            input_mapping = _input_mapping
+            del _input_mapping
+        else:
+            input_mod = get_module(module_path, extra_symbols=extra_symbols)
+            input_mapping = (
+                getattr(input_mod, symbol_name)
+                if hasattr(input_mod, symbol_name)
+                else get_input_mapping_from_path(emit_name, module_path, symbol_name)
+            )
+        input_mapping_it = (
+            input_mapping.items() if hasattr(input_mapping, "items") else input_mapping
         )
-        if emit_name == "json_schema"
-        else gen_file(
-            name_tpl,
-            input_mapping_it,
-            parse_name,
-            emit_name,
-            output_filename,
-            prepend,
-            emit_call,
-            emit_and_infer_imports,
-            emit_default_doc,
-            decorator_list,
-            no_word_wrap,
-            imports,
+
+    with cdd.shared.tracing.span("gen.emit"):
+        return (
+            cdd.json_schema.emit.json_schema_file(
+                {
+                    name: get_emitter(emit_name)(
+                        get_parser(node, parse_name)(node),
+                        emit_default_doc=emit_default_doc,
+                        word_wrap=no_word_wrap is None,
+                        **get_emit_kwarg(
+                            decorator_list, emit_call, emit_name, name_tpl, name
+                        ),
+                    )
+                    for name, node in input_mapping_it
+                },
+                output_filename,
+            )
+            if emit_name == "json_schema"
+            else (
+                gen_sqlalchemy_files
+                if emit_name in sqlalchemy_emit_names and path.isdir(output_filename)
+                else gen_file
+            )(
+                name_tpl,
+                input_mapping_it,
+                parse_name,
+                emit_name,
+                output_filename,
+                prepend,
+                emit_call,
+                emit_and_infer_imports,
+                emit_default_doc,
+                decorator_list,
+                no_word_wrap,
+                imports,
+            )
         )
-    )
 
 
 __all__ = ["gen"]  # type: list[str]
@@ -3,13 +3,27 @@ Utility functions for `cdd.gen`
 """
 
 import ast
-from ast import Assign, ClassDef, FunctionDef, Import, ImportFrom, Module, Name, Store
+from ast import (
+    Assign,
+    ClassDef,
+    FunctionDef,
+    Import,
+    ImportFrom,
+    List,
+    Load,
+    Module,
+    Name,
+    Store,
+)
+from collections import OrderedDict
 from itertools import chain
 from json import load
 from operator import itemgetter
 from os import path
 from typing import Optional
 
+import cdd.shared.tracing
+import cdd.sqlalchemy.utils.emit_utils
 from cdd.shared.ast_utils import (
     infer_imports,
     maybe_type_comment,
@@ -22,6 +36,7 @@ from cdd.shared.parse.utils.parser_utils import get_parser
 from cdd.shared.pure_utils import (
     ensure_valid_identifier,
     find_module_filepath,
+    namespaced_upper_camelcase_to_pascal,
     pascal_to_upper_camelcase,
     rpartial,
 )
@@ -196,8 +211,123 @@ def gen_file(
             )
         )
     ), "Nothing will be append to {!r}".format(output_filename)
-    with open(output_filename, "a") as f:
-        f.write(to_code(parsed_ast))
+    src: str = to_code(parsed_ast)
+    with cdd.shared.tracing.span("write"), open(output_filename, "a") as f:
+        f.write(src)
+    cdd.shared.tracing.count_write(src)
+
+
+def gen_sqlalchemy_files(
+    name_tpl,
+    input_mapping_it,
+    parse_name,
+    emit_name,
+    output_directory,
+    prepend,
+    emit_call,
+    emit_and_infer_imports,
+    emit_default_doc,
+    decorator_list,
+    no_word_wrap,
+    imports,
+):
+    """
+    Generate a Python file per SQLalchemy model of `input_mapping_it`—named as phase 1 imports them—within
+    `output_directory`. Their imports & foreign keys are resolved in memory, against the symbol table of every model
+    generated, so each file is written once; instead of phases 0, 1, and 2 each rewriting them.
+
+    :param name_tpl: Template for the name, e.g., `{name}Config`.
+    :type name_tpl: ```str```
+
+    :param input_mapping_it: Import location of mapping/2-tuple collection.
+    :type input_mapping_it: ```Iterator[tuple[str, AST]]```
+
+    :param parse_name: Which type to parse.
+    :type parse_name: ```Literal["argparse", "class", "function", "json_schema",
+                                 "pydantic", "sqlalchemy", "sqlalchemy_table", "sqlalchemy_hybrid"]```
+
+    :param emit_name: Which type to generate.
+    :type emit_name: ```Literal["sqlalchemy", "sqlalchemy_table", "sqlalchemy_hybrid"]```
+
+    :param output_directory: Existing directory to write the files to
+    :type output_directory: ```str```
+
+    :param prepend: Prepend file with this. Use '\n' for newlines.
+    :type prepend: ```Optional[str]```
+
+    :param emit_call: Whether to emit a `__call__` method from the `_internal` IR subdict
+    :type emit_call: ```bool```
+
+    :param emit_and_infer_imports: Whether to emit and infer imports at the top of the generated code
+    :type emit_and_infer_imports: ```bool```
+
+    :param emit_default_doc: Whether help/docstring should include 'With default' text
+    :type emit_default_doc: ```bool```
+
+    :param decorator_list: List of decorators
+    :type decorator_list: ```Optional[Union[List[str], List[]]]```
+
+    :param no_word_wrap: Whether word-wrap is disabled (on emission).
+    :type no_word_wrap: ```Optional[Literal[True]]```
+
+    :param imports: Import to preclude in Python file
+    :type imports: ```str```
+
+    :return: Filenames written
+    :rtype: ```list[str]```
+    """
+    filename_to_module = OrderedDict()  # type: OrderedDict[str, Module]
+    for name, obj in input_mapping_it:
+        global__all__ = []  # type: list[str]
+        functions_and_classes = get_functions_and_classes(
+            decorator_list,
+            emit_call,
+            emit_default_doc,
+            emit_name,
+            global__all__,
+            ((name, obj),),
+            name_tpl,
+            no_word_wrap,
+            parse_name,
+        )  # type: tuple[Union[FunctionDef, ClassDef]]
+        filename: str = path.join(
+            output_directory,
+            "{basename}{extsep}py".format(
+                basename=namespaced_upper_camelcase_to_pascal(
+                    getattr(functions_and_classes[0], "name", global__all__[0])
+                ),
+                extsep=path.extsep,
+            ),
+        )
+        if filename in filename_to_module or path.exists(filename):
+            raise IOError(
+                "File exists and this is a destructive operation. Delete/move {filename!r} then"
+                " rerun.".format(filename=filename)
+            )
+        filename_to_module[filename] = gen_module(
+            decorator_list,
+            emit_and_infer_imports,
+            emit_call,
+            emit_default_doc,
+            emit_name,
+            functions_and_classes,
+            imports,
+            None,
+            name_tpl,
+            no_word_wrap,
+            parse_name,
+            prepend,
+            global__all__=global__all__,
+        )
+
+    for filename, module in cdd.sqlalchemy.utils.emit_utils.update_imports_and_fks(
+        filename_to_module
+    ).items():
+        src: str = to_code(module)
+        with cdd.shared.tracing.span("write"), open(filename, "wt") as f:
+            f.write(src)
+        cdd.shared.tracing.count_write(src)
+    return list(filename_to_module.keys())
 
 
 def gen_module(
@@ -276,17 +406,6 @@ def gen_module(
             no_word_wrap,
             parse_name,
         )  # type: tuple[Union[FunctionDef, ClassDef]]
-    if emit_and_infer_imports:
-        imports: str = "{}{}".format(
-            imports or "",
-            " ".join(
-                map(
-                    to_code,
-                    optimise_imports(chain(*map(infer_imports, functions_and_classes))),
-                )
-            ),
-        )
-
     # Too many params! - Clean things up for debugging:
     del (
         decorator_list,
@@ -299,32 +418,43 @@ def gen_module(
         parse_name,
     )
 
-    content: str = "{prepend}{imports}\n{functions_and_classes}\n{__all__}".format(
-        prepend="" if prepend is None else prepend,
-        imports=imports,  # TODO: Optimize imports programmatically (akin to `autoflake --remove-all-unused-imports`)
-        functions_and_classes="\n\n".join(map(to_code, functions_and_classes)),
-        __all__=to_code(
-            Assign(
-                targets=[Name("__all__", Store(), lineno=None, col_offset=None)],
-                value=ast.parse(  # `TypeError: Type List cannot be instantiated; use list() instead`
-                    str(
-                        list(
-                            map(
-                                lambda s: s.rstrip("\n").strip("'").strip('"'),
-                                map(to_code, map(set_value, global__all__)),
-                            )
+    # Assembled from the emitted nodes directly—no `to_code` & `ast.parse` round trip—so only unparsed when written
+    parsed_ast: Module = Module(
+        body=list(
+            chain.from_iterable(
+                (
+                    ast.parse(prepend or "").body,
+                    # TODO: Optimize imports programmatically (akin to `autoflake --remove-all-unused-imports`)
+                    ast.parse(imports or "").body,
+                    (
+                        optimise_imports(
+                            chain(*map(infer_imports, functions_and_classes))
                         )
-                    )
+                        if emit_and_infer_imports
+                        else iter(())
+                    ),
+                    functions_and_classes,
+                    (
+                        Assign(
+                            targets=[
+                                Name("__all__", Store(), lineno=None, col_offset=None)
+                            ],
+                            value=List(
+                                elts=list(map(set_value, global__all__)),
+                                ctx=Load(),
+                                expr=None,
+                            ),
+                            expr=None,
+                            lineno=None,
+                            **maybe_type_comment,
+                        ),
+                    ),
                 )
-                .body[0]
-                .value,
-                expr=None,
-                lineno=None,
-                **maybe_type_comment,
             )
         ),
+        type_ignores=[],
+        stmt=None,
     )
-    parsed_ast: Module = ast.parse(content)
     # TODO: Shebang line first, then docstring, then imports
     doc_str: Optional[str] = ast.get_docstring(parsed_ast, clean=True)
     whole = tuple(
@@ -406,6 +536,7 @@ def get_functions_and_classes(
     return tuple(
         print("\nGenerating: {name!r}".format(name=name))
         or global__all__.append(name_tpl.format(name=name))
+        or cdd.shared.tracing.count("symbols emitted")
         or emitter(
             get_parser(obj, parse_name)(obj),
             emit_default_doc=emit_default_doc,
@@ -469,5 +600,7 @@ __all__ = [
     "get_input_mapping_from_path",
     "get_emit_kwarg",
     "gen_file",
+    "gen_module",
+    "gen_sqlalchemy_files",
     "get_parser",
 ]
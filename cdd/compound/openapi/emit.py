@@ -7,7 +7,7 @@ from collections import deque
 from cdd.compound.openapi.utils.emit_openapi_utils import (
     components_paths_from_name_model_route_id_crud,
 )
-from cdd.tests.mocks.json_schema import server_error_schema
+from cdd.shared.templates import server_error_schema
 
 
 def openapi(name_model_route_id_cruds):
@@ -4,25 +4,153 @@ All encompassing solution to generating the OpenAPI schema
 
 import ast
 from ast import AnnAssign, Assign, Call, ClassDef, FunctionDef, Module
-from itertools import chain, groupby
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import groupby
 from operator import itemgetter
+from time import perf_counter
 
 import cdd.argparse_function.parse
 import cdd.class_.parse
+import cdd.compound.openapi.utils.emit_utils  # Before `cdd.sqlalchemy`, so this imports alone—as workers do
 import cdd.docstring.parse
 import cdd.function.parse
 import cdd.json_schema.emit
 import cdd.routes.parse.bottle
+import cdd.shared.tracing
 import cdd.sqlalchemy.parse
 from cdd.compound.openapi.utils.emit_openapi_utils import OpenAPI_requestBodies
 from cdd.routes.parse.bottle_utils import get_route_meta
 from cdd.shared.ast_utils import get_value
 from cdd.shared.parse.utils.parser_utils import infer
 from cdd.shared.pure_utils import rpartial, update_d
-from cdd.tests.mocks.json_schema import server_error_schema
+from cdd.shared.source_transformer import ast_parse_file
+from cdd.shared.templates import server_error_schema
 
 
-def openapi_bulk(app_name, model_paths, routes_paths):
+def _parse_model(filename):
+    """
+    Internal function to parse the SQLalchemy models out of the file, into their JSON-schema
+
+    :param filename: The filename to open and parse AST out of
+    :type filename: ```str```
+
+    :return: Schema name and its JSON-schema, for each model in the file
+    :rtype: ```list[tuple[str, dict]]```
+    """
+    parsed_ast: Module = ast_parse_file(
+        filename, skip_annotate=True, skip_docstring_remit=True
+    )
+
+    return list(
+        map(
+            lambda table: (
+                table["name"].replace("_tbl", "", 1).title(),
+                cdd.json_schema.emit.json_schema(table),
+            ),
+            map(
+                lambda node: (
+                    cdd.sqlalchemy.parse.sqlalchemy_table(node)
+                    if isinstance(node, (AnnAssign, Assign, Call))
+                    else cdd.sqlalchemy.parse.sqlalchemy(node)
+                ),
+                filter(
+                    lambda node: (infer(node) or "").startswith("sqlalchemy"),
+                    filter(
+                        rpartial(isinstance, (Call, ClassDef)), ast.walk(parsed_ast)
+                    ),
+                ),
+            ),
+        )
+    )
+
+
+def _parse_route(filename, app_name):
+    """
+    Internal function to parse the routes on `app_name` out of the file, into their OpenAPI operation
+
+    :param filename: The filename to open and parse AST out of
+    :type filename: ```str```
+
+    :param app_name: Variable name (Bottle App)
+    :type app_name: ```str```
+
+    :return: Route path, like "/api/foo", and its HTTP method to OpenAPI operation, for each route in the file
+    :rtype: ```list[tuple[str, dict]]```
+    """
+    parsed_ast: Module = ast_parse_file(
+        filename, skip_annotate=True, skip_docstring_remit=True
+    )
+
+    return list(
+        map(
+            lambda route: (
+                get_value(route.decorator_list[0].args[0]),
+                {
+                    route.decorator_list[0].func.attr: cdd.routes.parse.bottle.bottle(
+                        route
+                    )
+                },
+            ),
+            filter(
+                lambda node: next(
+                    get_route_meta(Module(body=[node], type_ignores=[], stmt=None))
+                )[1]
+                == app_name,
+                filter(rpartial(isinstance, FunctionDef), parsed_ast.body),
+            ),
+        )
+    )
+
+
+def _parse_timed(parser, filename):
+    """
+    Internal function to parse one file for `openapi_bulk`, timing it
+
+    :param parser: `_parse_model` or `_parse_route` (with its `app_name` bound)
+    :type parser: ```Callable[[str], list[tuple[str, dict]]]```
+
+    :param filename: The filename to open and parse AST out of
+    :type filename: ```str```
+
+    :return: filename, what `parser` found in it, seconds taken
+    :rtype: ```tuple[str, list[tuple[str, dict]], float]```
+    """
+    start: float = perf_counter()
+    return filename, parser(filename), perf_counter() - start
+
+
+def _parse_files(parser, filenames, executor):
+    """
+    Internal function to parse the files—on the executor when given—in order, tracing each as the phase
+    `"openapi_bulk.parse:<filename>"`
+
+    :param parser: `_parse_model` or `_parse_route` (with its `app_name` bound)
+    :type parser: ```Callable[[str], list[tuple[str, dict]]]```
+
+    :param filenames: The filenames to open and parse AST out of
+    :type filenames: ```list[str]```
+
+    :param executor: Worker pool to parse the files on; None parses them in this process
+    :type executor: ```Optional[ProcessPoolExecutor]```
+
+    :return: What `parser` found in each of the files, concatenated in the order of `filenames`
+    :rtype: ```list[tuple[str, dict]]```
+    """
+    worker = partial(_parse_timed, parser)
+    found = []  # type: list[tuple[str, dict]]
+    for filename, file_found, seconds in (
+        map(worker, filenames) if executor is None else executor.map(worker, filenames)
+    ):
+        cdd.shared.tracing.add_span(
+            "openapi_bulk.parse:{filename}".format(filename=filename), seconds
+        )
+        found += file_found
+    return found
+
+
+@cdd.shared.tracing.traced("openapi_bulk")
+def openapi_bulk(app_name, model_paths, routes_paths, jobs=None):
     """
     Generate OpenAPI from models, routes on app
 
@@ -35,45 +163,27 @@ def openapi_bulk(app_name, model_paths, routes_paths):
     :param routes_paths: The path/module-resolution(s) whence the route(s) can be found
     :type routes_paths: ```list[str]```
 
+    :param jobs: Number of worker processes to parse files on. None or 1 parses them in this process.
+      Either way the output is the same: files are merged in the order given.
+    :type jobs: ```Optional[int]```
+
     :return: OpenAPI dictionary
     :rtype: ```dict```
     """
     request_bodies: OpenAPI_requestBodies = {}
 
-    def parse_model(filename):
-        """
-        :param filename: The filename to open and parse AST out of
-        :type filename: ```str```
-
-        :return: Iterable of tuples of the found kind
-        :rtype: ```Iterable[tuple[AST, ...], ...]```
-        """
-        with open(filename, "rb") as f:
-            parsed_ast: Module = ast.parse(f.read())
-
-        return filter(
-            lambda node: (infer(node) or "").startswith("sqlalchemy"),
-            filter(rpartial(isinstance, (Call, ClassDef)), ast.walk(parsed_ast)),
-        )
-
-    def parse_route(filename):
-        """
-        :param filename: The filename to open and parse AST out of
-        :type filename: ```str```
-
-        :return: Iterable of tuples of the found kind
-        :rtype: ```Iterable[tuple[AST, ...], ...]```
-        """
-        with open(filename, "rb") as f:
-            parsed_ast: Module = ast.parse(f.read())
-
-        return filter(
-            lambda node: next(
-                get_route_meta(Module(body=[node], type_ignores=[], stmt=None))
-            )[1]
-            == app_name,
-            filter(rpartial(isinstance, FunctionDef), parsed_ast.body),
-        )
+    with cdd.shared.tracing.span("openapi_bulk.parse"):
+        if jobs is None or jobs < 2 or len(model_paths) + len(routes_paths) < 2:
+            schemas = _parse_files(_parse_model, model_paths, None)
+            routes = _parse_files(
+                partial(_parse_route, app_name=app_name), routes_paths, None
+            )
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                schemas = _parse_files(_parse_model, model_paths, executor)
+                routes = _parse_files(
+                    partial(_parse_route, app_name=app_name), routes_paths, executor
+                )
 
     def construct_parameters_and_request_bodies(route, path_dict):
         """
@@ -172,23 +282,7 @@ def openapi_bulk(app_name, model_paths, routes_paths):
             "requestBodies": request_bodies,
             "schemas": {
                 key: {k: v for k, v in val.items() if not k.startswith("$")}
-                for key, val in dict(
-                    map(
-                        lambda table: (
-                            table["name"].replace("_tbl", "", 1).title(),
-                            cdd.json_schema.emit.json_schema(table),
-                        ),
-                        map(
-                            lambda node: (
-                                cdd.sqlalchemy.parse.sqlalchemy_table(node)
-                                if isinstance(node, (AnnAssign, Assign, Call))
-                                else cdd.sqlalchemy.parse.sqlalchemy(node)
-                            ),
-                            chain.from_iterable(map(parse_model, model_paths)),
-                        ),
-                    ),
-                    ServerError=server_error_schema,
-                ).items()
+                for key, val in dict(schemas, ServerError=server_error_schema).items()
             },
         },
         "paths": dict(
@@ -196,20 +290,7 @@ def openapi_bulk(app_name, model_paths, routes_paths):
                 lambda k_v: construct_parameters_and_request_bodies(
                     k_v[0], update_d(*map(itemgetter(1), k_v[1]))
                 ),
-                groupby(
-                    map(
-                        lambda route: (
-                            get_value(route.decorator_list[0].args[0]),
-                            {
-                                route.decorator_list[
-                                    0
-                                ].func.attr: cdd.routes.parse.bottle.bottle(route)
-                            },
-                        ),
-                        chain.from_iterable(map(parse_route, routes_paths)),
-                    ),
-                    key=itemgetter(0),
-                ),
+                groupby(routes, key=itemgetter(0)),
             )
         ),
     }
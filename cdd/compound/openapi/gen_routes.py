@@ -9,14 +9,15 @@ from operator import attrgetter, itemgetter
 from os import path
 from typing import Any, Callable, Dict, List, Optional, Union
 
+import cdd.compound.openapi.utils.emit_utils  # Before `cdd.sqlalchemy`, so this imports alone
 import cdd.routes.emit.bottle
 import cdd.sqlalchemy.parse
 from cdd.routes.parse.bottle import methods
 from cdd.shared.ast_utils import get_value
 from cdd.shared.pure_utils import filename_from_mod_or_filename, rpartial
-from cdd.shared.source_transformer import to_code
+from cdd.shared.source_transformer import ast_parse_file, to_code
+from cdd.shared.templates import route_prelude
 from cdd.shared.types import IntermediateRepr
-from cdd.tests.mocks.routes import route_prelude
 
 
 def gen_routes(app, model_path, model_name, crud, route):
@@ -54,8 +55,9 @@ def gen_routes(app, model_path, model_name, crud, route):
     model_path: str = filename_from_mod_or_filename(model_path)
 
     assert path.isfile(model_path)
-    with open(model_path, "rt") as f:
-        mod: Module = ast.parse(f.read())
+    mod: Module = ast_parse_file(
+        model_path, skip_annotate=True, skip_docstring_remit=True
+    )
 
     sqlalchemy_node: Optional[ClassDef] = next(
         filter(
@@ -144,8 +146,9 @@ def upsert_routes(app, routes, routes_path, route, primary_key):
             )
         return
 
-    with open(routes_path, "rt") as f:
-        mod: Module = ast.parse(f.read())
+    mod: Module = ast_parse_file(
+        routes_path, skip_annotate=True, skip_docstring_remit=True
+    )
 
     def get_names(functions):
         """
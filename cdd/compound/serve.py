@@ -0,0 +1,357 @@
+"""
+Long-running daemon, serving cdd's entry points over JSON-RPC 2.0; so editors and hooks calling cdd on every save pay
+for interpreter startup, imports, and cold caches once.
+
+Requests and responses are newline-delimited JSON, over stdin & stdout or a Unix domain socket.
+Files are parsed through the parse cache, keyed by their mtime & size; so a file changing invalidates its entries.
+"""
+
+import json
+import socket
+import sys
+from argparse import Namespace
+from contextlib import redirect_stderr, redirect_stdout
+from importlib import import_module
+from io import StringIO
+from os import chdir, getcwd, path, remove
+
+import cdd.shared.ir_cache
+import cdd.shared.source_transformer
+import cdd.shared.tracing
+
+METHODS = {
+    "doctrans": "cdd.compound.doctrans.doctrans",
+    "doctrans_files": "cdd.compound.doctrans.doctrans_files",
+    "exmod": "cdd.compound.exmod.exmod",
+    "gen": "cdd.compound.gen.gen",
+    "ground_truth": "cdd.compound.serve._ground_truth",
+    "main": "cdd.compound.serve._main",
+    "openapi_bulk": "cdd.compound.openapi.gen_openapi.openapi_bulk",
+    "sync_properties": "cdd.compound.sync_properties.sync_properties",
+}  # type: dict[str, str]
+
+# Error codes of the JSON-RPC 2.0 specification
+PARSE_ERROR = -32700  # type: int
+INVALID_REQUEST = -32600  # type: int
+METHOD_NOT_FOUND = -32601  # type: int
+SERVER_ERROR = -32000  # type: int
+
+
+def _ground_truth(args, truth_file):
+    """
+    Internal function to call `ground_truth` with its `args` given as a dict—as JSON has no `Namespace`
+
+    :param args: Namespace with the values of the CLI arguments
+    :type args: ```dict```
+
+    :param truth_file: contains the filename of the one true source
+    :type truth_file: ```str```
+
+    :return: Filenames and whether they were changed
+    :rtype: ```OrderedDict```
+    """
+    return import_module("cdd.shared.conformance").ground_truth(
+        Namespace(**args), truth_file
+    )
+
+
+def _main(argv, cwd=None):
+    """
+    Internal function to run the CLI, as if `python -m cdd` were called with `argv` in `cwd`.
+    The global options—`--cache-dir`, `--timings`, and `--trace-out`—only apply to this request.
+
+    :param argv: CLI arguments, i.e., without the program name
+    :type argv: ```list[str]```
+
+    :param cwd: Directory to resolve relative paths against. Defaults to that of the daemon.
+    :type cwd: ```Optional[str]```
+
+    :return: What `cdd.__main__.main` returns
+    :rtype: ```Any```
+    """
+    main_module = import_module("cdd.__main__")  # type: Module
+    args = main_module._build_parser().parse_args(argv)  # type: Namespace
+    if args.command == "serve" or args.server is not None:
+        raise ValueError("The daemon neither serves nor forwards to another")
+    previous_cwd = getcwd()  # type: str
+    previous_cache_dir = cdd.shared.ir_cache.IR_CACHE_DIR  # type: Optional[str]
+    previous_tracing = cdd.shared.tracing.save_tracing()  # type: tuple
+    if cwd is not None:
+        chdir(cwd)
+    try:
+        return main_module.main(cli_argv=argv)
+    finally:
+        chdir(previous_cwd)
+        cdd.shared.ir_cache.set_ir_cache_dir(previous_cache_dir)
+        cdd.shared.tracing.restore_tracing(previous_tracing)
+
+
+def _error_response(request_id, code, message, data=None):
+    """
+    Internal function to construct a JSON-RPC error response
+
+    :param request_id: `id` of the request; None when it couldn't be read
+    :type request_id: ```Optional[Union[str, int]]```
+
+    :param code: Error code, e.g., `METHOD_NOT_FOUND`
+    :type code: ```int```
+
+    :param message: Short description of the error
+    :type message: ```str```
+
+    :param data: Further information about the error
+    :type data: ```Optional[dict]```
+
+    :return: JSON-RPC error response
+    :rtype: ```dict```
+    """
+    error = {"code": code, "message": message}  # type: dict
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": "2.0", "error": error, "id": request_id}
+
+
+def handle_request(request):
+    """
+    Call the entry point the JSON-RPC request names, capturing what it prints and how it exits.
+    Its result is a dict of: `"return"`, its return value; `"stdout"` and `"stderr"`, what it printed to each; and
+    `"exit_code"`, what it raised `SystemExit` with (None if it returned).
+
+    :param request: JSON-RPC request, with `params` to call the method with by name (dict) or position (list)
+    :type request: ```dict```
+
+    :return: JSON-RPC response; None for a notification, i.e., a request without `id`
+    :rtype: ```Optional[dict]```
+    """
+    if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+        return _error_response(None, INVALID_REQUEST, "Invalid Request")
+    request_id = request.get("id")
+    if request["method"] not in METHODS:
+        response = _error_response(request_id, METHOD_NOT_FOUND, "Method not found")
+    else:
+        module, _, name = METHODS[request["method"]].rpartition(".")
+        params = request.get("params", {})  # type: Union[dict, list]
+        stdout, stderr = StringIO(), StringIO()
+        exit_code = None  # type: Optional[Union[int, str]]
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    function = getattr(import_module(module), name)
+                    returned = (
+                        function(*params)
+                        if isinstance(params, list)
+                        else function(**params)
+                    )
+                except SystemExit as e:
+                    returned, exit_code = None, 0 if e.code is None else e.code
+        except Exception as e:
+            response = _error_response(
+                request_id,
+                SERVER_ERROR,
+                "Server error",
+                {
+                    "type": type(e).__name__,
+                    "message": str(e),
+                    "stdout": stdout.getvalue(),
+                    "stderr": stderr.getvalue(),
+                },
+            )
+        else:
+            response = {
+                "jsonrpc": "2.0",
+                "result": {
+                    "return": returned,
+                    "stdout": stdout.getvalue(),
+                    "stderr": stderr.getvalue(),
+                    "exit_code": exit_code,
+                },
+                "id": request_id,
+            }
+    return None if "id" not in request else response
+
+
+def _handle_line(line):
+    """
+    Internal function to handle one line—one JSON-RPC request—read by the daemon
+
+    :param line: JSON-RPC request
+    :type line: ```str```
+
+    :return: Response line—empty for a notification—and whether the daemon is to shut down
+    :rtype: ```tuple[str, bool]```
+    """
+    try:
+        request = json.loads(line)
+    except ValueError:
+        response = _error_response(None, PARSE_ERROR, "Parse error")
+    else:
+        if isinstance(request, dict) and request.get("method") == "shutdown":
+            return (
+                (
+                    ""
+                    if "id" not in request
+                    else "{}\n".format(
+                        json.dumps(
+                            {"jsonrpc": "2.0", "result": None, "id": request["id"]}
+                        )
+                    )
+                ),
+                True,
+            )
+        response = handle_request(request)
+    return (
+        "" if response is None else "{}\n".format(json.dumps(response, default=repr))
+    ), False
+
+
+def serve_stdio(stdin=None, stdout=None):
+    """
+    Serve JSON-RPC requests read from stdin—one per line—writing a response line to stdout for each, until a
+    `shutdown` request or the end of stdin
+
+    :param stdin: Stream to read requests from. Defaults to `sys.stdin`.
+    :type stdin: ```Optional[TextIO]```
+
+    :param stdout: Stream to write responses to. Defaults to `sys.stdout`.
+    :type stdout: ```Optional[TextIO]```
+    """
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+    for line in stdin:
+        if not line.strip():
+            continue
+        response, shutdown = _handle_line(line)
+        stdout.write(response)
+        stdout.flush()
+        if shutdown:
+            break
+
+
+def serve_unix_socket(socket_path):
+    """
+    Serve JSON-RPC requests on a Unix domain socket—one per line, any number per connection—one connection at a
+    time, until a `shutdown` request. The socket file is removed on exit.
+
+    :param socket_path: Path of the Unix domain socket to listen on
+    :type socket_path: ```str```
+    """
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(socket_path)
+        server.listen()
+        shutdown = False
+        while not shutdown:
+            connection, _ = server.accept()
+            with connection, connection.makefile(
+                "rw", encoding="utf8", newline="\n"
+            ) as stream:
+                for line in stream:
+                    if not line.strip():
+                        continue
+                    response, shutdown = _handle_line(line)
+                    stream.write(response)
+                    stream.flush()
+                    if shutdown:
+                        break
+    finally:
+        server.close()
+        if path.exists(socket_path):
+            remove(socket_path)
+
+
+def serve(socket_path=None):
+    """
+    Serve cdd's entry points over JSON-RPC, with the parse cache enabled, see `handle_request` for the methods.
+    Only one request is handled at a time.
+
+    :param socket_path: Path of the Unix domain socket to listen on. Defaults to stdin & stdout.
+    :type socket_path: ```Optional[str]```
+    """
+    if cdd.shared.source_transformer.parse_cache_info() is None:
+        cdd.shared.source_transformer.enable_parse_cache(maxsize=1024)
+    if socket_path is None:
+        serve_stdio()
+    else:
+        serve_unix_socket(socket_path)
+
+
+def call(socket_path, method, params=None):
+    """
+    Call a method of the daemon listening on the Unix domain socket
+
+    :param socket_path: Path of the Unix domain socket the daemon listens on
+    :type socket_path: ```str```
+
+    :param method: Method name, e.g., `"main"`
+    :type method: ```str```
+
+    :param params: Parameters, by name (dict) or position (list)
+    :type params: ```Optional[Union[dict, list]]```
+
+    :return: Result of the call
+    :rtype: ```Any```
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        with client.makefile("rw", encoding="utf8", newline="\n") as stream:
+            stream.write(
+                "{}\n".format(
+                    json.dumps(
+                        {
+                            "jsonrpc": "2.0",
+                            "method": method,
+                            "params": {} if params is None else params,
+                            "id": 0,
+                        }
+                    )
+                )
+            )
+            stream.flush()
+            response = json.loads(stream.readline())  # type: dict
+    if "error" in response:
+        raise RuntimeError(
+            "{message} ({code}){data}".format(
+                message=response["error"]["message"],
+                code=response["error"]["code"],
+                data=(
+                    ": {type}: {message}".format(**response["error"]["data"])
+                    if "data" in response["error"]
+                    else ""
+                ),
+            )
+        )
+    return response["result"]
+
+
+def forward(socket_path, argv):
+    """
+    Run the CLI on the daemon listening on the Unix domain socket, printing what it printed
+
+    :param socket_path: Path of the Unix domain socket the daemon listens on
+    :type socket_path: ```str```
+
+    :param argv: CLI arguments, i.e., without the program name; resolved relative to the current directory
+    :type argv: ```list[str]```
+
+    :return: Exit code the CLI exited with; 0 if it returned
+    :rtype: ```Union[int, str]```
+    """
+    result = call(socket_path, "main", {"argv": argv, "cwd": getcwd()})  # type: dict
+    sys.stdout.write(result["stdout"])
+    sys.stderr.write(result["stderr"])
+    return 0 if result["exit_code"] is None else result["exit_code"]
+
+
+__all__ = [
+    "INVALID_REQUEST",
+    "METHODS",
+    "METHOD_NOT_FOUND",
+    "PARSE_ERROR",
+    "SERVER_ERROR",
+    "call",
+    "forward",
+    "handle_request",
+    "serve",
+    "serve_stdio",
+    "serve_unix_socket",
+]  # type: list[str]
@@ -14,7 +14,7 @@ from cdd.shared.ast_utils import (
     it2literal,
 )
 from cdd.shared.pure_utils import strip_split
-from cdd.shared.source_transformer import ast_parse, to_code
+from cdd.shared.source_transformer import ast_parse_file, to_code
 
 
 def sync_properties(
@@ -48,11 +48,8 @@ def sync_properties(
     :param output_param_wrap: Wrap all input_str params with this. E.g., `Optional[Union[{output_param}, str]]`
     :param output_param_wrap: ```Optional[str]```
     """
-    with open(path.realpath(path.expanduser(input_filename)), "rt") as f:
-        input_ast = ast_parse(f.read(), filename=input_filename)
-
-    with open(path.realpath(path.expanduser(output_filename)), "rt") as f:
-        output_ast = ast_parse(f.read(), filename=output_filename)
+    input_ast = ast_parse_file(path.realpath(path.expanduser(input_filename)))
+    output_ast = ast_parse_file(path.realpath(path.expanduser(output_filename)))
 
     assert len(input_params) == len(output_params)
     for input_param, output_param in zip(input_params, output_params):
@@ -3,9 +3,11 @@ Docstring parser
 """
 
 import cdd.shared.docstring_parsers
+import cdd.shared.ir_cache
 from cdd.shared.types import IntermediateRepr
 
 
+@cdd.shared.ir_cache.cached_parser
 def docstring(
     doc_string,
     infer_type=False,
@@ -12,6 +12,7 @@ from cdd.docstring.emit import docstring
 # import , ,
 from cdd.shared.emit.utils.emitter_utils import get_internal_body
 from cdd.shared.pure_utils import PY3_8, none_types, simple_types
+from cdd.shared.type_expr_cache import parse_type_expr
 from cdd.shared.types import Internal
 
 
@@ -90,8 +91,6 @@ def function(
         if function_type in frozenset((None, "static"))
         else [cdd.shared.ast_utils.set_arg(function_type)]
     )
-    from cdd.shared.emit.utils.emitter_utils import ast_parse_fix
-
     args_from_params = list(
         map(
             lambda param: cdd.shared.ast_utils.set_arg(
@@ -99,7 +98,7 @@ def function(
                     (
                         Name(param[1]["typ"], Load(), lineno=None, col_offset=None)
                         if param[1]["typ"] in simple_types
-                        else ast_parse_fix(param[1]["typ"])
+                        else parse_type_expr(param[1]["typ"], fix_unbalanced=True)
                     )
                     if type_annotations and "typ" in param[1]
                     else None
@@ -200,7 +199,7 @@ def function(
         type_params=[],
         name=function_name,
         returns=(
-            ast.parse(intermediate_repr["returns"]["return_type"]["typ"]).body[0].value
+            parse_type_expr(intermediate_repr["returns"]["return_type"]["typ"])
             if type_annotations
             and (intermediate_repr.get("returns") or {"return_type": {}})[
                 "return_type"
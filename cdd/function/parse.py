@@ -15,12 +15,14 @@ from typing import List, Optional, cast
 import cdd.docstring.parse
 import cdd.shared.ast_utils
 import cdd.shared.docstring_parsers
+import cdd.shared.ir_cache
 import cdd.shared.parse.utils.parser_utils
 from cdd.function.utils.parse_utils import _interpolate_return
 from cdd.shared.pure_utils import rpartial
 from cdd.shared.types import IntermediateRepr
 
 
+@cdd.shared.ir_cache.cached_parser
 def function(
     function_def,
     infer_type=False,
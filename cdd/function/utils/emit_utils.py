@@ -14,6 +14,7 @@ from cdd.shared.pure_utils import (
     multiline,
     none_types,
 )
+from cdd.shared.type_expr_cache import parse_type_expr
 
 
 def make_call_meth(body, return_type, param_names, docstring_format, word_wrap):
@@ -70,9 +71,7 @@ def make_call_meth(body, return_type, param_names, docstring_format, word_wrap):
                     (
                         RewriteName(param_names).visit(
                             Return(
-                                cdd.shared.ast_utils.get_value(
-                                    ast.parse(return_type.strip("`")).body[0]
-                                ),
+                                parse_type_expr(return_type.strip("`")),
                                 expr=None,
                             )
                         )
@@ -11,6 +11,7 @@ from typing import Optional
 
 from cdd.shared.ast_utils import cmp_ast, get_doc_str
 from cdd.shared.cst_utils import (
+    CstIndex,
     FunctionDefinitionStart,
     TripleQuoted,
     UnchangingLine,
@@ -50,8 +51,8 @@ def find_cst_at_ast(cst_list, node):
 
     (uses `_location` from `annotate_ancestry`)
 
-    :param cst_list: List of `namedtuple`s with at least ("line_no_start", "line_no_end", "value") attributes
-    :type cst_list: ```list[NamedTuple]```
+    :param cst_list: `namedtuple`s with at least ("line_no_start", "line_no_end", "value"); `CstIndex` is fastest
+    :type cst_list: ```Union[CstIndex, list[NamedTuple]]```
 
     :param node: AST node
     :type node: ```AST```
@@ -59,22 +60,15 @@ def find_cst_at_ast(cst_list, node):
     :return: Matching idx and element from cst_list if found else (None, None)
     :rtype: ```tuple[Optional[int], Optional[NamedTuple]]````
     """
-    cst_node_found, cst_node_no = None, None
     node_type = type(node).__name__
     cst_type = ast2cst.get(node_type, type(None)).__name__
     if cst_type == "NoneType":
         print("`{node_type}` not implemented".format(node_type=node_type), file=stderr)
         return None, None
-    for cst_node_no, cst_node in enumerate(cst_list):
-        if (
-            cst_node.line_no_start <= node.lineno <= cst_node.line_no_end
-            # Extra precautions to ensure the wrong new_node is never replaced:
-            and type(cst_node).__name__ == cst_type  # `isinstance` doesn't work
-            and getattr(cst_node, "name", None) == getattr(node, "name", None)
-        ):
-            cst_node_found = cst_node
-            break
-    return cst_node_no, cst_node_found
+    # Extra precautions to ensure the wrong new_node is never replaced: same type and name, not just lines
+    return (cst_list if isinstance(cst_list, CstIndex) else CstIndex(cst_list)).find(
+        cst_type, getattr(node, "name", None), node.lineno
+    )
 
 
 class Delta(Enum):
@@ -38,7 +38,7 @@ from collections import deque, namedtuple
 from collections.abc import __all__ as collections_abc__all__
 from contextlib import suppress
 from copy import deepcopy
-from functools import partial
+from functools import lru_cache, partial
 from importlib import import_module
 from importlib.util import find_spec
 from inspect import isclass, isfunction
@@ -50,6 +50,7 @@ from typing import FrozenSet, Generator, Optional
 from typing import __all__ as typing__all__
 
 import cdd.shared.source_transformer
+import cdd.shared.tracing
 from cdd.shared.defaults_utils import extract_default, needs_quoting
 from cdd.shared.pure_utils import (
     PY_GTE_3_8,
@@ -64,12 +65,7 @@ from cdd.shared.pure_utils import (
     rpartial,
     simple_types,
 )
-
-safe_dump_all = (
-    getattr(import_module("yaml"), "safe_dump_all")
-    if find_spec("yaml") is not None
-    else None
-)
+from cdd.shared.type_expr_cache import parse_type_expr
 
 collections_abc___all__: FrozenSet = frozenset(collections_abc__all__)
 del collections_abc__all__
@@ -438,7 +434,7 @@ def param2ast(param):
             annotation=(
                 Name(_param["typ"], Load(), lineno=None, col_offset=None)
                 if _param["typ"] in simple_types
-                else get_value(ast.parse(_param["typ"]).body[0])
+                else parse_type_expr(_param["typ"])
             ),
             simple=1,
             target=Name(name, Store(), lineno=None, col_offset=None),
@@ -505,9 +501,7 @@ def _generic_param2ast(param):
     """
     name, _param = param
     del param
-    from cdd.shared.emit.utils.emitter_utils import ast_parse_fix
-
-    annotation = ast_parse_fix(_param["typ"])
+    annotation = parse_type_expr(_param["typ"], fix_unbalanced=True)
     value = None
     if "default" in _param:
         if not code_quoted(_param["default"]) or _param["default"][
@@ -770,9 +764,7 @@ def _resolve_arg(action, choices, param, required, typ):
     elif _param["typ"] == "dict" or name.endswith("kwargs"):
         typ, required = "loads", not name.endswith("kwargs")
     elif _param["typ"]:
-        from cdd.shared.emit.utils.emitter_utils import ast_parse_fix
-
-        parsed_type = ast_parse_fix(_param["typ"])
+        parsed_type = parse_type_expr(_param["typ"], fix_unbalanced=True, copy=False)
         for node in walk(parsed_type):
             _required, action, choices, typ = _parse_node_for_arg(
                 _required, action, choices, node, typ
@@ -1495,8 +1487,8 @@ def infer_type_and_default(action, default, typ, required):
             # YAML is more permissive though less concise, but `loads` from yaml is used so this works
             default = (
                 dumps(default, ensure_ascii=False)
-                if safe_dump_all is None
-                else safe_dump_all(default)
+                if find_spec("yaml") is None
+                else import_module("yaml").safe_dump_all(default)
             )
     elif default is None:
         if "Optional" not in (typ or iter(())) and typ not in frozenset(
@@ -1943,10 +1935,9 @@ def module_to_all(module_or_filepath):
     if not path.exists(module_or_filepath):
         module_or_filepath = find_module_filepath(module_or_filepath)
 
-    with open(module_or_filepath, "rt") as f:
-        module_or_filepath: Module = cdd.shared.source_transformer.ast_parse(
-            f.read(), filename=module_or_filepath
-        )
+    module_or_filepath: Module = cdd.shared.source_transformer.ast_parse_file(
+        module_or_filepath, copy=False
+    )
 
     module_or_filepath: Module = module_or_filepath
 
@@ -2017,7 +2008,9 @@ def merge_assignment_lists(node, name, unique_sort=True):
     )
 
 
-def merge_modules(mod0, mod1, remove_imports_from_second=True, deduplicate_names=False):
+def merge_modules(
+    mod0, mod1, remove_imports_from_second=True, deduplicate_names=False, inplace=False
+):
     """
     Merge modules (removing module docstring from mod1)
 
@@ -2033,7 +2026,10 @@ def merge_modules(mod0, mod1, remove_imports_from_second=True, deduplicate_names
     :param deduplicate_names: Whether to deduplicate names; names can be function|class|AnnAssign|Assign name
     :type deduplicate_names: ```bool```
 
-    :return: Merged module (copy)
+    :param inplace: Whether to extend `mod0` itself rather than a copy of it
+    :type inplace: ```bool```
+
+    :return: Merged module (copy unless `inplace`)
     :rtype: ```Module```
     """
     mod1_body = (
@@ -2042,7 +2038,7 @@ def merge_modules(mod0, mod1, remove_imports_from_second=True, deduplicate_names
         else mod1.body
     )
 
-    new_mod = deepcopy(mod0)
+    new_mod = mod0 if inplace else deepcopy(mod0)
 
     new_mod.body += (
         list(
@@ -2219,6 +2215,7 @@ def get_types(node):
             )
 
 
+@cdd.shared.tracing.traced("infer_imports")
 def infer_imports(module, modules_to_all=DEFAULT_MODULES_TO_ALL):
     """
     Infer imports from AST nodes (Name|.annotation|.type_comment); in order; these:
@@ -2231,8 +2228,8 @@ def infer_imports(module, modules_to_all=DEFAULT_MODULES_TO_ALL):
     :param module: Module, ClassDef, FunctionDef, AsyncFunctionDef, Assign
     :type module: ```Union[ClassDef, FunctionDef, AsyncFunctionDef, Assign]```
 
-    :param modules_to_all: Tuple of module_name to __all__ of module; (str) to FrozenSet[str]
-    :type modules_to_all: ```tuple[tuple[str, frozenset], ...]```
+    :param modules_to_all: Tuple of module_name to __all__ of module; (str) to FrozenSet[str]. Or its `SymbolIndex`.
+    :type modules_to_all: ```Union[tuple[tuple[str, frozenset], ...], SymbolIndex]```
 
     :return: List of imports
     :rtype: ```Optional[Tuple[Union[Import, ImportFrom]]]```
@@ -2261,7 +2258,7 @@ def infer_imports(module, modules_to_all=DEFAULT_MODULES_TO_ALL):
         else:
             return None
 
-    _symbol_to_import = partial(symbol_to_import, modules_to_all=modules_to_all)
+    _symbol_to_import: SymbolIndex = symbol_index(modules_to_all)
 
     # Lots of room for optimisation here; but its probably NP-hard:
     imports = tuple(
@@ -2321,6 +2318,96 @@ def infer_imports(module, modules_to_all=DEFAULT_MODULES_TO_ALL):
     return imports if imports else None
 
 
+class SymbolIndex(object):
+    """
+    Index of symbol to the module exporting it. Earlier modules take priority over later ones—as when scanning
+    `modules_to_all` in order—so resolving a symbol is one dict lookup.
+    """
+
+    __slots__ = ("_module_of", "modules_to_all")
+
+    def __init__(self, modules_to_all=tuple()):
+        """
+        Index the modules, in priority order
+
+        :param modules_to_all: Tuple of module_name to __all__ of module; (str) to FrozenSet[str]
+        :type modules_to_all: ```tuple[tuple[str, frozenset], ...]```
+        """
+        self._module_of = {}  # type: dict[str, str]
+        self.modules_to_all = tuple()  # type: tuple[tuple[str, frozenset], ...]
+        for module, all_ in modules_to_all:
+            self.register(module, all_)
+
+    def __call__(self, symbol):
+        """
+        Resolve symbol to module
+
+        :param symbol: symbol to look for within the indexed modules
+        :type symbol: ```str```
+
+        :return: (symbol, module) if name in module else None
+        :rtype: ```Optional[Tuple[str, str]]```
+        """
+        module: Optional[str] = self._module_of.get(symbol)
+        return None if module is None else (symbol, module)
+
+    def copy(self):
+        """
+        Copy this index, e.g., to `register` more modules on one from `symbol_index`
+
+        :return: Copy of this index
+        :rtype: ```SymbolIndex```
+        """
+        symbol_index_copy: SymbolIndex = SymbolIndex()
+        symbol_index_copy._module_of = self._module_of.copy()
+        symbol_index_copy.modules_to_all = self.modules_to_all
+        return symbol_index_copy
+
+    def register(self, module, all_, prepend=False):
+        """
+        Add a module to the index, without reindexing those already within
+
+        :param module: Module name
+        :type module: ```str```
+
+        :param all_: `__all__` of module
+        :type all_: ```frozenset[str]```
+
+        :param prepend: Give the module priority over those already within, instead of being last
+        :type prepend: ```bool```
+        """
+        if prepend:
+            self._module_of.update(dict.fromkeys(all_, module))
+            self.modules_to_all = ((module, all_),) + self.modules_to_all
+        else:
+            for symbol in all_:
+                self._module_of.setdefault(symbol, module)
+            self.modules_to_all += ((module, all_),)
+
+
+_symbol_index_cached = lru_cache(maxsize=32)(SymbolIndex)
+
+
+def symbol_index(modules_to_all):
+    """
+    Index of symbol to module for `modules_to_all`; built once per tuple, and shared—so `copy` before `register`
+
+    :param modules_to_all: Tuple of module_name to __all__ of module; (str) to FrozenSet[str]. Or its `SymbolIndex`.
+    :type modules_to_all: ```Union[tuple[tuple[str, frozenset], ...], SymbolIndex]```
+
+    :return: Index of symbol to module
+    :rtype: ```SymbolIndex```
+    """
+    if isinstance(modules_to_all, SymbolIndex):
+        return modules_to_all
+    elif isinstance(modules_to_all, tuple):
+        try:
+            return _symbol_index_cached(modules_to_all)
+        except TypeError:  # Unhashable, e.g., `set` rather than `frozenset`
+            pass
+    return SymbolIndex(modules_to_all)
+
+
 def symbol_to_import(
     symbol,
     modules_to_all,
@@ -2331,15 +2418,13 @@ def symbol_to_import(
     :param symbol: symbol to look for within various modules
     :type symbol: ```str```
 
-    :param modules_to_all: Tuple of module_name to __all__ of module; (str) to FrozenSet[str]
-    :type modules_to_all: ```tuple[tuple[str, frozenset], ...]```
+    :param modules_to_all: Tuple of module_name to __all__ of module; (str) to FrozenSet[str]. Or its `SymbolIndex`.
+    :type modules_to_all: ```Union[tuple[tuple[str, frozenset], ...], SymbolIndex]```
 
     :return: (symbol, module) if name in module else None
     :rtype: ```Optional[Tuple[str, str]]```
     """
-    return next(
-        ((symbol, module) for (module, all_) in modules_to_all if symbol in all_), None
-    )
+    return symbol_index(modules_to_all)(symbol)
 
 
 def deduplicate_sorted_imports(module):
@@ -2454,6 +2539,7 @@ __all__ = [
     "NoneStr",
     "RewriteAtQuery",
     "Set_to_set",
+    "SymbolIndex",
     "Tuple_to_tuple",
     "_parse_default_from_ast",
     "annotate_ancestry",
@@ -2491,6 +2577,8 @@ __all__ = [
     "set_docstring",
     "set_slice",
     "set_value",
+    "symbol_index",
+    "symbol_to_import",
     "to_annotation",
     "to_type_comment",
 ]
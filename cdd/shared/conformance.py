@@ -16,9 +16,10 @@ import cdd.class_.parse
 import cdd.function.emit
 import cdd.function.parse
 import cdd.shared.emit.file
+import cdd.shared.tracing
 from cdd.shared.ast_utils import RewriteAtQuery, cmp_ast, find_in_ast, get_function_type
 from cdd.shared.pure_utils import pluralise, strip_split
-from cdd.shared.source_transformer import ast_parse
+from cdd.shared.source_transformer import ast_parse_file
 from cdd.shared.types import IntermediateRepr
 
 
@@ -77,6 +78,7 @@ def _get_name_from_namespace(args, fun_name):
     )
 
 
+@cdd.shared.tracing.traced("ground_truth")
 def ground_truth(args, truth_file):
     """
     There is but one truth. Conform.
@@ -107,14 +109,16 @@ def ground_truth(args, truth_file):
     parse_func, emit_func, type_wanted = arg2parse_emit_type[args.truth]
     search: List[str] = _get_name_from_namespace(args, args.truth).split(".")
 
-    with open(truth_file, "rt") as f:
-        true_ast = ast_parse(f.read(), filename=truth_file)
+    with cdd.shared.tracing.span("ground_truth.parse"):
+        true_ast = ast_parse_file(truth_file)
 
-    original_node = find_in_ast(search, true_ast)
-    gold_ir: IntermediateRepr = parse_func(
-        original_node,
-        **_default_options(node=original_node, search=search, type_wanted=type_wanted)()
-    )
+        original_node = find_in_ast(search, true_ast)
+        gold_ir: IntermediateRepr = parse_func(
+            original_node,
+            **_default_options(
+                node=original_node, search=search, type_wanted=type_wanted
+            )()
+        )
 
     effect = OrderedDict()
     # filter(lambda arg: arg != args.truth, arg2parse_emit_type.keys()):
@@ -144,6 +148,7 @@ def ground_truth(args, truth_file):
     return effect
 
 
+@cdd.shared.tracing.traced("ground_truth.conform")
 def _conform_filename(
     filename,
     search,
@@ -183,8 +188,7 @@ def _conform_filename(
         )
         return filename, True
 
-    with open(filename, "rt") as f:
-        parsed_ast = ast_parse(f.read(), filename=filename)
+    parsed_ast = ast_parse_file(filename)
     assert isinstance(parsed_ast, Module), "Expected `Module` got `{type_name}`".format(
         type_name=type(parsed_ast).__name__
     )
@@ -2,13 +2,14 @@
 Concrete Syntax Tree utility functions
 """
 
+from bisect import bisect_left
 from collections import OrderedDict, deque, namedtuple
 from dataclasses import make_dataclass
 from functools import partial, wraps
 from keyword import kwlist
 from typing import Optional, Union
 
-from cdd.shared.pure_utils import balanced_parentheses, is_triple_quoted, tab
+from cdd.shared.pure_utils import tab
 
 kwset = frozenset(kwlist)
 _basic_cst_attributes = "line_no_start", "line_no_end", "value"
@@ -182,10 +183,153 @@ def get_construct_name(words):
                 return words[idx + 1][:end_idx]
 
 
+class _ScanState(object):
+    """
+    Properties of a growing chunk of source, updated per character appended rather than recomputed over the
+    whole chunk; equivalent to calling `balanced_parentheses`, `is_triple_quoted`, `str.strip` &etc. on it.
+    """
+
+    __slots__ = (
+        "chars",
+        "first",
+        "last",
+        "paren_depths",
+        "quote_mark",
+        "has_class_or_def",
+        "has_class_or_def_word",
+        "word_first",
+        "word_last",
+    )
+
+    def __init__(self):
+        """
+        Start with an empty chunk
+        """
+        self.chars = []  # type: list[str]
+        self.first = self.last = None  # type: Optional[int]
+        self.paren_depths = [0, 0, 0]  # type: list[int]
+        self.quote_mark = None  # type: Optional[str]
+        self.has_class_or_def = self.has_class_or_def_word = False
+        self.word_first = self.word_last = None  # type: Optional[int]
+
+    def append(self, ch):
+        """
+        Append a character to the chunk
+
+        :param ch: Character
+        :type ch: ```str```
+        """
+        idx: int = len(self.chars)
+        prev_ch: Optional[str] = self.chars[-1] if self.chars else None
+        self.chars.append(ch)
+
+        # Same as `balanced_parentheses`, which ignores whatever is inside quotes
+        if self.quote_mark is not None and ch == self.quote_mark and prev_ch != "\\":
+            self.quote_mark = None
+        elif self.quote_mark is None:
+            if ch in frozenset(("'", '"')):
+                self.quote_mark = ch
+            elif ch in _open_parens:
+                self.paren_depths[_open_parens.index(ch)] += 1
+            elif ch in _closed_parens:
+                self.paren_depths[_closed_parens.index(ch)] -= 1
+
+        if ch == " ":
+            # Words are what `str.split(" ")` gives, then `str.strip`ped
+            self.has_class_or_def_word |= self._last_word_is_class_or_def()
+            self.word_first = self.word_last = None
+        elif not ch.isspace():
+            if self.first is None:
+                self.first = idx
+            if self.word_first is None:
+                self.word_first = idx
+            self.last = self.word_last = idx
+            self.has_class_or_def |= self.endswith("def") or self.endswith("class")
+
+    def _last_word_is_class_or_def(self):
+        """
+        :return: Whether the last (stripped) word is "class" or "def"
+        :rtype: ```bool```
+        """
+        return self.word_first is not None and "".join(
+            self.chars[self.word_first : self.word_last + 1]
+        ) in frozenset(("class", "def"))
+
+    def balanced(self):
+        """
+        :return: Whether the parentheses are balanced, ignoring whatever is inside quotes
+        :rtype: ```bool```
+        """
+        return not any(self.paren_depths)
+
+    def has_class_or_def_in_words(self):
+        """
+        :return: Whether "class" or "def" is one of the words of the chunk
+        :rtype: ```bool```
+        """
+        return self.has_class_or_def_word or self._last_word_is_class_or_def()
+
+    def isspace(self):
+        """
+        :return: Whether the chunk is non-empty and only whitespace
+        :rtype: ```bool```
+        """
+        return self.first is None and bool(self.chars)
+
+    def startswith(self, prefix):
+        """
+        :param prefix: Prefix without whitespace
+        :type prefix: ```str```
+
+        :return: Whether the stripped chunk starts with `prefix`
+        :rtype: ```bool```
+        """
+        return (
+            self.first is not None
+            and "".join(self.chars[self.first : self.first + len(prefix)]) == prefix
+        )
+
+    def endswith(self, suffix):
+        """
+        :param suffix: Suffix without whitespace
+        :type suffix: ```str```
+
+        :return: Whether the stripped chunk ends with `suffix`
+        :rtype: ```bool```
+        """
+        return (
+            self.last is not None
+            and self.last + 1 >= len(suffix)
+            and "".join(self.chars[self.last + 1 - len(suffix) : self.last + 1])
+            == suffix
+        )
+
+    def is_triple_quoted(self):
+        """
+        :return: Whether the stripped chunk has balanced triple quotes (either variety)
+        :rtype: ```bool```
+        """
+        return (
+            self.first is not None
+            and self.last - self.first + 1 > 5
+            and (
+                self.startswith("'''")
+                and self.endswith("'''")
+                or self.startswith('"""')
+                and self.endswith('"""')
+            )
+        )
+
+
+_open_parens, _closed_parens = "([{", ")]}"
+
+
 def cst_scanner(source):
     """
     Reduce source code into chunks useful for parsing.
     These chunks include newlines and the array is one dimensional.
+    Linear time: every character is appended to the state of its pending statement once, and scanned once more
+    when that statement is complete.
 
     :param source: Python source code
     :type source: ```str```
@@ -193,120 +337,81 @@ def cst_scanner(source):
     :return: List of scanned source code
     :rtype: ```list[str]```
     """
-    scanned, stack = [], []
-    for idx, ch in enumerate(source):
+    scanned, state = [], _ScanState()
+    for ch in source:
         if ch == "\n":  # in frozenset(("\n", ":", ";", '"""', "'''", '#')):
-            cst_scan(scanned, stack)
-        stack.append(ch)
-    cst_scan(scanned, stack)
-    if stack:
-        scanned.append("".join(stack))
+            if cst_scan(scanned, state):
+                state = _ScanState()
+        state.append(ch)
+    if not cst_scan(scanned, state) and state.chars:
+        scanned.append("".join(state.chars))
     return scanned
 
 
-def cst_scan(scanned, stack):
+def cst_scan(scanned, state):
     """
-    Checks if what has been scanned (stack) is ready for the `scanned` array
-    Add then clear stack if ready else do nothing with both
+    Checks if what has been scanned (state) is ready for the `scanned` array
+    Add if ready else do nothing with both
 
     :param scanned: List of statements observed
     :type scanned: ```list[str]```
 
-    :param stack: List of characters observed
-    :type stack: ```list[str]```
-    """
-    statement = "".join(stack)
-    statement_stripped = statement.strip()
+    :param state: State of the characters observed
+    :type state: ```_ScanState```
 
-    is_comment = statement_stripped.startswith("#")
-    if statement_stripped.endswith("\\"):
+    :return: Whether `state` was added to `scanned`, so should be cleared
+    :rtype: ```bool```
+    """
+    is_comment: bool = state.startswith("#")
+    if state.endswith("\\"):
         has_triple_quotes = is_other_statement = False
     else:
-        has_triple_quotes = is_triple_quoted(statement_stripped)
-        is_other_statement = all(
+        has_triple_quotes: bool = state.is_triple_quoted()
+        is_other_statement: bool = all(
             (
-                statement_stripped,
-                balanced_parentheses(statement_stripped),
-                not statement_stripped.startswith("@")
-                or statement_stripped.endswith(":"),
-                not statement_stripped.startswith("'''"),
-                not statement_stripped.startswith('"""'),
+                state.first is not None,
+                state.balanced(),
+                not state.startswith("@") or state.endswith(":"),
+                not state.startswith("'''"),
+                not state.startswith('"""'),
             )
         )
 
-    statement_found = is_comment or has_triple_quotes or is_other_statement
-    if statement_found:
-        if is_comment:
-            scanned.append(statement)
-            stack.clear()
-        elif is_other_statement:
-            expression = []
-
-            def add_and_clear(the_expression_str, expr, scanned_tokens, the_stack):
-                """
-                Add the found statement and clear the stacks
-
-                :param the_expression_str: Expression string
-                :type the_expression_str: ```str```
-
-                :param expr: The expression
-                :type expr: ```list[str]```
-
-                :param scanned_tokens: Scanned tokens
-                :type scanned_tokens: ```list[str]```
-
-                :param the_stack: The current stack
-                :type the_stack: ```list[str]```
-
-                """
-                scanned_tokens.append(the_expression_str)
-                expr.clear()
-                the_stack.clear()
-
-            expression_str: str = ""
-            for idx, ch in enumerate(statement):
-                expression.append(ch)
-                expression_str: str = "".join(expression)
-                expression_stripped = expression_str.strip()
-
-                if (
-                    is_triple_quoted(expression_stripped)
-                    or expression_stripped.startswith("#")
-                    and expression_str.endswith("\n")
-                ):
-                    add_and_clear(expression_str, expression, scanned, stack)
-                    # Single comment should be picked up
-                elif balanced_parentheses(expression_stripped):
-                    if (
-                        expression_str.endswith("\n")
-                        and not expression_stripped.endswith("\\")
-                        and (
-                            not expression_stripped.endswith(":")
-                            or "class" not in expression_stripped
-                            and "def" not in expression_stripped
-                        )
-                        and not expression_str.isspace()
-                        and not expression_stripped.startswith("@")
-                    ):
-                        add_and_clear(expression_str, expression, scanned, stack)
-                    else:
-                        words = tuple(
-                            filter(None, map(str.strip, expression_stripped.split(" ")))
-                        )
-                        if "def" in words or "class" in words:
-                            if words[-1].endswith(":") and balanced_parentheses(
-                                expression_stripped
-                            ):
-                                add_and_clear(
-                                    expression_str, expression, scanned, stack
-                                )
-                        # elif ";"
-            if expression:
-                add_and_clear(expression_str, expression, scanned, stack)
-            # Longest matching pattern should be parsed out but this does shortest^
-        else:
-            scanned.append(statement)
-            stack.clear()
+    if not (is_comment or has_triple_quotes or is_other_statement):
+        return False
+    elif is_other_statement and not is_comment:
+        expression = _ScanState()
+        for ch in state.chars:
+            expression.append(ch)
+            if (
+                expression.is_triple_quoted()
+                or expression.startswith("#")
+                and ch == "\n"
+            ):
+                # Single comment should be picked up
+                scanned.append("".join(expression.chars))
+                expression = _ScanState()
+            elif expression.balanced() and (
+                (
+                    ch == "\n"
+                    and not expression.endswith("\\")
+                    and (
+                        not expression.endswith(":") or not expression.has_class_or_def
+                    )
+                    and not expression.isspace()
+                    and not expression.startswith("@")
+                )
+                or expression.has_class_or_def_in_words()
+                and expression.endswith(":")
+            ):
+                scanned.append("".join(expression.chars))
+                expression = _ScanState()
+        if expression.chars:
+            scanned.append("".join(expression.chars))
+        # Longest matching pattern should be parsed out but this does shortest^
+    else:
+        scanned.append("".join(state.chars))
+    return True
 
 
 def cst_parser(scanned):
@@ -489,6 +594,310 @@ def reindent_block_with_pass_body(s):
     )
 
 
+class CstIndex(list):
+    """
+    List of CST nodes, as from `cst_parse`, indexed to answer "CST node of type X named Y covering line L" in
+    logarithmic time. Line numbers must ascend in list order, which they do as parsed.
+
+    Stays correct across `insert`, `del` and item assignment—as the `maybe_replace_*` functions do—by tracking
+    where each originally parsed node now is in a Fenwick tree. Only originally parsed nodes are found; other
+    mutations (slices, `sort`, &etc.) re-index in linear time.
+    """
+
+    __slots__ = ("_buckets", "_gaps", "_live", "_tree")
+
+    def __init__(self, cst_list=()):
+        """
+        :param cst_list: CST nodes with at least ("line_no_start", "line_no_end", "value") attributes
+        :type cst_list: ```Iterable[NamedTuple]```
+        """
+        super(CstIndex, self).__init__(cst_list)
+        self._reindex()
+
+    def _reindex(self):
+        """
+        Internal function to (re)build the index from the current nodes, in linear time
+        """
+        # (type name, name) => ([line_no_start], [line_no_end], [slot]); a slot being a node's original position
+        self._buckets = (
+            {}
+        )  # type: dict[tuple[str, Optional[str]], tuple[list[int], list[int], list[int]]]
+        for slot, cst_node in enumerate(self):
+            deque(
+                map(
+                    list.append,
+                    self._buckets.setdefault(_cst_index_key(cst_node), ([], [], [])),
+                    (cst_node.line_no_start, cst_node.line_no_end, slot),
+                ),
+                maxlen=0,
+            )
+        # Each slot is a block of the nodes inserted before it (`_gaps`) then itself—unless deleted (`_live`);
+        # `_tree` is the Fenwick tree of block sizes, so prefix sums give current positions
+        self._gaps = [0] * len(self)  # type: list[int]
+        self._live = bytearray(b"\x01") * len(self)  # type: bytearray
+        self._tree = [0] + [1] * len(self)  # type: list[int]
+        for pos in range(1, len(self._tree)):
+            parent: int = pos + (pos & -pos)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[pos]
+
+    def _add(self, slot, delta):
+        """
+        Internal function to grow or shrink the block of `slot`
+
+        :param slot: Original position
+        :type slot: ```int```
+
+        :param delta: Change in block size
+        :type delta: ```int```
+        """
+        pos: int = slot + 1
+        while pos < len(self._tree):
+            self._tree[pos] += delta
+            pos += pos & -pos
+
+    def _block_start(self, slot):
+        """
+        Internal function to get the current position of the first node in the block of `slot`
+
+        :param slot: Original position
+        :type slot: ```int```
+
+        :return: Sum of the sizes of the blocks before `slot`
+        :rtype: ```int```
+        """
+        total, pos = 0, slot
+        while pos > 0:
+            total += self._tree[pos]
+            pos -= pos & -pos
+        return total
+
+    def _locate(self, index):
+        """
+        Internal function to find the block of the node at `index`
+
+        :param index: Current position, non-negative
+        :type index: ```int```
+
+        :return: Slot and the offset within its block; slot is None for nodes appended after every block
+        :rtype: ```tuple[Optional[int], int]```
+        """
+        pos, step = 0, 1 << len(self._tree).bit_length()
+        while step:
+            if pos + step < len(self._tree) and self._tree[pos + step] <= index:
+                pos += step
+                index -= self._tree[pos]
+            step >>= 1
+        return (None, index) if pos == len(self._gaps) else (pos, index)
+
+    def _position(self, index):
+        """
+        Internal function to normalise `index` the way `list` does
+
+        :param index: Position, maybe negative
+        :type index: ```int```
+
+        :return: Non-negative position
+        :rtype: ```int```
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError("list index out of range")
+        return index + len(self) if index < 0 else index
+
+    def find(self, cst_type, name, line_no):
+        """
+        Find the first originally parsed node of type `cst_type` named `name` whose lines cover `line_no`
+
+        :param cst_type: Name of the CST type, e.g., "FunctionDefinitionStart"
+        :type cst_type: ```str```
+
+        :param name: Name of the class or function; None for nodes without names
+        :type name: ```Optional[str]```
+
+        :param line_no: Line number
+        :type line_no: ```int```
+
+        :return: Current position and node if found else (None, None)
+        :rtype: ```tuple[Optional[int], Optional[NamedTuple]]```
+        """
+        starts, ends, slots = self._buckets.get((cst_type, name), ((), (), ()))
+        # Ends ascend, so the first node that ends at or after `line_no` is the first that can cover it
+        idx: int = bisect_left(ends, line_no)
+        while idx < len(slots) and starts[idx] <= line_no:
+            slot: int = slots[idx]
+            if self._live[slot]:
+                index: int = self._block_start(slot) + self._gaps[slot]
+                return index, self[index]
+            idx += 1
+        return None, None
+
+    def insert(self, index, cst_node):
+        """
+        Insert `cst_node` before `index`
+
+        :param index: Position
+        :type index: ```int```
+
+        :param cst_node: CST node
+        :type cst_node: ```NamedTuple```
+        """
+        index: int = min(max(index + len(self) if index < 0 else index, 0), len(self))
+        slot, _ = self._locate(index)
+        if slot is not None:
+            self._gaps[slot] += 1
+            self._add(slot, 1)
+        super(CstIndex, self).insert(index, cst_node)
+
+    def __delitem__(self, index):
+        """
+        Delete the node(s) at `index`
+
+        :param index: Position or slice
+        :type index: ```Union[int, slice]```
+        """
+        if isinstance(index, slice):
+            super(CstIndex, self).__delitem__(index)
+            return self._reindex()
+        index: int = self._position(index)
+        slot, offset = self._locate(index)
+        if slot is not None:
+            if offset < self._gaps[slot]:
+                self._gaps[slot] -= 1
+            else:
+                self._live[slot] = 0
+            self._add(slot, -1)
+        super(CstIndex, self).__delitem__(index)
+
+    def __setitem__(self, index, cst_node):
+        """
+        Replace the node(s) at `index`
+
+        :param index: Position or slice
+        :type index: ```Union[int, slice]```
+
+        :param cst_node: CST node, or nodes for a slice
+        :type cst_node: ```Union[NamedTuple, Iterable[NamedTuple]]```
+        """
+        if isinstance(index, slice):
+            super(CstIndex, self).__setitem__(index, cst_node)
+            return self._reindex()
+        index: int = self._position(index)
+        slot, offset = self._locate(index)
+        if slot is not None and offset == self._gaps[slot]:
+            self._rekey(slot, self[index], cst_node)
+        super(CstIndex, self).__setitem__(index, cst_node)
+
+    def _rekey(self, slot, old_cst_node, new_cst_node):
+        """
+        Internal function to move `slot` within the buckets, if replacing its node changes its key or lines
+
+        :param slot: Original position
+        :type slot: ```int```
+
+        :param old_cst_node: CST node being replaced
+        :type old_cst_node: ```NamedTuple```
+
+        :param new_cst_node: Replacement CST node
+        :type new_cst_node: ```NamedTuple```
+        """
+        old_key, new_key = map(_cst_index_key, (old_cst_node, new_cst_node))
+        if old_key == new_key and (
+            old_cst_node.line_no_start,
+            old_cst_node.line_no_end,
+        ) == (new_cst_node.line_no_start, new_cst_node.line_no_end):
+            return
+        bucket = self._buckets[old_key]
+        idx: int = bisect_left(bucket[2], slot)
+        deque(map(lambda column: column.pop(idx), bucket), maxlen=0)
+        bucket = self._buckets.setdefault(new_key, ([], [], []))
+        idx: int = bisect_left(bucket[2], slot)
+        deque(
+            map(
+                lambda column, value: column.insert(idx, value),
+                bucket,
+                (new_cst_node.line_no_start, new_cst_node.line_no_end, slot),
+            ),
+            maxlen=0,
+        )
+
+    def pop(self, index=-1):
+        """
+        Remove and return the node at `index`
+
+        :param index: Position
+        :type index: ```int```
+
+        :return: CST node
+        :rtype: ```NamedTuple```
+        """
+        cst_node = self[index]
+        del self[index]
+        return cst_node
+
+    def remove(self, cst_node):
+        """
+        Remove the first node equal to `cst_node`
+
+        :param cst_node: CST node
+        :type cst_node: ```NamedTuple```
+        """
+        del self[self.index(cst_node)]
+
+    def clear(self):
+        """
+        Remove every node
+        """
+        super(CstIndex, self).clear()
+        self._reindex()
+
+    def reverse(self):
+        """
+        Reverse the nodes in place
+        """
+        super(CstIndex, self).reverse()
+        self._reindex()
+
+    def sort(self, *args, **kwargs):
+        """
+        Sort the nodes in place
+
+        :param args: Positional arguments to `list.sort`
+        :type args: ```tuple```
+
+        :param kwargs: Keyword arguments to `list.sort`
+        :type kwargs: ```dict```
+        """
+        super(CstIndex, self).sort(*args, **kwargs)
+        self._reindex()
+
+    def __imul__(self, n):
+        """
+        Repeat the nodes in place
+
+        :param n: Number of repetitions
+        :type n: ```int```
+
+        :return: self
+        :rtype: ```CstIndex```
+        """
+        super(CstIndex, self).__imul__(n)
+        self._reindex()
+        return self
+
+
+def _cst_index_key(cst_node):
+    """
+    Internal function to key `cst_node` in `CstIndex`
+
+    :param cst_node: CST node
+    :type cst_node: ```NamedTuple```
+
+    :return: Name of its type, and its name—if it has one
+    :rtype: ```tuple[str, Optional[str]]```
+    """
+    return type(cst_node).__name__, getattr(cst_node, "name", None)
+
+
 CstTypes = Union[
     AnnAssignment,
     Assignment,
@@ -522,6 +931,7 @@ __all__ = [
     "CallStatement",
     "ClassDefinitionStart",
     "CommentStatement",
+    "CstIndex",
     "CstTypes",
     "DictExprStatement",
     "ElifStatement",
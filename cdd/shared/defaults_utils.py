@@ -9,11 +9,10 @@ from contextlib import suppress
 from copy import deepcopy
 from functools import partial
 from itertools import takewhile
-from operator import contains, eq
+from operator import contains
 from typing import Dict
 
 from cdd.shared.pure_utils import (
-    PY_GTE_3_8,
     PY_GTE_3_9,
     count_iter_items,
     location_within,
@@ -21,13 +20,9 @@ from cdd.shared.pure_utils import (
     quote,
     simple_types,
 )
+from cdd.shared.type_expr_cache import parse_type_expr, type_expr_needs_quoting
 from cdd.shared.types import IntermediateRepr
 
-if PY_GTE_3_8:
-    from cdd.shared.pure_utils import FakeConstant as Str
-else:
-    from ast import Str
-
 NoneStr = "```(None)```" if PY_GTE_3_9 else "```None```"
 DEFAULTS_TO_VARIANTS = (  # could do a whole r"[dD]efault[s]?\s+[value is|to|is|:]" but this suffices for now
     "defaults to ",
@@ -39,6 +34,9 @@ DEFAULTS_TO_VARIANTS = (  # could do a whole r"[dD]efault[s]?\s+[value is|to|is|
     "Default value\n is ",
     "Defaults\n            to",
 )
+_DEFAULTS_TO_VARIANTS_PAREN = tuple(
+    map(partial(str.format, "({}"), DEFAULTS_TO_VARIANTS)
+)  # type: tuple[str, ...]
 
 
 def ast_parse_fix(s):
@@ -51,9 +49,7 @@ def ast_parse_fix(s):
 
     :return: Value
     """
-    # return ast.parse(s).body[0].value
-    balanced = (s.count("[") + s.count("]")) & 1 == 0
-    return ast.parse(s if balanced else "{}]".format(s)).body[0].value
+    return parse_type_expr(s, fix_unbalanced=True)
 
 
 def needs_quoting(typ):
@@ -73,21 +69,7 @@ def needs_quoting(typ):
     elif typ == "Optional[str]":
         return True
 
-    typ = typ.replace("\n", "").strip()
-    parsed_typ_ast = ast_parse_fix(typ)
-    if isinstance(parsed_typ_ast, ast.Name):
-        return parsed_typ_ast.id == "str"
-
-    return any(
-        filter(
-            lambda node: isinstance(node, Str)
-            or isinstance(node, ast.Constant)
-            and type(node.value).__name__ == "str"
-            or isinstance(node, ast.Name)
-            and node.id == "str",
-            ast.walk(parsed_typ_ast),
-        )
-    )
+    return type_expr_needs_quoting(typ.replace("\n", "").strip())
 
 
 def extract_default(
@@ -122,17 +104,17 @@ def extract_default(
         return line, line
 
     default_search_announce_paren, default_search_announce = (
-        lambda _default_search_announce: (
-            map(partial(str.format, "({}"), _default_search_announce),
-            _default_search_announce,
-        )
-    )(
-        DEFAULTS_TO_VARIANTS
+        (_DEFAULTS_TO_VARIANTS_PAREN, DEFAULTS_TO_VARIANTS)
         if default_search_announce is None
         else (
+            lambda _default_search_announce: (
+                tuple(map(partial(str.format, "({}"), _default_search_announce)),
+                _default_search_announce,
+            )
+        )(
             (default_search_announce,)
             if isinstance(default_search_announce, str)
-            else default_search_announce
+            else tuple(default_search_announce)
         )
     )
 
@@ -141,9 +123,7 @@ def extract_default(
         (default_search_announce_paren, default_search_announce)
     ):
         _start_idx, _end_idx, _found = location_within(
-            line,
-            _default_search_announce,
-            cmp=lambda a, b: eq(*map(str.casefold, (a, b))),
+            line, _default_search_announce, ignore_case=True
         )
 
         if idx == 0:
@@ -10,11 +10,12 @@ Parses these formats into the cdd_python common IR format:
 
 import ast
 import collections  # noqa
+import re
 import sys
 from ast import AST
 from collections import OrderedDict
 from copy import deepcopy
-from functools import partial
+from functools import lru_cache, partial
 from itertools import chain, takewhile
 from operator import attrgetter, eq, le
 
@@ -44,7 +45,9 @@ else:
     from typing_extensions import LiteralString
 
 import cdd.shared.ast_utils
+import cdd.shared.parse.utils.parser_utils
 import cdd.shared.source_transformer
+import cdd.shared.tracing
 from cdd.docstring.utils.emit_utils import interpolate_defaults
 from cdd.docstring.utils.parse_utils import parse_adhoc_doc_for_typ
 from cdd.shared.defaults_utils import (
@@ -58,8 +61,8 @@ from cdd.shared.docstring_utils import (
     Style,
     derive_docstring_format,
 )
-from cdd.shared.parse.utils.parser_utils import merge_present_params
 from cdd.shared.pure_utils import (
+    ToggleableLruCache,
     code_quoted,
     count_iter_items,
     identity,
@@ -115,6 +118,73 @@ def parse_docstring(
             "returns": Optional[OrderedDict[Literal["return_type"], ParamVal]],
         })
     :rtype: ```dict```
+
+    Results are memoized (the style being derived from the docstring) in a process-wide LRU; each call returns
+    an independent copy. Set `CDD_DOCSTRING_CACHE_SIZE` to resize it, or to 0 to disable it.
+    """
+    if _docstring_cache.cached is None:
+        return _parse_docstring(
+            docstring,
+            infer_type,
+            default_search_announce,
+            parse_original_whitespace,
+            word_wrap,
+            emit_default_prop,
+            emit_default_doc,
+        )
+    return deepcopy(
+        _docstring_cache.cached(
+            docstring,
+            infer_type,
+            (
+                tuple(default_search_announce)
+                if isinstance(default_search_announce, list)
+                else default_search_announce
+            ),
+            parse_original_whitespace,
+            word_wrap,
+            emit_default_prop,
+            emit_default_doc,
+        )
+    )
+
+
+@cdd.shared.tracing.traced("parse_docstring")
+def _parse_docstring(
+    docstring,
+    infer_type,
+    default_search_announce,
+    parse_original_whitespace,
+    word_wrap,
+    emit_default_prop,
+    emit_default_doc,
+):
+    """
+    Internal function to parse the docstring into its components, uncached; see `parse_docstring`
+
+    :param docstring: the docstring
+    :type docstring: ```Optional[str]```
+
+    :param infer_type: Whether to try inferring the typ (from the default)
+    :type infer_type: ```bool```
+
+    :param default_search_announce: Default text(s) to look for. If None, uses default specified in default_utils.
+    :type default_search_announce: ```Optional[Union[str, Iterable[str]]]```
+
+    :param parse_original_whitespace: Whether to parse original whitespace or strip it out
+    :type parse_original_whitespace: ```bool```
+
+    :param word_wrap: Whether to word-wrap. Set `DOCTRANS_LINE_LENGTH` to configure length.
+    :type word_wrap: ```bool```
+
+    :param emit_default_prop: Whether to include the default dictionary property.
+    :type emit_default_prop: ```bool```
+
+    :param emit_default_doc: Whether help/docstring should include 'With default' text
+    :type emit_default_doc: ```bool```
+
+    :return: a dictionary consistent with `IntermediateRepr`
+    :rtype: ```dict```
     """
 
     assert isinstance(
@@ -173,6 +243,40 @@ def parse_docstring(
     return ir
 
 
+# Set `CDD_DOCSTRING_CACHE_SIZE` to resize it from the start, or to 0 to disable it
+_docstring_cache = ToggleableLruCache(
+    _parse_docstring, "CDD_DOCSTRING_CACHE_SIZE", 1024
+)  # type: ToggleableLruCache
+
+
+def enable_docstring_cache(maxsize=1024):
+    """
+    Memoize `parse_docstring` across the process, keyed by the docstring and every parse option.
+    Replaces—so empties—any existing cache.
+
+    :param maxsize: Maximum number of docstrings to remember; None for unbounded
+    :type maxsize: ```Optional[int]```
+    """
+    _docstring_cache.enable(maxsize)
+
+
+def disable_docstring_cache():
+    """
+    Stop memoizing `parse_docstring`, and release what was memoized
+    """
+    _docstring_cache.disable()
+
+
+def docstring_cache_info():
+    """
+    Hit & miss statistics of the `parse_docstring` cache
+
+    :return: (hits, misses, maxsize, currsize) if the cache is enabled else None
+    :rtype: ```Optional[functools._CacheInfo]```
+    """
+    return _docstring_cache.cache_info()
+
+
 def _scan_phase(docstring, parse_original_whitespace=False, style=Style.rest):
     """
     Scanner phase. Lexical analysis; to some degree…
@@ -406,6 +510,20 @@ def _return_parse_phase_numpydoc_and_google(return_tokens, scanned, stacker, sty
     return stacker
 
 
+@lru_cache(maxsize=None)
+def _tokens_re(tokens):
+    """
+    Internal function to compile—once per set of tokens—a pattern matching any of them
+
+    :param tokens: Tokens like `":param"`
+    :type tokens: ```tuple[str, ...]```
+
+    :return: Compiled pattern
+    :rtype: ```re.Pattern[str]```
+    """
+    return re.compile("|".join(map(re.escape, tokens)))
+
+
 def _scan_phase_rest(docstring, arg_tokens, return_tokens):
     """
     Scanner phase. Lexical analysis; to some degree…
@@ -424,28 +542,19 @@ def _scan_phase_rest(docstring, arg_tokens, return_tokens):
     """
 
     all_tokens = arg_tokens + return_tokens
-    rev_known_tokens_t = tuple(map(tuple, map(reversed, all_tokens)))
     scanned: List[Tuple[bool, str]] = []
-    stack: List[str] = []
-
-    for ch in docstring:
-        stack.append(ch)
-
-        stack_rev = stack[::-1]
+    start_idx: int = 0
 
-        for token in rev_known_tokens_t:
-            token_len: int = len(token)
-            if tuple(stack_rev[:token_len]) == token:
-                scanned.append((bool(len(scanned)), "".join(stack[:-token_len])))
-                stack = stack[len(scanned[-1][1]) :][:token_len]
-                continue
+    # Tokens start with ":" and contain no other, so their occurrences never overlap
+    for match in _tokens_re(all_tokens).finditer(docstring):
+        scanned.append((bool(scanned), docstring[start_idx : match.start()]))
+        start_idx: int = match.start()
 
-    if stack:
-        final = "".join(stack)
+    if docstring:
+        final: str = docstring[start_idx:]
         scanned.append(
             (
-                bool(scanned and scanned[-1][0])
-                or any(map(final.startswith, all_tokens)),
+                bool(scanned and scanned[-1][0]) or final.startswith(all_tokens),
                 final,
             )
         )
@@ -544,7 +653,7 @@ def _set_name_and_type(param, infer_type, word_wrap, none_default_for_kwargs=Fal
     was = deepcopy(_param)
     was_none = was.get("default") in frozenset((cdd.shared.ast_utils.NoneStr, "None"))
     if "doc" in _param:
-        merge_present_params(
+        cdd.shared.parse.utils.parser_utils.merge_present_params(
             target_param=_param,
             other_param=dict(zip(("doc", "default"), extract_default(_param["doc"]))),
         )
@@ -1107,4 +1216,11 @@ def _set_param_values(input_str, val, sw=":type"):
     )
 
 
-__all__ = ["parse_docstring", "_set_name_and_type", "Style"]  # type: list[str]
+__all__ = [
+    "Style",
+    "_set_name_and_type",
+    "disable_docstring_cache",
+    "docstring_cache_info",
+    "enable_docstring_cache",
+    "parse_docstring",
+]  # type: list[str]
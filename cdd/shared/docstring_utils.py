@@ -2,11 +2,12 @@
 Functions which produce docstring portions from various inputs
 """
 
+import re
 from collections import namedtuple
 from enum import Enum
 from functools import partial
 from itertools import chain, takewhile
-from operator import contains, eq, itemgetter, ne
+from operator import eq, itemgetter, ne
 from textwrap import indent
 from typing import List, Optional
 
@@ -730,12 +731,14 @@ def derive_docstring_format(docstring):
     :return: the style of docstring
     :rtype: ```Literal['rest', 'numpydoc', 'google']```
     """
-    if docstring is None or any(map(partial(contains, docstring), TOKENS.rest)):
-        style = Style.rest
-    elif any(map(partial(contains, docstring), TOKENS.google)):
-        style = Style.google
-    else:
-        style = Style.numpydoc
+    if docstring is None:
+        return Style.rest
+    # One pass: any ReST token makes it ReST, else any Google token makes it Google
+    style: Style = Style.numpydoc
+    for match in STYLE_TOKENS_RE.finditer(docstring):
+        if match.lastgroup == "rest":
+            return Style.rest
+        style: Style = Style.google
     return style
 
 
@@ -746,6 +749,13 @@ TOKENS = Tokens(
     ("Args:", "Kwargs:", "Raises:", "Returns:"),
     ("Parameters\n" "----------", "Returns\n" "-------"),
 )
+# Google tokens are matched by lookahead, so that ReST tokens starting within them—e.g., the ":" of "Args:"—are found
+STYLE_TOKENS_RE = re.compile(
+    "(?P<rest>{rest})|(?=(?P<google>{google}))".format(
+        rest="|".join(map(re.escape, TOKENS.rest)),
+        google="|".join(map(re.escape, TOKENS.google)),
+    )
+)  # type: re.Pattern[str]
 # Note: FPs possible for `"Parameters"` and `"Returns"` randomly thrown into normal doc_str
 TOKENS_SET = frozenset(
     map(
@@ -776,6 +786,7 @@ RETURN_TOKENS = Tokens(TOKENS.rest[-2:], (TOKENS.google[-1],), (TOKENS.numpydoc[
 __all__ = [
     "ARG_TOKENS",
     "RETURN_TOKENS",
+    "STYLE_TOKENS_RE",
     "Style",
     "TOKENS",
     "derive_docstring_format",
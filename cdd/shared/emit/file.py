@@ -3,25 +3,37 @@ File emitter
 """
 
 from ast import Module
+from functools import lru_cache
 from importlib import import_module
 from importlib.util import find_spec
 
 import cdd.shared.source_transformer
+import cdd.shared.tracing
 
-black = (
-    import_module("black")
-    if find_spec("black") is not None
-    else type(
-        "black",
-        tuple(),
-        {
-            "format_str": lambda src_contents, mode: src_contents,
-            "Mode": (
-                lambda target_versions, line_length, is_pyi, string_normalization: None
-            ),
-        },
+
+@lru_cache(maxsize=1)
+def _black():
+    """
+    Internal function to import black on first format—not on import of this module, as it is slow to import—falling
+    back to a stand-in that leaves the source as is when black isn't installed
+
+    :return: black, or its stand-in
+    :rtype: ```Module```
+    """
+    return (
+        import_module("black")
+        if find_spec("black") is not None
+        else type(
+            "black",
+            tuple(),
+            {
+                "format_str": lambda src_contents, mode: src_contents,
+                "Mode": (
+                    lambda target_versions, line_length, is_pyi, string_normalization: None
+                ),
+            },
+        )
     )
-)
 
 
 def file(node, filename, mode="a", skip_black=False):
@@ -47,17 +59,20 @@ def file(node, filename, mode="a", skip_black=False):
         node: Module = Module(body=[node], type_ignores=[], stmt=None)
     src: str = cdd.shared.source_transformer.to_code(node)
     if not skip_black:
-        src = black.format_str(
-            src,
-            mode=black.Mode(
-                target_versions=set(),
-                line_length=119,
-                is_pyi=False,
-                string_normalization=False,
-            ),
-        )
-    with open(filename, mode) as f:
+        with cdd.shared.tracing.span("format"):
+            black = _black()
+            src = black.format_str(
+                src,
+                mode=black.Mode(
+                    target_versions=set(),
+                    line_length=119,
+                    is_pyi=False,
+                    string_normalization=False,
+                ),
+            )
+    with cdd.shared.tracing.span("write"), open(filename, mode) as f:
         f.write(src)
+    cdd.shared.tracing.count_write(src)
 
 
 __all__ = ["file"]  # type: list[str]
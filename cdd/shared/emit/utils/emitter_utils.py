@@ -2,9 +2,10 @@
 Functions which produce intermediate_repr from various different inputs
 """
 
-import ast
 from importlib import import_module
 
+from cdd.shared.type_expr_cache import parse_type_expr
+
 
 def get_internal_body(target_name, target_type, intermediate_repr):
     """
@@ -49,8 +50,7 @@ def ast_parse_fix(s):
 
     :return: Value
     """
-    balanced: bool = (s.count("[") + s.count("]")) & 1 == 0
-    return ast.parse(s if balanced else "{}]".format(s)).body[0].value
+    return parse_type_expr(s, fix_unbalanced=True)
 
 
 # def normalise_intermediate_representation(intermediate_repr):
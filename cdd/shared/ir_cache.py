@@ -0,0 +1,292 @@
+"""
+Optional on-disk cache of the IR produced by parsers, and of other results keyed on source (e.g., that `doctrans`
+has nothing to change), shared across processes and CLI invocations.
+
+Enable with `set_ir_cache_dir`, the `CDD_CACHE_DIR` environment variable, or `python -m cdd --cache-dir`.
+"""
+
+import pickle
+from ast import AST, dump
+from functools import wraps
+from hashlib import sha256
+from os import environ, makedirs, path, remove, replace, utime, walk
+from tempfile import NamedTemporaryFile
+from time import time
+
+import cdd
+import cdd.shared.tracing
+from cdd.shared.pure_utils import environ_int
+
+IR_CACHE_DIR = environ.get("CDD_CACHE_DIR") or None  # type: Optional[str]
+IR_CACHE_MAX_BYTES: int = environ_int("CDD_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+
+# Bytes written by this process since the cache was last checked against `IR_CACHE_MAX_BYTES`;
+# `None` so that the first write of every process checks
+_written_since_eviction = None  # type: Optional[int]
+
+# Seconds after which a temporary file—being written by `_write_ir_cache_entry`—is taken to be left by a crash
+_STALE_TEMPORARY_SECONDS: int = 60 * 60
+
+_missing = object()
+
+
+def default_ir_cache_dir():
+    """
+    Default cache directory: `$XDG_CACHE_HOME/cdd`, falling back to `~/.cache/cdd`
+
+    :return: Cache directory
+    :rtype: ```str```
+    """
+    return path.join(
+        environ.get("XDG_CACHE_HOME") or path.join(path.expanduser("~"), ".cache"),
+        "cdd",
+    )
+
+
+def set_ir_cache_dir(cache_dir):
+    """
+    Set—or with None, unset—the directory that parsers cache their IR to
+
+    :param cache_dir: Cache directory, created on first write
+    :type cache_dir: ```Optional[str]```
+    """
+    global IR_CACHE_DIR, _written_since_eviction
+    IR_CACHE_DIR, _written_since_eviction = cache_dir, None
+
+
+def ir_cache_key(parser_name, node, options):
+    """
+    Key the IR of `node` on its contents, the parser, the parser's options, and the cdd version
+
+    :param parser_name: Fully-qualified name of the parser
+    :type parser_name: ```str```
+
+    :param node: AST node or docstring being parsed
+    :type node: ```Any```
+
+    :param options: Any other arguments to the parser
+    :type options: ```tuple```
+
+    :return: Hex digest; None if `node` is neither an AST nor a str (e.g., an in-memory class), so uncacheable
+    :rtype: ```Optional[str]```
+    """
+    if isinstance(node, AST):
+        node_repr: str = dump(node)
+    elif isinstance(node, str):
+        node_repr: str = node
+    else:
+        return None
+    return sha256(
+        repr(
+            (
+                cdd.__version__,
+                parser_name,
+                options,
+                environ.get("DOCTRANS_LINE_LENGTH"),
+                environ.get("DOCTRANS_TAB"),
+                node_repr,
+            )
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def _ir_cache_filepath(cache_dir, key):
+    """
+    Internal function to get the filepath of an entry, sharded by the start of its key under the cdd version
+
+    :param cache_dir: Cache directory
+    :type cache_dir: ```str```
+
+    :param key: Hex digest from `ir_cache_key`
+    :type key: ```str```
+
+    :return: Filepath of the pickled IR
+    :rtype: ```str```
+    """
+    return path.join(
+        cache_dir,
+        cdd.__version__,
+        key[:2],
+        "{key}{extsep}pickle".format(key=key, extsep=path.extsep),
+    )
+
+
+def evict_ir_cache(cache_dir, max_bytes):
+    """
+    Remove the least recently used entries—across every cdd version—until the cache fits in `max_bytes`
+
+    :param cache_dir: Cache directory
+    :type cache_dir: ```str```
+
+    :param max_bytes: Maximum total size of the entries
+    :type max_bytes: ```int```
+    """
+    entries = []  # type: list[tuple[float, int, str]]
+    stale_before: float = time() - _STALE_TEMPORARY_SECONDS
+    for dirpath, _, filenames in walk(cache_dir):
+        for filename in filenames:
+            filepath: str = path.join(dirpath, filename)
+            try:
+                entry = path.getmtime(filepath), path.getsize(filepath), filepath
+                if not filename.endswith(".tmp"):
+                    entries.append(entry)
+                elif entry[0] < stale_before:
+                    # Left by a crash; newer ones may still be mid-write by another process
+                    remove(filepath)
+            except OSError:
+                continue  # Concurrently evicted
+    total_bytes: int = sum(map(lambda entry: entry[1], entries))
+    for _, size, filepath in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        try:
+            remove(filepath)
+        except OSError:
+            pass  # Concurrently evicted
+        total_bytes -= size
+
+
+def _write_ir_cache_entry(filepath, intermediate_repr):
+    """
+    Internal function to atomically write the entry, so concurrent readers & writers only ever see whole entries.
+    Best-effort: the entry isn't written if the cache directory can't be.
+
+    :param filepath: Filepath of the pickled IR
+    :type filepath: ```str```
+
+    :param intermediate_repr: The parser's result
+    :type intermediate_repr: ```Any```
+    """
+    global _written_since_eviction
+    try:
+        contents: bytes = pickle.dumps(
+            intermediate_repr, protocol=pickle.HIGHEST_PROTOCOL
+        )
+    except (AttributeError, TypeError, pickle.PicklingError):
+        return
+    temporary_filepath = None  # type: Optional[str]
+    try:
+        makedirs(path.dirname(filepath), exist_ok=True)
+        with NamedTemporaryFile(
+            "wb", dir=path.dirname(filepath), suffix=".tmp", delete=False
+        ) as f:
+            temporary_filepath = f.name
+            f.write(contents)
+        replace(temporary_filepath, filepath)
+    except OSError:
+        # The cache is optional: a cache directory that can't be written to—or a full disk—mustn't fail the parse
+        if temporary_filepath is not None:
+            try:
+                remove(temporary_filepath)
+            except OSError:
+                pass
+        return
+
+    if (
+        _written_since_eviction is None
+        or _written_since_eviction + len(contents) > IR_CACHE_MAX_BYTES // 16
+    ):
+        evict_ir_cache(IR_CACHE_DIR, IR_CACHE_MAX_BYTES)
+        _written_since_eviction = 0
+    else:
+        _written_since_eviction += len(contents)
+
+
+def get_ir_cache_entry(key, default=None):
+    """
+    Read the entry of `key`, marking it as recently used
+
+    :param key: Hex digest from `ir_cache_key`
+    :type key: ```str```
+
+    :param default: What to return on a miss, or when no cache directory is set
+    :type default: ```Any```
+
+    :return: The cached value (a fresh copy) if hit else `default`
+    :rtype: ```Any```
+    """
+    if IR_CACHE_DIR is None:
+        return default
+    filepath: str = _ir_cache_filepath(IR_CACHE_DIR, key)
+    try:
+        with open(filepath, "rb") as f:
+            value = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        cdd.shared.tracing.count("IR cache misses")
+        return default
+    cdd.shared.tracing.count("IR cache hits")
+    try:
+        utime(filepath)  # Mark as recently used for eviction
+    except OSError:
+        pass  # Concurrently evicted
+    return value
+
+
+def set_ir_cache_entry(key, value):
+    """
+    Write the entry of `key`, if a cache directory is set
+
+    :param key: Hex digest from `ir_cache_key`
+    :type key: ```str```
+
+    :param value: Picklable value, e.g., the IR
+    :type value: ```Any```
+    """
+    if IR_CACHE_DIR is not None:
+        _write_ir_cache_entry(_ir_cache_filepath(IR_CACHE_DIR, key), value)
+
+
+def cached_parser(parser):
+    """
+    Decorate the parser so that—when a cache directory is set—its IR is read from, and written to, disk.
+    Each hit is a fresh copy, so callers may mutate it.
+
+    :param parser: Parser whose first argument is an AST node or docstring
+    :type parser: ```Callable[..., Any]```
+
+    :return: `parser` with caching
+    :rtype: ```Callable[..., Any]```
+    """
+    parser_name: str = ".".join((parser.__module__, parser.__qualname__))
+    node_arg: str = parser.__code__.co_varnames[0]
+
+    @wraps(parser)
+    def _cached_parser(*args, **kwargs):
+        """
+        :return: The IR `parser` gives for its AST node or docstring
+        :rtype: ```Any```
+        """
+        key = (
+            None
+            if IR_CACHE_DIR is None
+            else ir_cache_key(
+                parser_name,
+                args[0] if args else kwargs.get(node_arg),
+                (
+                    args[1:],
+                    sorted(filter(lambda kv: kv[0] != node_arg, kwargs.items())),
+                ),
+            )
+        )  # type: Optional[str]
+        if key is None:
+            return parser(*args, **kwargs)
+        intermediate_repr = get_ir_cache_entry(key, _missing)
+        if intermediate_repr is _missing:
+            intermediate_repr = parser(*args, **kwargs)
+            set_ir_cache_entry(key, intermediate_repr)
+        return intermediate_repr
+
+    return _cached_parser
+
+
+__all__ = [
+    "IR_CACHE_DIR",
+    "IR_CACHE_MAX_BYTES",
+    "cached_parser",
+    "default_ir_cache_dir",
+    "evict_ir_cache",
+    "get_ir_cache_entry",
+    "ir_cache_key",
+    "set_ir_cache_dir",
+    "set_ir_cache_entry",
+]  # type: list[str]
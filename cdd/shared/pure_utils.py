@@ -2,11 +2,12 @@
 Pure utils for pure functions. For the same input will always produce the same input_str.
 """
 
+import re
 import string
 import typing
 from ast import Name
 from collections import deque
-from functools import partial
+from functools import lru_cache, partial
 from importlib import import_module
 from importlib.machinery import ModuleSpec
 from importlib.util import find_spec
@@ -696,7 +697,7 @@ def blockwise(t, size=2, fillvalue=None):
     return zip_longest(*[iter(t)] * abs(size), fillvalue=fillvalue)
 
 
-def location_within(container, iterable, cmp=eq):
+def location_within(container, iterable, cmp=eq, ignore_case=False):
     """
     Finds element within iterable within container
 
@@ -710,9 +711,24 @@ def location_within(container, iterable, cmp=eq):
     :param cmp: Comparator to check input against
     :type cmp: ```Callable[[str, str], bool]```
 
+    :param ignore_case: Compare casefolded, instead of with `cmp`. With a str container and a tuple of str, this
+      searches with one prebuilt `multi_pattern_matcher`.
+    :type ignore_case: ```bool```
+
     :return: (Start index iff found else -1, End index iff found else -1, subset iff found else None)
     :rtype: ```tuple[int, int, Optional[Any]]```
     """
+    if ignore_case:
+        if isinstance(container, str) and isinstance(iterable, tuple):
+            return multi_pattern_matcher(iterable, ignore_case=True)(container)
+        cmp = _casefold_eq
+    if isinstance(container, str) and cmp is eq:
+        # Same result as the general search below, in linear time
+        for elem in iterable:
+            start_idx: int = container.find(elem)
+            if start_idx > -1:
+                return start_idx, start_idx + len(elem), elem
+        return -1, -1, None
     if not hasattr(container, "__len__"):
         container: Tuple[Any] = tuple(container)
     container_len: int = len(container)
@@ -733,6 +749,80 @@ def location_within(container, iterable, cmp=eq):
     return -1, -1, None
 
 
+def _casefold_eq(a, b):
+    """
+    Internal function to compare two str casefolded
+
+    :param a: First str
+    :type a: ```str```
+
+    :param b: Second str
+    :type b: ```str```
+
+    :return: Whether `a` and `b` are equal when casefolded
+    :rtype: ```bool```
+    """
+    return a.casefold() == b.casefold()
+
+
+_NON_ASCII_RE = re.compile("[^\x00-\x7f]")  # type: re.Pattern[str]
+
+
+@lru_cache(maxsize=128)
+def multi_pattern_matcher(patterns, ignore_case=False):
+    """
+    Prebuild one regex alternation of `patterns`, to find them in one pass over a str instead of one per pattern.
+
+    At each offset the regex reports the first of `patterns` starting there, so of all it reports the first in
+    `patterns` order—at its first offset—is what `location_within` finds.
+
+    :param patterns: Patterns to look for, in order of preference
+    :type patterns: ```tuple[str, ...]```
+
+    :param ignore_case: Compare casefolded. Non-ASCII input is searched with `location_within` instead, as
+      casefolding it can differ from how `re.IGNORECASE` matches.
+    :type ignore_case: ```bool```
+
+    :return: Function from a str to what `location_within` would return for it and `patterns`
+    :rtype: ```Callable[[str], tuple[int, int, Optional[str]]]```
+    """
+    if not patterns:
+        return lambda container: (-1, -1, None)
+    cmp = _casefold_eq if ignore_case else eq
+    if ignore_case and any(map(_NON_ASCII_RE.search, patterns)):
+        return partial(location_within, iterable=patterns, cmp=cmp)
+    patterns_re = re.compile(
+        "(?=(?:{alternation}))".format(
+            alternation="|".join(map("({})".format, map(re.escape, patterns)))
+        ),
+        re.IGNORECASE if ignore_case else 0,
+    )  # type: re.Pattern[str]
+
+    def matcher(container):
+        """
+        Find the first of `patterns` within `container`
+
+        :param container: Where to look
+        :type container: ```str```
+
+        :return: (Start index iff found else -1, End index iff found else -1, pattern iff found else None)
+        :rtype: ```tuple[int, int, Optional[str]]```
+        """
+        if ignore_case and _NON_ASCII_RE.search(container) is not None:
+            return location_within(container, patterns, cmp)
+        found_idx, start_idx = len(patterns), -1
+        for match in patterns_re.finditer(container):
+            if match.lastindex - 1 < found_idx:
+                found_idx, start_idx = match.lastindex - 1, match.start()
+                if found_idx == 0:
+                    break
+        if start_idx == -1:
+            return -1, -1, None
+        return start_idx, start_idx + len(patterns[found_idx]), patterns[found_idx]
+
+    return matcher
+
+
 BUILTIN_TYPES: FrozenSet[str] = frozenset(
     chain.from_iterable(
         (
@@ -1228,6 +1318,87 @@ class SetEncoder(JSONEncoder):
         )
 
 
+def environ_int(name, default):
+    """
+    Integer value of the environment variable, falling back to `default` when unset or not an integer
+
+    :param name: Name of the environment variable
+    :type name: ```str```
+
+    :param default: Value when the variable is unset or not an integer
+    :type default: ```int```
+
+    :return: Value of the environment variable
+    :rtype: ```int```
+    """
+    try:
+        return int(environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class ToggleableLruCache(object):
+    """
+    Process-wide LRU cache of a function, that can be enabled—replacing, so emptying, any existing cache—and disabled
+    """
+
+    __slots__ = ("function", "cached")
+
+    def __init__(self, function, environ_name=None, default_maxsize=0):
+        """
+        :param function: Function to cache the results of; its arguments must be hashable
+        :type function: ```Callable[..., Any]```
+
+        :param environ_name: Environment variable setting the initial size, see `environ_int`; 0 leaves it disabled
+        :type environ_name: ```Optional[str]```
+
+        :param default_maxsize: Initial size when `environ_name` is unset or not an integer
+        :type default_maxsize: ```int```
+        """
+        self.function = function
+        self.cached = None  # type: Optional[Callable[..., Any]]
+        maxsize = (
+            default_maxsize
+            if environ_name is None
+            else environ_int(environ_name, default_maxsize)
+        )  # type: int
+        if maxsize > 0:
+            self.enable(maxsize)
+
+    def enable(self, maxsize):
+        """
+        Cache the function's results, replacing—so emptying—any existing cache
+
+        :param maxsize: Number of results to keep; least recently used are evicted first. None is unbounded.
+        :type maxsize: ```Optional[int]```
+        """
+        self.cached = lru_cache(maxsize=maxsize)(self.function)
+
+    def disable(self):
+        """
+        Stop caching the function's results, and release those cached
+        """
+        self.cached = None
+
+    def cache_info(self):
+        """
+        Hit & miss statistics of the cache
+
+        :return: (hits, misses, maxsize, currsize) if the cache is enabled else None
+        :rtype: ```Optional[functools._CacheInfo]```
+        """
+        return None if self.cached is None else self.cached.cache_info()
+
+    def __call__(self, *args, **kwargs):
+        """
+        Call the function, through the cache if enabled
+
+        :return: What the function returns
+        :rtype: ```Any```
+        """
+        return (self.function if self.cached is None else self.cached)(*args, **kwargs)
+
+
 def pascal_to_upper_camelcase(s):
     """
     Transform pascal input to upper camelcase
@@ -1344,6 +1515,7 @@ __all__ = [
     "PY_GTE_3_8",
     "PY_GTE_3_9",
     "SetEncoder",
+    "ToggleableLruCache",
     "all_dunder_for_module",
     "append_to_dict",
     "assert_equal",
@@ -1356,6 +1528,7 @@ __all__ = [
     "diff",
     "emit_separating_tabs",
     "ensure_valid_identifier",
+    "environ_int",
     "filename_from_mod_or_filename",
     "fill",
     "find_module_filepath",
@@ -1365,6 +1538,7 @@ __all__ = [
     "is_ir_empty",
     "is_triple_quoted",
     "location_within",
+    "multi_pattern_matcher",
     "lstrip_namespace",
     "multiline",
     "namespaced_pascal_to_upper_camelcase",
@@ -2,13 +2,28 @@
 Source transformer module. Uses astor on Python < 3.9
 """
 
-from ast import AsyncFunctionDef, ClassDef, FunctionDef, Module, get_docstring, parse
+from ast import (
+    AsyncFunctionDef,
+    ClassDef,
+    FunctionDef,
+    Module,
+    get_docstring,
+    parse,
+)
+from copy import deepcopy
 from importlib import import_module
+from os import path, stat
 from sys import version_info
 from typing import Optional
 
 import cdd.shared.ast_utils
-from cdd.shared.pure_utils import reindent, tab
+import cdd.shared.tracing
+from cdd.shared.pure_utils import (
+    ToggleableLruCache,
+    read_file_to_str,
+    reindent,
+    tab,
+)
 
 unparse = (
     getattr(import_module("astor"), "to_source")
@@ -78,4 +93,140 @@ def ast_parse(
     return parsed_ast
 
 
-__all__ = ["ast_parse", "to_code"]  # type: list[str]
+def _ast_parse_file(
+    realpath, mtime_ns, size, filename, mode, skip_annotate, skip_docstring_remit
+):
+    """
+    Parse the Python file. `realpath`, `mtime_ns`, and `size` are only here to key the parse cache.
+
+    :param realpath: Resolved path of the Python file
+    :type realpath: ```str```
+
+    :param mtime_ns: Modification time of the file in nanoseconds
+    :type mtime_ns: ```int```
+
+    :param size: Size of the file in bytes
+    :type size: ```int```
+
+    :param filename: Filename being parsed
+    :type filename: ```str```
+
+    :param mode: 'exec' to compile a module, 'single' to compile a single (interactive) statement,
+      or 'eval' to compile an expression.
+    :type mode: ```Literal['exec', 'single', 'eval']```
+
+    :param skip_annotate: Don't run `annotate_ancestry`
+    :type skip_annotate: ```bool```
+
+    :param skip_docstring_remit: Don't parse & emit the docstring as a replacement for current docstring
+    :type skip_docstring_remit: ```bool```
+
+    :return: AST node
+    :rtype: ```AST```
+    """
+    cdd.shared.tracing.count("files parsed")
+    with cdd.shared.tracing.span("parse"):
+        return ast_parse(
+            read_file_to_str(realpath),
+            filename=filename,
+            mode=mode,
+            skip_annotate=skip_annotate,
+            skip_docstring_remit=skip_docstring_remit,
+        )
+
+
+# Set `CDD_PARSE_CACHE_SIZE` to enable it from the start
+_parse_cache = ToggleableLruCache(
+    _ast_parse_file, "CDD_PARSE_CACHE_SIZE"
+)  # type: ToggleableLruCache
+
+
+def enable_parse_cache(maxsize=128):
+    """
+    Cache `ast_parse_file` results across the process, keyed by (realpath, mtime, size, parse options).
+    Replaces—so empties—any existing cache.
+
+    :param maxsize: Number of parsed files to keep; least recently used are evicted first. None is unbounded.
+    :type maxsize: ```Optional[int]```
+    """
+    _parse_cache.enable(maxsize)
+
+
+def disable_parse_cache():
+    """
+    Stop caching `ast_parse_file` results, and release those cached
+    """
+    _parse_cache.disable()
+
+
+def parse_cache_info():
+    """
+    Hit & miss statistics of the `ast_parse_file` cache
+
+    :return: (hits, misses, maxsize, currsize) if the cache is enabled else None
+    :rtype: ```Optional[functools._CacheInfo]```
+    """
+    return _parse_cache.cache_info()
+
+
+def ast_parse_file(
+    filename,
+    mode="exec",
+    skip_annotate=False,
+    skip_docstring_remit=False,
+    copy=True,
+):
+    """
+    Read and parse the Python file. Served from the parse cache when enabled, see `enable_parse_cache`.
+
+    :param filename: Filename to parse
+    :type filename: ```str```
+
+    :param mode: 'exec' to compile a module, 'single' to compile a single (interactive) statement,
+      or 'eval' to compile an expression.
+    :type mode: ```Literal['exec', 'single', 'eval']```
+
+    :param skip_annotate: Don't run `annotate_ancestry`
+    :type skip_annotate: ```bool```
+
+    :param skip_docstring_remit: Don't parse & emit the docstring as a replacement for current docstring
+    :type skip_docstring_remit: ```bool```
+
+    :param copy: Whether to return a copy of a cached AST. Only set False if the AST is never mutated.
+    :type copy: ```bool```
+
+    :return: AST node
+    :rtype: ```AST```
+    """
+    if _parse_cache.cached is None:
+        return _ast_parse_file(
+            filename, None, None, filename, mode, skip_annotate, skip_docstring_remit
+        )
+    hits = (
+        _parse_cache.cache_info().hits if cdd.shared.tracing.TRACING else None
+    )  # type: Optional[int]
+    stat_result = stat(filename)
+    parsed_ast = _parse_cache.cached(
+        path.realpath(filename),
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+        filename,
+        mode,
+        skip_annotate,
+        skip_docstring_remit,
+    )
+    if hits is not None:
+        cdd.shared.tracing.count(
+            "parse cache hits", _parse_cache.cache_info().hits - hits
+        )
+    return deepcopy(parsed_ast) if copy else parsed_ast
+
+
+__all__ = [
+    "ast_parse",
+    "ast_parse_file",
+    "disable_parse_cache",
+    "enable_parse_cache",
+    "parse_cache_info",
+    "to_code",
+]  # type: list[str]
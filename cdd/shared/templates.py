@@ -0,0 +1,126 @@
+"""
+Templates emitted at runtime: module headers, preludes, docstrings, and schemas.
+Kept apart from the emitters—and from the test mocks, which reuse them—so as to be cheap to import.
+"""
+
+from ast import AST, parse
+from textwrap import indent
+from typing import List
+
+from cdd.json_schema.utils.shared_utils import JSON_schema
+from cdd.shared.pure_utils import PY_GTE_3_8, identity, tab
+
+imports_header: str = (
+    """
+from {package} import Literal
+from typing import Optional, Tuple, Union
+
+try:
+    import tensorflow as tf
+    import numpy as np
+except ImportError:
+    tf = type('TensorFlow', tuple(), {{ 'data': type('Dataset', tuple(), {{ "Dataset": None }}) }} )
+    np = type('numpy', tuple(), {{ 'ndarray': None, 'empty': lambda _: _ }})
+""".format(
+        package="typing" if PY_GTE_3_8 else "typing_extensions"
+    )
+)
+
+imports_header_ast: List[AST] = parse(imports_header).body
+
+route_prelude: str = (
+    "from bottle import Bottle, request, response\n\n"
+    "rest_api = Bottle(catchall=False, autojson=True)\n"
+)
+
+server_error_schema: JSON_schema = {
+    "$id": "https://offscale.io/error_json.schema.json",
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "description": "Error schema",
+    "type": "object",
+    "properties": {
+        "error": {"description": "Name of the error", "type": "string"},
+        "error_description": {
+            "description": "Description of the error",
+            "type": "string",
+        },
+        "error_code": {
+            "description": "Code of the error (usually is searchable in a KB for further information)",
+            "type": "string",
+        },
+        "status_code": {
+            "description": "Status code (usually for HTTP)",
+            "type": "number",
+        },
+    },
+    "required": ["error", "error_description"],
+}
+
+docstring_repr_str: str = (
+    indent(
+        "\n".join(
+            (
+                "",
+                "Emit a string representation of the current instance",
+                "",
+                ":return: String representation of instance",
+                ":rtype: ```str```",
+                "",
+            )
+        ),
+        tab * 2,
+        identity,
+    )
+    + tab * 2
+)
+
+docstring_create_from_attr_str: str = (
+    indent(
+        "\n".join(
+            (
+                "",
+                "Construct an instance from an object with identical columns (as attributes) as this `class`/`Table`",
+                "",
+                ":return: A new instance made from the input object's attributes",
+                ":rtype: ```self```",
+                "",
+            )
+        ),
+        tab * 2,
+        identity,
+    )
+    + tab * 2
+)
+
+# docstring_repr_google_str = emit.docstring(parse.docstring(docstring_repr_str), docstring_format="google")
+# docstring_repr_google_str = (
+#     "\nConstruct an instance from an object with identical columns (as attributes) as this `class`/`Table`\n\n\n\n\n"
+#     "Returns:\n"
+#     "  self:\n"
+#     "   A new instance made from the input object's attributes\n"
+# )
+
+docstring_create_from_attr_google_str: str = (
+    "\nEmit a string representation of the current instance\n\n\n\n\n"
+    "Returns:\n"
+    "  str:\n"
+    "   String representation of instance\n"
+)
+
+docstring_repr_google_str: str = (
+    "\nEmit a string representation of the current instance\n\n\n\n\n"
+    "Returns:\n"
+    "  str:\n"
+    "   String representation of instance\n"
+)
+
+__all__ = [
+    "docstring_create_from_attr_google_str",
+    "docstring_create_from_attr_str",
+    "docstring_repr_google_str",
+    "docstring_repr_str",
+    "imports_header",
+    "imports_header_ast",
+    "route_prelude",
+    "server_error_schema",
+]  # type: list[str]
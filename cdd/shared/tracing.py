@@ -0,0 +1,368 @@
+"""
+Lightweight instrumentation: named spans around the phases of a run—discovery, parsing, emission, formatting,
+writing—and counters, e.g., of files parsed and bytes written.
+
+Disabled by default, when `span` gives a shared no-op and `count` returns at once. Enable with `enable_tracing`, or
+`python -m cdd --timings` (a summary table) and `--trace-out` (Chrome-trace JSON, for `chrome://tracing` or Perfetto).
+Only this process is traced: work done on a pool of worker processes shows as the span around the pool.
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from json import dump
+from os import getpid
+from threading import get_ident
+from time import perf_counter
+
+TRACING = False  # type: bool
+
+# (name, start in seconds, duration in seconds, thread id) of each completed span, in order of completion
+_spans = []  # type: list[tuple[str, float, float, int]]
+_counters = OrderedDict()  # type: OrderedDict[str, int]
+_start = 0.0  # type: float
+
+
+class _NoSpan(object):
+    """
+    Span that records nothing; what `span` gives when tracing is disabled
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        """
+        Enter the phase, recording nothing
+
+        :return: This span
+        :rtype: ```_NoSpan```
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Exit the phase, recording nothing
+
+        :param exc_type: Type of the exception raised within the phase, if any
+        :type exc_type: ```Optional[type]```
+
+        :param exc_val: Exception raised within the phase, if any
+        :type exc_val: ```Optional[BaseException]```
+
+        :param exc_tb: Traceback of the exception raised within the phase, if any
+        :type exc_tb: ```Optional[TracebackType]```
+
+        :return: None, so any exception propagates
+        :rtype: ```NoneType```
+        """
+        return None
+
+
+class _Span(object):
+    """
+    Span that records its name, start, and duration on exit
+    """
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        """
+        :param name: Name of the phase, e.g., `"parse"`
+        :type name: ```str```
+        """
+        self.name = name
+        self.start = None  # type: Optional[float]
+
+    def __enter__(self):
+        """
+        Enter the phase, starting its timer
+
+        :return: This span
+        :rtype: ```_Span```
+        """
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Exit the phase, recording its name, start, duration, and thread—whether or not it raised
+
+        :param exc_type: Type of the exception raised within the phase, if any
+        :type exc_type: ```Optional[type]```
+
+        :param exc_val: Exception raised within the phase, if any
+        :type exc_val: ```Optional[BaseException]```
+
+        :param exc_tb: Traceback of the exception raised within the phase, if any
+        :type exc_tb: ```Optional[TracebackType]```
+
+        :return: None, so any exception propagates
+        :rtype: ```NoneType```
+        """
+        _spans.append((self.name, self.start, perf_counter() - self.start, get_ident()))
+        return None
+
+
+_no_span = _NoSpan()
+
+
+def span(name):
+    """
+    Time the phase within the `with` block, if tracing is enabled
+
+    :param name: Name of the phase, e.g., `"parse"`; dotted for the phases of a command, e.g., `"exmod.discover"`
+    :type name: ```str```
+
+    :return: Context manager timing the phase; a shared no-op when tracing is disabled
+    :rtype: ```Union[_Span, _NoSpan]```
+    """
+    return _Span(name) if TRACING else _no_span
+
+
+def traced(name):
+    """
+    Decorate the function so each call is timed as the phase `name`, if tracing is enabled
+
+    :param name: Name of the phase, e.g., `"infer_imports"`
+    :type name: ```str```
+
+    :return: Decorator
+    :rtype: ```Callable[[Callable[..., Any]], Callable[..., Any]]```
+    """
+
+    def decorator(function):
+        """
+        :param function: Function to time
+        :type function: ```Callable[..., Any]```
+
+        :return: `function`, timed when tracing is enabled
+        :rtype: ```Callable[..., Any]```
+        """
+
+        @wraps(function)
+        def _traced(*args, **kwargs):
+            """
+            :return: What `function` returns
+            :rtype: ```Any```
+            """
+            if not TRACING:
+                return function(*args, **kwargs)
+            with _Span(name):
+                return function(*args, **kwargs)
+
+        return _traced
+
+    return decorator
+
+
+def add_span(name, seconds):
+    """
+    Record the phase—timed elsewhere, e.g., on a worker process—as ending now, if tracing is enabled
+
+    :param name: Name of the phase, e.g., `"openapi_bulk.parse:models.py"`
+    :type name: ```str```
+
+    :param seconds: How long the phase took
+    :type seconds: ```float```
+    """
+    if TRACING:
+        _spans.append((name, perf_counter() - seconds, seconds, get_ident()))
+
+
+def count(name, n=1):
+    """
+    Add to the counter, if tracing is enabled
+
+    :param name: Name of the counter, e.g., `"files parsed"`
+    :type name: ```str```
+
+    :param n: Amount to add
+    :type n: ```int```
+    """
+    if TRACING:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def count_write(src):
+    """
+    Count the file written—and its bytes, UTF-8 encoded—if tracing is enabled
+
+    :param src: Contents written
+    :type src: ```str```
+    """
+    if TRACING:
+        count("files written")
+        count("bytes written", len(src.encode("utf8")))
+
+
+def enable_tracing():
+    """
+    Start recording spans and counters; forgetting those recorded before
+    """
+    global TRACING, _start
+    _spans.clear()
+    _counters.clear()
+    _start = perf_counter()
+    TRACING = True
+
+
+def disable_tracing():
+    """
+    Stop recording spans and counters; those recorded are kept until tracing is enabled again
+    """
+    global TRACING
+    TRACING = False
+
+
+def save_tracing():
+    """
+    Whether tracing, and what was recorded; to `restore_tracing` after a run that may enable—so reset—tracing
+
+    :return: Whether tracing, its start, and copies of the spans and counters recorded
+    :rtype: ```tuple[bool, float, list[tuple[str, float, float, int]], OrderedDict[str, int]]```
+    """
+    return TRACING, _start, list(_spans), OrderedDict(_counters)
+
+
+def restore_tracing(state):
+    """
+    Restore whether tracing, and what was recorded, to how `save_tracing` found them
+
+    :param state: What `save_tracing` returned
+    :type state: ```tuple[bool, float, list[tuple[str, float, float, int]], OrderedDict[str, int]]```
+    """
+    global TRACING, _start
+    TRACING, _start, spans, counters = state
+    _spans[:] = spans
+    _counters.clear()
+    _counters.update(counters)
+
+
+def tracing_summary():
+    """
+    Table of each phase—its calls, total and mean time—slowest first, then each counter.
+    Times are inclusive: a phase within another counts toward both.
+
+    :return: Summary table; empty if nothing was recorded
+    :rtype: ```str```
+    """
+    phases = OrderedDict()  # type: OrderedDict[str, list[Union[int, float]]]
+    for name, _, seconds, _ in _spans:
+        calls_seconds = phases.setdefault(
+            name, [0, 0.0]
+        )  # type: list[Union[int, float]]
+        calls_seconds[0] += 1
+        calls_seconds[1] += seconds
+    name_width = max(map(len, ("phase", "counter", *phases, *_counters)))  # type: int
+    return "\n".join(
+        (
+            (
+                "{name:<{width}}  {calls:>8}  {total:>10}  {mean:>10}".format(
+                    name="phase",
+                    width=name_width,
+                    calls="calls",
+                    total="total s",
+                    mean="mean ms",
+                ),
+            )
+            if phases
+            else ()
+        )
+        + tuple(
+            map(
+                lambda name_calls_seconds: "{name:<{width}}  {calls:>8d}  {total:>10.3f}  {mean:>10.3f}".format(
+                    name=name_calls_seconds[0],
+                    width=name_width,
+                    calls=name_calls_seconds[1][0],
+                    total=name_calls_seconds[1][1],
+                    mean=name_calls_seconds[1][1] * 1000 / name_calls_seconds[1][0],
+                ),
+                sorted(phases.items(), key=lambda item: item[1][1], reverse=True),
+            )
+        )
+        + (
+            (
+                "{name:<{width}}  {value:>8}".format(
+                    name="counter", width=name_width, value="value"
+                ),
+            )
+            if _counters
+            else ()
+        )
+        + tuple(
+            map(
+                lambda name_value: "{name:<{width}}  {value:>8d}".format(
+                    name=name_value[0], width=name_width, value=name_value[1]
+                ),
+                _counters.items(),
+            )
+        )
+    )
+
+
+def chrome_trace():
+    """
+    The spans and counters recorded, in the Chrome trace event format—for `chrome://tracing` or Perfetto
+
+    :return: Chrome trace, ready to be serialised to JSON
+    :rtype: ```dict```
+    """
+    pid = getpid()  # type: int
+    return {
+        "traceEvents": list(
+            map(
+                lambda name_start_seconds_tid: {
+                    "name": name_start_seconds_tid[0],
+                    "cat": "cdd",
+                    "ph": "X",
+                    "ts": (name_start_seconds_tid[1] - _start) * 1e6,
+                    "dur": name_start_seconds_tid[2] * 1e6,
+                    "pid": pid,
+                    "tid": name_start_seconds_tid[3],
+                },
+                _spans,
+            )
+        )
+        + (
+            [
+                {
+                    "name": "counters",
+                    "cat": "cdd",
+                    "ph": "C",
+                    "ts": (perf_counter() - _start) * 1e6,
+                    "pid": pid,
+                    "args": dict(_counters),
+                }
+            ]
+            if _counters
+            else []
+        ),
+        "displayTimeUnit": "ms",
+    }
+
+
+def write_chrome_trace(filename):
+    """
+    Write the spans and counters recorded to the file, as Chrome-trace JSON, see `chrome_trace`
+
+    :param filename: Path to write the trace to
+    :type filename: ```str```
+    """
+    with open(filename, "wt") as f:
+        dump(chrome_trace(), f)
+
+
+__all__ = [
+    "TRACING",
+    "add_span",
+    "chrome_trace",
+    "count",
+    "count_write",
+    "disable_tracing",
+    "enable_tracing",
+    "restore_tracing",
+    "save_tracing",
+    "span",
+    "traced",
+    "tracing_summary",
+    "write_chrome_trace",
+]  # type: list[str]
@@ -0,0 +1,168 @@
+"""
+Type-expression cache. The same few hundred type strings—`Optional[str]`, `Union[int, float]`, &etc.—are parsed over
+and over when emitting; this parses each once, handing out copies of its expression AST, and the facts derived from it.
+
+Enabled by default; the environment variable `CDD_TYPE_EXPR_CACHE_SIZE` sets its size, 0 disables it.
+"""
+
+import ast
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+
+from cdd.shared.pure_utils import PY_GTE_3_8, ToggleableLruCache
+
+
+class _TypeExpr(object):
+    """
+    Internal class holding a parsed type expression—never to be mutated—and the facts derived from it, once asked for
+    """
+
+    __slots__ = ("node", "pickled", "_names", "_needs_quoting")
+
+    def __init__(self, source):
+        """
+        Parse the type expression
+
+        :param source: Python source of the type expression
+        :type source: ```str```
+        """
+        self.node = ast.parse(source).body[0].value  # type: ast.AST
+        self.pickled = dumps(self.node, protocol=HIGHEST_PROTOCOL)  # type: bytes
+        self._names = None  # type: Optional[frozenset[str]]
+        self._needs_quoting = None  # type: Optional[bool]
+
+    @property
+    def names(self):
+        """
+        :return: Names referenced within the type expression
+        :rtype: ```frozenset[str]```
+        """
+        if self._names is None:
+            self._names = frozenset(
+                node.id for node in ast.walk(self.node) if isinstance(node, ast.Name)
+            )
+        return self._names
+
+    @property
+    def needs_quoting(self):
+        """
+        :return: Whether values with this type need quoting, i.e., it names `str` or has a str constant within
+        :rtype: ```bool```
+        """
+        if self._needs_quoting is None:
+            self._needs_quoting = any(
+                isinstance(node, ast.Constant)
+                and isinstance(node.value, str)
+                or not PY_GTE_3_8
+                and isinstance(node, ast.Str)
+                or isinstance(node, ast.Name)
+                and node.id == "str"
+                for node in ast.walk(self.node)
+            )
+        return self._needs_quoting
+
+
+_type_expr_cache = ToggleableLruCache(
+    _TypeExpr, "CDD_TYPE_EXPR_CACHE_SIZE", 1024
+)  # type: ToggleableLruCache
+
+
+def enable_type_expr_cache(maxsize=1024):
+    """
+    Cache parsed type expressions across the process, keyed by their source.
+    Replaces—so empties—any existing cache.
+
+    :param maxsize: Number of type expressions to keep; least recently used are evicted first. None is unbounded.
+    :type maxsize: ```Optional[int]```
+    """
+    _type_expr_cache.enable(maxsize)
+
+
+def disable_type_expr_cache():
+    """
+    Stop caching parsed type expressions, and release those cached
+    """
+    _type_expr_cache.disable()
+
+
+def type_expr_cache_info():
+    """
+    Hit & miss statistics of the type-expression cache
+
+    :return: (hits, misses, maxsize, currsize) if the cache is enabled else None
+    :rtype: ```Optional[functools._CacheInfo]```
+    """
+    return _type_expr_cache.cache_info()
+
+
+def _type_expr(typ, fix_unbalanced):
+    """
+    Internal function to get the—maybe cached—parsed type expression
+
+    :param typ: Python source of the type expression
+    :type typ: ```str```
+
+    :param fix_unbalanced: Close an unbalanced `[`, as found in PyTorch's docstrings
+    :type fix_unbalanced: ```bool```
+
+    :return: Parsed type expression
+    :rtype: ```_TypeExpr```
+    """
+    if fix_unbalanced and (typ.count("[") + typ.count("]")) & 1:
+        typ = "{typ}]".format(typ=typ)
+    return _type_expr_cache(typ)
+
+
+def parse_type_expr(typ, fix_unbalanced=False, copy=True):
+    """
+    Parse the type expression, like `ast.parse(typ).body[0].value`
+
+    :param typ: Python source of the type expression
+    :type typ: ```str```
+
+    :param fix_unbalanced: Close an unbalanced `[`, as found in PyTorch's docstrings
+    :type fix_unbalanced: ```bool```
+
+    :param copy: Whether to return a copy of a cached AST. Only set False if the AST is never mutated.
+    :type copy: ```bool```
+
+    :return: Expression AST
+    :rtype: ```ast.expr```
+    """
+    type_expr = _type_expr(typ, fix_unbalanced)  # type: _TypeExpr
+    return loads(type_expr.pickled) if copy else type_expr.node
+
+
+def type_expr_names(typ):
+    """
+    Names referenced within the type expression, e.g., `frozenset({"Optional", "str"})` for `Optional[str]`
+
+    :param typ: Python source of the type expression; an unbalanced `[` is closed
+    :type typ: ```str```
+
+    :return: Names referenced within the type expression
+    :rtype: ```frozenset[str]```
+    """
+    return _type_expr(typ, True).names
+
+
+def type_expr_needs_quoting(typ):
+    """
+    Whether values with this type need quoting, i.e., it names `str` or has a str constant within
+
+    :param typ: Python source of the type expression; an unbalanced `[` is closed
+    :type typ: ```str```
+
+    :return: Whether values with this type need quoting
+    :rtype: ```bool```
+    """
+    return _type_expr(typ, True).needs_quoting
+
+
+__all__ = [
+    "disable_type_expr_cache",
+    "enable_type_expr_cache",
+    "parse_type_expr",
+    "type_expr_cache_info",
+    "type_expr_names",
+    "type_expr_needs_quoting",
+]  # type: list[str]
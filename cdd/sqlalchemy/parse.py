@@ -15,6 +15,7 @@ from collections import OrderedDict
 from inspect import getsource
 from typing import Optional
 
+import cdd.shared.ir_cache
 import cdd.shared.parse.utils.parser_utils
 from cdd.docstring.parse import docstring
 from cdd.shared.ast_utils import get_value
@@ -25,6 +26,7 @@ from cdd.sqlalchemy.utils.emit_utils import sqlalchemy_class_to_table
 from cdd.sqlalchemy.utils.parse_utils import column_call_to_param
 
 
+@cdd.shared.ir_cache.cached_parser
 def sqlalchemy_table(call_or_name, parse_original_whitespace=False):
     """
     Parse out a `sqlalchemy.Table`, or a `name = sqlalchemy.Table`, into the IR
@@ -106,6 +108,7 @@ def sqlalchemy_table(call_or_name, parse_original_whitespace=False):
     return intermediate_repr
 
 
+@cdd.shared.ir_cache.cached_parser
 def sqlalchemy(class_def, parse_original_whitespace=False):
     """
     Parse out a `class C(Base): __tablename__=  'tbl'; dataset_name = Column(String, doc="p", primary_key=True)`,
@@ -149,6 +152,7 @@ def sqlalchemy(class_def, parse_original_whitespace=False):
 # Separate function to get a new docstring + as mirror to `emit.sqlalchemy_hybrid`
 
 
+@cdd.shared.ir_cache.cached_parser
 def sqlalchemy_hybrid(class_def, parse_original_whitespace=False):
     """
     Parse out a `class TableName(Base): __table__ = sqlalchemy.Table(name, metadata, Column(…), …)`,
@@ -32,12 +32,13 @@ from ast import (
     comprehension,
     keyword,
 )
-from collections import OrderedDict, deque
+from collections import OrderedDict, deque, namedtuple
+from contextlib import suppress
 from functools import partial
 from itertools import chain, filterfalse
 from json import dumps
 from operator import attrgetter, eq, methodcaller
-from os import path
+from os import path, stat
 from platform import system
 from typing import Any, Dict, List, Optional
 
@@ -51,6 +52,12 @@ from cdd.shared.pure_utils import (
     rpartial,
     tab,
 )
+from cdd.shared.templates import (
+    docstring_create_from_attr_google_str,
+    docstring_create_from_attr_str,
+    docstring_repr_google_str,
+    docstring_repr_str,
+)
 from cdd.shared.types import ParamVal
 from cdd.sqlalchemy.utils.parse_utils import (
     column_type2typ,
@@ -58,12 +65,6 @@ from cdd.sqlalchemy.utils.parse_utils import (
     get_table_name,
     sqlalchemy_top_level_imports,
 )
-from cdd.tests.mocks.docstrings import (
-    docstring_create_from_attr_google_str,
-    docstring_create_from_attr_str,
-    docstring_repr_google_str,
-    docstring_repr_str,
-)
 
 
 def param_to_sqlalchemy_column_calls(name_param, include_name):
@@ -917,30 +918,59 @@ def generate_create_tables_mod(module_name):
     )
 
 
-def update_with_imports_from_columns(filename):
+SqlalchemyModel = namedtuple(
+    "SqlalchemyModel", ("module", "table_name", "primary_key", "primary_key_type")
+)
+
+
+def _is_sqlalchemy_class(node):
     """
-    Given an existing filename, figure out its relative imports
+    Internal function to check whether the node is an SQLalchemy `class`, i.e., one with `Base` as a base
 
-    This is subsequent phase process, and must be preceded by:
-    - All SQLalchemy models being in the same directory as filename
+    :param node: AST node
+    :type node: ```AST```
 
-    It will take:
-    ```py
-    Column(TableName0,
-           ForeignKey("TableName0"),
-           nullable=True)
-    ```
-    …and add this import:
-    ```py
-    from `basename(filename)`.table_name import TableName0
-    ```
+    :return: Whether the node is an SQLalchemy `class`
+    :rtype: ```bool```
+    """
+    return isinstance(node, ClassDef) and any(
+        filter(
+            lambda base: isinstance(base, Name) and base.id == "Base",
+            node.bases,
+        )
+    )
+
+
+def _module_name_of_file(filename):
+    """
+    Internal function to get the module name that phase 1 imports the models of `filename`'s directory from
 
     :param filename: Python filename containing SQLalchemy `class`(es)
     :type filename: ```str```
+
+    :return: Module name, i.e., the basename of the directory of `filename`
+    :rtype: ```str```
+    """
+    return path.basename(path.dirname(filename))
+
+
+def _imports_from_columns(mod, module, models=None):
     """
-    with open(filename, "rt") as f:
-        mod: Module = ast.parse(f.read())
+    Internal function to figure out the imports of the models used as `Column` types, e.g., `Column(TableName0, …)`
+
+    :param mod: Module containing SQLalchemy `class`(es)
+    :type mod: ```Module```
+
+    :param module: Module name that the models are imported from, e.g., basename of the directory of the file
+    :type module: ```str```
 
+    :param models: Symbol table of class name to model; these are imported from where they are, the rest from
+      `module.table_name`
+    :type models: ```Optional[dict[str, SqlalchemyModel]]```
+
+    :return: Imports
+    :rtype: ```Iterator[ImportFrom]```
+    """
     candidates = sorted(
         frozenset(
             filter(
@@ -975,62 +1005,76 @@ def update_with_imports_from_columns(filename):
         )
     )
 
-    module: str = path.basename(path.dirname(filename))
-    mod.body = list(
-        chain.from_iterable(
-            (
-                map(
-                    lambda class_name: ImportFrom(
-                        module=".".join(
-                            (module, namespaced_upper_camelcase_to_pascal(class_name))
-                        ),
-                        names=[
-                            alias(
-                                class_name,
-                                None,
-                                identifier=None,
-                                identifier_name=None,
-                            )
-                        ],
-                        level=0,
-                    ),
-                    candidates,
-                ),
-                mod.body,
-            )
-        )
+    return map(
+        lambda class_name: ImportFrom(
+            module=(
+                models[class_name].module
+                if models is not None and class_name in models
+                else ".".join(
+                    (module, namespaced_upper_camelcase_to_pascal(class_name))
+                )
+            ),
+            names=[
+                alias(
+                    class_name,
+                    None,
+                    identifier=None,
+                    identifier_name=None,
+                )
+            ],
+            level=0,
+        ),
+        candidates,
     )
 
-    with open(filename, "wt") as f:
-        f.write(cdd.shared.source_transformer.to_code(mod))
-
 
-def update_fk_for_file(filename):
+def update_with_imports_from_columns(filename):
     """
-    Given an existing filename, use its imports and to replace its foreign keys with the correct values
+    Given an existing filename, figure out its relative imports
 
     This is subsequent phase process, and must be preceded by:
     - All SQLalchemy models being in the same directory as filename
-    - Correct imports being added
 
-    Then it can transform classes with members like:
+    It will take:
     ```py
-    Column(
-            TableName0,
-            ForeignKey("TableName0"),
-            nullable=True,
-        )
+    Column(TableName0,
+           ForeignKey("TableName0"),
+           nullable=True)
     ```
-    To the following, inferring that the primary key field is `id` by resolving the symbol and `ast.parse`ing it:
+    …and add this import:
     ```py
-    Column(Integer, ForeignKey("table_name0.id"))
+    from `basename(filename)`.table_name import TableName0
     ```
 
-    :param filename: Filename
+    :param filename: Python filename containing SQLalchemy `class`(es)
     :type filename: ```str```
     """
-    with open(filename, "rt") as f:
-        mod: Module = ast.parse(f.read())
+    mod: Module = cdd.shared.source_transformer.ast_parse_file(
+        filename, skip_annotate=True, skip_docstring_remit=True
+    )
+    mod.body = list(
+        chain.from_iterable(
+            (_imports_from_columns(mod, _module_name_of_file(filename)), mod.body)
+        )
+    )
+
+    with open(filename, "wt") as f:
+        f.write(cdd.shared.source_transformer.to_code(mod))
+
+
+def _update_fk_for_module(mod, models=None):
+    """
+    Internal function to use the imports of the module to replace its foreign keys with the correct values
+
+    :param mod: Module containing SQLalchemy `class`(es), and the imports of the models their foreign keys refer to
+    :type mod: ```Module```
+
+    :param models: Symbol table of class name to model; the rest are resolved by parsing the file they're imported from
+    :type models: ```Optional[dict[str, SqlalchemyModel]]```
+
+    :return: Module with foreign keys resolved properly
+    :rtype: ```Module```
+    """
 
     def handle_sqlalchemy_cls(symbol_to_module, sqlalchemy_class_def):
         """
@@ -1048,7 +1092,7 @@ def update_fk_for_file(filename):
         sqlalchemy_class_def.body = list(
             map(
                 lambda outer_node: (
-                    rewrite_fk(symbol_to_module, outer_node)
+                    rewrite_fk(symbol_to_module, outer_node, models=models)
                     if isinstance(outer_node, Assign)
                     and isinstance(outer_node.value, Call)
                     and isinstance(outer_node.value.func, Name)
@@ -1089,24 +1133,206 @@ def update_fk_for_file(filename):
         map(
             lambda node: (
                 handle_sqlalchemy_cls(symbol2module, node)
-                if isinstance(node, ClassDef)
-                and any(
-                    filter(
-                        lambda base: isinstance(base, Name) and base.id == "Base",
-                        node.bases,
-                    )
-                )
+                if _is_sqlalchemy_class(node)
                 else node
             ),
             mod.body,
         )
     )
+    return mod
+
+
+def update_fk_for_file(filename):
+    """
+    Given an existing filename, use its imports and to replace its foreign keys with the correct values
+
+    This is subsequent phase process, and must be preceded by:
+    - All SQLalchemy models being in the same directory as filename
+    - Correct imports being added
+
+    Then it can transform classes with members like:
+    ```py
+    Column(
+            TableName0,
+            ForeignKey("TableName0"),
+            nullable=True,
+        )
+    ```
+    To the following, inferring that the primary key field is `id` by resolving the symbol and `ast.parse`ing it:
+    ```py
+    Column(Integer, ForeignKey("table_name0.id"))
+    ```
+
+    Each call is a run of its own: the models it resolves are cached only until the next, see
+    `clear_sqlalchemy_model_cache`.
+
+    :param filename: Filename
+    :type filename: ```str```
+    """
+    clear_sqlalchemy_model_cache()
+    mod: Module = _update_fk_for_module(
+        cdd.shared.source_transformer.ast_parse_file(
+            filename, skip_annotate=True, skip_docstring_remit=True
+        )
+    )
 
     with open(filename, "wt") as f:
         f.write(cdd.shared.source_transformer.to_code(mod))
 
 
-def rewrite_fk(symbol_to_module, column_assign):
+def sqlalchemy_models(filename_to_module):
+    """
+    Symbol table of every SQLalchemy model—with a primary key—within the modules
+
+    :param filename_to_module: Filename to its module containing SQLalchemy `class`(es)
+    :type filename_to_module: ```dict[str, Module]```
+
+    :return: Class name to model, i.e., the module it is imported from, its table name, primary key, and its type
+    :rtype: ```dict[str, SqlalchemyModel]```
+    """
+    models = {}  # type: dict[str, SqlalchemyModel]
+    for filename, mod in filename_to_module.items():
+        module: str = ".".join(
+            (
+                _module_name_of_file(filename),
+                path.splitext(path.basename(filename))[0],
+            )
+        )
+        for class_def in filter(_is_sqlalchemy_class, mod.body):
+            pk_typ = get_pk_and_type(class_def)  # type: Optional[tuple[str, str]]
+            if pk_typ is not None:
+                models.setdefault(
+                    class_def.name,
+                    SqlalchemyModel(
+                        module=module,
+                        table_name=get_table_name(class_def),
+                        primary_key=pk_typ[0],
+                        primary_key_type=pk_typ[1],
+                    ),
+                )
+    return models
+
+
+# (module, class name) to (filepath, its mtime in nanoseconds, its size, model); emptied at the start of each run—
+# `update_fk_for_file` or `update_imports_and_fks`—as which file a module resolves to may differ between runs
+_sqlalchemy_model_cache = {}  # type: dict[tuple[str, str], tuple]
+
+
+def resolve_sqlalchemy_model(module, class_name):
+    """
+    Resolve the SQLalchemy model `class_name` of `module` to its table name, primary key and its type.
+    Cached per (module, class) for the run, until its file changes; so the many foreign keys to one model find &
+    parse it once.
+
+    :param module: Module name, like `"models.user"`
+    :type module: ```str```
+
+    :param class_name: Name of the SQLalchemy `class` within `module`
+    :type class_name: ```str```
+
+    :return: Model, i.e., the module, its table name, primary key, and its type
+    :rtype: ```SqlalchemyModel```
+    """
+    cached = _sqlalchemy_model_cache.get(
+        (module, class_name)
+    )  # type: Optional[tuple[str, int, int, SqlalchemyModel]]
+    if cached is not None:
+        with suppress(OSError):
+            stat_result = stat(cached[0])
+            if (stat_result.st_mtime_ns, stat_result.st_size) == cached[1:3]:
+                return cached[3]
+    filepath: str = find_module_filepath(module, class_name)
+    stat_result = stat(filepath)
+    matching_class: ClassDef = next(
+        filter(
+            lambda node: isinstance(node, ClassDef) and node.name == class_name,
+            cdd.shared.source_transformer.ast_parse_file(
+                filepath,
+                skip_annotate=True,
+                skip_docstring_remit=True,
+                copy=False,
+            ).body,
+        )
+    )
+    pk_typ = get_pk_and_type(matching_class)  # type: tuple[str, str]
+    assert pk_typ is not None
+    model: SqlalchemyModel = SqlalchemyModel(
+        module=module,
+        table_name=get_table_name(matching_class),
+        primary_key=pk_typ[0],
+        primary_key_type=pk_typ[1],
+    )
+    _sqlalchemy_model_cache[(module, class_name)] = (
+        filepath,
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+        model,
+    )
+    return model
+
+
+def clear_sqlalchemy_model_cache():
+    """
+    Forget the models `resolve_sqlalchemy_model` cached; called at the start of each run
+    """
+    _sqlalchemy_model_cache.clear()
+
+
+def update_imports_and_fks(filename_to_module):
+    """
+    Phases 1 & 2 fused: add the imports of the models used as `Column` types, then resolve their foreign keys—as
+    `update_with_imports_from_columns` then `update_fk_for_file` would—for every module, in memory.
+    Foreign keys to models within the modules are resolved from their symbol table; not by parsing their files.
+
+    :param filename_to_module: Filename to its module containing SQLalchemy `class`(es). Modified in place.
+    :type filename_to_module: ```dict[str, Module]```
+
+    :return: `filename_to_module`, with the imports added and foreign keys resolved
+    :rtype: ```dict[str, Module]```
+    """
+    clear_sqlalchemy_model_cache()
+    models = sqlalchemy_models(filename_to_module)  # type: dict[str, SqlalchemyModel]
+    for filename, mod in filename_to_module.items():
+        mod.body = list(
+            chain.from_iterable(
+                (
+                    _imports_from_columns(
+                        mod, _module_name_of_file(filename), models=models
+                    ),
+                    mod.body,
+                )
+            )
+        )
+        _update_fk_for_module(mod, models=models)
+    return filename_to_module
+
+
+def update_imports_and_fks_for_files(filenames):
+    """
+    Phases 1 & 2 fused over existing files: each is parsed once, has the imports of the models it uses added and its
+    foreign keys resolved—against the models of all `filenames`, in memory—then is written once.
+
+    :param filenames: Python filenames containing SQLalchemy `class`(es)
+    :type filenames: ```Iterable[str]```
+    """
+    for filename, mod in update_imports_and_fks(
+        OrderedDict(
+            map(
+                lambda filename: (
+                    filename,
+                    cdd.shared.source_transformer.ast_parse_file(
+                        filename, skip_annotate=True, skip_docstring_remit=True
+                    ),
+                ),
+                filenames,
+            )
+        )
+    ).items():
+        with open(filename, "wt") as f:
+            f.write(cdd.shared.source_transformer.to_code(mod))
+
+
+def rewrite_fk(symbol_to_module, column_assign, models=None):
     """
     Rewrite of the form:
     ```py
@@ -1127,6 +1353,9 @@ def rewrite_fk(symbol_to_module, column_assign):
     :param column_assign: `column_name = Column()` in SQLalchemy with unresolved foreign key
     :type column_assign: ```Assign```
 
+    :param models: Symbol table of class name to model, to resolve from instead of parsing the file imported from
+    :type models: ```Optional[dict[str, SqlalchemyModel]]```
+
     :return: `Assign()` in SQLalchemy with resolved foreign key
     :rtype: ```Assign```
     """
@@ -1162,29 +1391,16 @@ def rewrite_fk(symbol_to_module, column_assign):
             code=cdd.shared.source_transformer.to_code(foreign_key_call).rstrip()
         )
         if column_name.id in symbol_to_module:
-            with open(
-                find_module_filepath(symbol_to_module[column_name.id], column_name.id),
-                "rt",
-            ) as f:
-                mod: Module = ast.parse(f.read())
-            matching_class: ClassDef = next(
-                filter(
-                    lambda node: isinstance(node, ClassDef)
-                    and node.name == column_name.id,
-                    mod.body,
+            table_name, pk, typ = (
+                models[column_name.id]
+                if models is not None and column_name.id in models
+                else resolve_sqlalchemy_model(
+                    symbol_to_module[column_name.id], column_name.id
                 )
-            )
-            pk_typ = get_pk_and_type(matching_class)  # type: tuple[str, str]
-            assert pk_typ is not None
-            pk, typ = pk_typ
-            del pk_typ
+            )[1:]
             return Name(typ, Load(), lineno=None, col_offset=None), Call(
                 func=Name("ForeignKey", Load(), lineno=None, col_offset=None),
-                args=[
-                    cdd.shared.ast_utils.set_value(
-                        ".".join((get_table_name(matching_class), pk))
-                    )
-                ],
+                args=[cdd.shared.ast_utils.set_value(".".join((table_name, pk)))],
                 keywords=[],
                 lineno=None,
                 col_offset=None,
@@ -1463,6 +1679,8 @@ typ2column_type.update(
 )
 
 __all__ = [
+    "SqlalchemyModel",
+    "clear_sqlalchemy_model_cache",
     "ensure_has_primary_key",
     "generate_create_from_attr_staticmethod",
     "generate_create_tables_mod",
@@ -1470,10 +1688,14 @@ __all__ = [
     "mock_engine_base_metadata_mod",
     "mock_engine_base_metadata_str",
     "param_to_sqlalchemy_column_calls",
+    "resolve_sqlalchemy_model",
     "rewrite_fk",
     "sqlalchemy_class_to_table",
+    "sqlalchemy_models",
     "sqlalchemy_table_to_class",
     "typ2column_type",
     "update_fk_for_file",
+    "update_imports_and_fks",
+    "update_imports_and_fks_for_files",
     "update_with_imports_from_columns",
 ]  # type: list[str]
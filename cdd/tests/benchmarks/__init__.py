@@ -0,0 +1,6 @@
+"""
+Benchmarks, run each as a module, e.g., `python -m cdd.tests.benchmarks.bench_cst`; or all of them on synthetic
+corpora, with `python -m cdd.tests.benchmarks.bench_suite`, comparing against a baseline with
+`python -m cdd.tests.benchmarks.compare`.
+Not prefixed with test_ so that unittest discover skips them.
+"""
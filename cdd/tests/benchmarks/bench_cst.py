@@ -0,0 +1,93 @@
+"""
+Benchmark `cdd.shared.cst.cst_parse` on synthetic multi-thousand-line files.
+
+    $ python -m cdd.tests.benchmarks.bench_cst [lines ...]
+"""
+
+from sys import argv
+from timeit import repeat
+
+from cdd.shared.cst import cst_parse
+from cdd.shared.pure_utils import tab
+
+
+def generate_source(lines):
+    """
+    Generate Python source of about `lines` lines: functions with long docstrings, and a large dict literal
+
+    :param lines: Approximate number of lines to generate
+    :type lines: ```int```
+
+    :return: Python source
+    :rtype: ```str```
+    """
+    functions = "\n\n".join(
+        map(
+            lambda i: "\n".join(
+                (
+                    "def f{i}(a, b=5):".format(i=i),
+                    '{tab}"""'.format(tab=tab),
+                    "{tab}Function {i}\n".format(tab=tab, i=i),
+                    "\n".join(
+                        "{tab}:param a{j}: The a{j}, see `f{i}`\n".format(
+                            tab=tab, i=i, j=j
+                        )
+                        for j in range(10)
+                    ),
+                    '{tab}"""'.format(tab=tab),
+                    "{tab}return a + b\n".format(tab=tab),
+                )
+            ),
+            range(lines // 50),
+        )
+    )
+    literal = "mapping = {{\n{items}}}\n".format(
+        items="".join(
+            '{tab}"key{i}": ({i}, [{i}, "{i}"]),\n'.format(tab=tab, i=i)
+            for i in range(lines // 2)
+        )
+    )
+    return "\n\n".join((functions, literal))
+
+
+def bench_cst_parse(lines, number=3):
+    """
+    Time `cst_parse` on a generated source of about `lines` lines
+
+    :param lines: Approximate number of lines to generate
+    :type lines: ```int```
+
+    :param number: Number of timed runs, the fastest is reported
+    :type number: ```int```
+
+    :return: (number of lines, fastest time in seconds)
+    :rtype: ```tuple[int, float]```
+    """
+    source: str = generate_source(lines)
+    return source.count("\n"), min(
+        repeat(lambda: cst_parse(source), number=1, repeat=number)
+    )
+
+
+def main(line_counts=(1000, 2000, 4000, 8000)):
+    """
+    Print the time `cst_parse` takes on each of `line_counts`; linear time means time per line stays flat
+
+    :param line_counts: Approximate numbers of lines to generate
+    :type line_counts: ```Iterable[int]```
+    """
+    for lines in line_counts:
+        line_count, seconds = bench_cst_parse(lines)
+        print(
+            "cst_parse\t{line_count:>6} lines\t{seconds:.3f}s\t{per_line:.1f}µs/line".format(
+                line_count=line_count,
+                seconds=seconds,
+                per_line=seconds / line_count * 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(tuple(map(int, argv[1:])) or (1000, 2000, 4000, 8000))
+
+__all__ = ["bench_cst_parse", "generate_source", "main"]  # type: list[str]
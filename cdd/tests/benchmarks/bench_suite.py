@@ -0,0 +1,524 @@
+"""
+Benchmark `exmod`, `gen`, `doctrans`, `cst_parse`, `parse_docstring`, `ground_truth`, and `openapi_bulk` on synthetic
+corpora (see `cdd.tests.benchmarks.corpora`)—and the startup of `python -m cdd`—optionally saving the fastest time of
+each as a JSON baseline.
+
+    $ python -m cdd.tests.benchmarks.bench_suite [--scale N] [--number N] [-o baseline.json] [benchmark ...]
+
+Compare a run against a baseline with `python -m cdd.tests.benchmarks.compare`.
+"""
+
+import sys
+from argparse import ArgumentParser, Namespace
+from collections import OrderedDict
+from contextlib import redirect_stderr, redirect_stdout
+from functools import partial
+from json import dump
+from os import devnull, makedirs, path
+from platform import platform, python_version
+from shutil import copy, rmtree
+from subprocess import run as run_process
+from tempfile import TemporaryDirectory
+from timeit import repeat
+
+import cdd.argparse_function.parse
+import cdd.class_.emit
+import cdd.compound.openapi.utils.emit_utils  # Before `cdd.sqlalchemy`, so this imports alone
+import cdd.function.emit
+from cdd import __version__
+from cdd.compound.doctrans import doctrans_files
+from cdd.compound.exmod import exmod
+from cdd.compound.gen import gen
+from cdd.compound.openapi.gen_openapi import openapi_bulk
+from cdd.shared.conformance import ground_truth
+from cdd.shared.cst import cst_parse
+from cdd.shared.docstring_parsers import parse_docstring
+from cdd.shared.emit.file import file
+from cdd.shared.pure_utils import INIT_FILENAME
+from cdd.shared.source_transformer import ast_parse_file
+from cdd.tests.benchmarks.bench_cst import generate_source
+from cdd.tests.benchmarks.corpora import (
+    DOCSTRING_FORMATS,
+    generate_argparse_function,
+    generate_function,
+    generate_module,
+    generate_routes,
+    generate_sqlalchemy_models,
+    write_package,
+)
+
+
+def _py(directory, name):
+    """
+    Internal function to join the directory and module name, with the Python extension
+
+    :param directory: Directory
+    :type directory: ```str```
+
+    :param name: Module name
+    :type name: ```str```
+
+    :return: Filepath of the module
+    :rtype: ```str```
+    """
+    return path.join(
+        directory, "{name}{extsep}py".format(name=name, extsep=path.extsep)
+    )
+
+
+def _write(filename, source):
+    """
+    Internal function to write the source to the file
+
+    :param filename: Filepath
+    :type filename: ```str```
+
+    :param source: Contents to write
+    :type source: ```str```
+
+    :return: `filename`
+    :rtype: ```str```
+    """
+    with open(filename, "wt") as f:
+        f.write(source)
+    return filename
+
+
+def _restore(originals):
+    """
+    Internal function to make a callable restoring each file from its original, so each timed run starts afresh
+
+    :param originals: Original filepath to the filepath it is copied to
+    :type originals: ```dict[str, str]```
+
+    :return: Function copying each original over its copy
+    :rtype: ```Callable[[], None]```
+    """
+
+    def reset():
+        """
+        Copy each original over its copy
+        """
+        for original, to in originals.items():
+            copy(original, to)
+
+    return reset
+
+
+def prepare_exmod(directory, scale):
+    """
+    Write a package per docstring style—2 modules of `10 * scale` classes and functions each—for `exmod` to expose
+
+    :param directory: Empty directory to write the corpus within
+    :type directory: ```str```
+
+    :param scale: Multiplier of the size of the corpus
+    :type scale: ```int```
+
+    :return: Function running the benchmark, and function resetting for the next run
+    :rtype: ```tuple[Callable[[], Any], Callable[[], None]]```
+    """
+    for docstring_format in DOCSTRING_FORMATS:
+        write_package(
+            directory,
+            "bench_{}".format(docstring_format),
+            docstring_format,
+            modules=2,
+            classes=10 * scale,
+            functions=10 * scale,
+        )
+    output_directory: str = path.join(directory, "out")
+
+    def run():
+        """
+        Expose each package, as classes
+        """
+        sys.path.insert(0, directory)
+        try:
+            for docstring_format in DOCSTRING_FORMATS:
+                exmod(
+                    emit_name="class",
+                    module="bench_{}".format(docstring_format),
+                    blacklist=tuple(),
+                    whitelist=tuple(),
+                    output_directory=path.join(output_directory, docstring_format),
+                    target_module_name="gold_{}".format(docstring_format),
+                    mock_imports=False,
+                    emit_sqlalchemy_submodule=False,
+                    extra_modules=None,
+                    no_word_wrap=None,
+                    recursive=False,
+                    dry_run=False,
+                )
+        finally:
+            sys.path.remove(directory)
+
+    return run, lambda: rmtree(output_directory, ignore_errors=True)
+
+
+def prepare_gen(directory, scale):
+    """
+    Write a module per docstring style—of `50 * scale` classes and functions—for `gen` to convert to classes
+
+    :param directory: Empty directory to write the corpus within
+    :type directory: ```str```
+
+    :param scale: Multiplier of the size of the corpus
+    :type scale: ```int```
+
+    :return: Function running the benchmark, and function resetting for the next run
+    :rtype: ```tuple[Callable[[], Any], Callable[[], None]]```
+    """
+    filenames = tuple(
+        _write(
+            _py(directory, docstring_format),
+            generate_module(docstring_format, 0, 50 * scale, 50 * scale)[0],
+        )
+        for docstring_format in DOCSTRING_FORMATS
+    )  # type: tuple[str, ...]
+    output_filename: str = _py(directory, "out")
+
+    def run():
+        """
+        Convert the classes and functions of each module to classes
+        """
+        for filename in filenames:
+            gen(
+                name_tpl="{name}Config",
+                input_mapping=filename,
+                parse_name="infer",
+                emit_name="class",
+                output_filename=output_filename,
+            )
+
+    return run, lambda: None
+
+
+def prepare_doctrans(directory, scale):
+    """
+    Write a module per docstring style—of `50 * scale` classes and functions—for `doctrans` to restyle
+
+    :param directory: Empty directory to write the corpus within
+    :type directory: ```str```
+
+    :param scale: Multiplier of the size of the corpus
+    :type scale: ```int```
+
+    :return: Function running the benchmark, and function resetting for the next run
+    :rtype: ```tuple[Callable[[], Any], Callable[[], None]]```
+    """
+    originals = OrderedDict(
+        (
+            _write(
+                _py(directory, "original_{}".format(docstring_format)),
+                generate_module(docstring_format, 0, 50 * scale, 50 * scale)[0],
+            ),
+            _py(directory, docstring_format),
+        )
+        for docstring_format in DOCSTRING_FORMATS
+    )  # type: OrderedDict[str, str]
+
+    def run():
+        """
+        Convert each module to the next docstring style
+        """
+        for i, filename in enumerate(originals.values()):
+            doctrans_files(
+                [filename],
+                docstring_format=DOCSTRING_FORMATS[(i + 1) % len(DOCSTRING_FORMATS)],
+                type_annotations=True,
+                no_word_wrap=None,
+            )
+
+    return run, _restore(originals)
+
+
+def prepare_cst_parse(directory, scale):
+    """
+    Generate a source of `4000 * scale` lines for `cst_parse`, see `cdd.tests.benchmarks.bench_cst`
+
+    :param directory: Empty directory to write the corpus within; unused, the source is kept in memory
+    :type directory: ```str```
+
+    :param scale: Multiplier of the size of the corpus
+    :type scale: ```int```
+
+    :return: Function running the benchmark, and function resetting for the next run
+    :rtype: ```tuple[Callable[[], Any], Callable[[], None]]```
+    """
+    source: str = generate_source(4000 * scale)
+    return lambda: cst_parse(source), lambda: None
+
+
+def prepare_parse_docstring(directory, scale):
+    """
+    Generate `500 * scale` function docstrings per docstring style for `parse_docstring`
+
+    :param directory: Empty directory to write the corpus within; unused, the docstrings are kept in memory
+    :type directory: ```str```
+
+    :param scale: Multiplier of the size of the corpus
+    :type scale: ```int```
+
+    :return: Function running the benchmark, and function resetting for the next run
+    :rtype: ```tuple[Callable[[], Any], Callable[[], None]]```
+    """
+    docstrings = tuple(
+        generate_function(docstring_format, i).partition('"""')[2].partition('"""')[0]
+        for docstring_format in DOCSTRING_FORMATS
+        for i in range(500 * scale)
+    )  # type: tuple[str, ...]
+    return lambda: list(map(parse_docstring, docstrings)), lambda: None
+
+
+def prepare_ground_truth(directory, scale):
+    """
+    Write an argparse function of `200 * scale` arguments, and the class and function it was generated from when it
+    had half of those, for `ground_truth` to conform
+
+    :param directory: Empty directory to write the corpus within
+    :type directory: ```str```
+
+    :param scale: Multiplier of the size of the corpus
+    :type scale: ```int```
+
+    :return: Function running the benchmark, and function resetting for the next run
+    :rtype: ```tuple[Callable[[], Any], Callable[[], None]]```
+    """
+    argparse_filename: str = _write(
+        _py(directory, "argparse"), generate_argparse_function(200 * scale)
+    )
+    stale_ir: dict = cdd.argparse_function.parse.argparse_ast(
+        ast_parse_file(
+            _write(
+                _py(directory, "stale_argparse"),
+                generate_argparse_function(100 * scale),
+            )
+        ).body[0]
+    )
+    originals = OrderedDict()  # type: OrderedDict[str, str]
+    for name, emit in (
+        ("class", partial(cdd.class_.emit.class_, class_name="ConfigClass")),
+        (
+            "function",
+            partial(
+                cdd.function.emit.function,
+                function_name="set_cli_args",
+                function_type="static",
+            ),
+        ),
+    ):
+        stale_filename: str = _py(directory, "stale_{}".format(name))
+        file(
+            emit(stale_ir, emit_default_doc=False),
+            filename=stale_filename,
+            mode="wt",
+            skip_black=False,
+        )
+        originals[stale_filename] = _py(directory, name)
+    args = Namespace(
+        argparse_functions=[argparse_filename],
+        argparse_function_names=["set_cli_args"],
+        classes=[originals[_py(directory, "stale_class")]],
+        class_names=["ConfigClass"],
+        functions=[originals[_py(directory, "stale_function")]],
+        function_names=["set_cli_args"],
+        truth="argparse_function",
+        no_word_wrap=None,
+    )  # type: Namespace
+    return lambda: ground_truth(args, argparse_filename), _restore(originals)
+
+
+def prepare_openapi_bulk(directory, scale):
+    """
+    Write 4 model files—of `25 * scale` SQLalchemy tables each, with dense foreign keys—and their bottle route files,
+    for `openapi_bulk`
+
+    :param directory: Empty directory to write the corpus within
+    :type directory: ```str```
+
+    :param scale: Multiplier of the size of the corpus
+    :type scale: ```int```
+
+    :return: Function running the benchmark, and function resetting for the next run
+    :rtype: ```tuple[Callable[[], Any], Callable[[], None]]```
+    """
+    open(path.join(directory, INIT_FILENAME), "a").close()
+    model_paths = tuple(
+        _write(
+            _py(directory, "models{}".format(m)),
+            generate_sqlalchemy_models(25 * scale, start=m * 25 * scale),
+        )
+        for m in range(4)
+    )  # type: tuple[str, ...]
+    routes_paths = tuple(
+        _write(
+            _py(directory, "routes{}".format(m)),
+            generate_routes(25 * scale, start=m * 25 * scale),
+        )
+        for m in range(4)
+    )  # type: tuple[str, ...]
+    return (
+        lambda: openapi_bulk(
+            app_name="rest_api", model_paths=model_paths, routes_paths=routes_paths
+        ),
+        lambda: None,
+    )
+
+
+def prepare_cli_import(directory, scale):
+    """
+    Import `cdd.__main__`—what `python -m cdd` imports to parse its arguments—in a fresh interpreter
+
+    :param directory: Empty directory to write the corpus within; unused, there is no corpus
+    :type directory: ```str```
+
+    :param scale: Multiplier of the size of the corpus; unused, there is no corpus
+    :type scale: ```int```
+
+    :return: Function running the benchmark, and function resetting for the next run
+    :rtype: ```tuple[Callable[[], Any], Callable[[], None]]```
+    """
+    return (
+        lambda: run_process(
+            [sys.executable, "-c", "import cdd.__main__"],
+            cwd=path.dirname(path.dirname(cdd.__file__)),
+            check=True,
+        ),
+        lambda: None,
+    )
+
+
+BENCHMARKS = OrderedDict(
+    (
+        ("exmod", prepare_exmod),
+        ("gen", prepare_gen),
+        ("doctrans", prepare_doctrans),
+        ("cst_parse", prepare_cst_parse),
+        ("parse_docstring", prepare_parse_docstring),
+        ("ground_truth", prepare_ground_truth),
+        ("openapi_bulk", prepare_openapi_bulk),
+        ("cli_import", prepare_cli_import),
+    )
+)  # type: OrderedDict[str, Callable[[str, int], tuple[Callable[[], Any], Callable[[], None]]]]
+
+
+def run_benchmarks(names=tuple(BENCHMARKS), scale=1, number=3):
+    """
+    Time each benchmark on its synthetic corpus, written to a temporary directory
+
+    :param names: Names of the benchmarks to run, see `BENCHMARKS`
+    :type names: ```Iterable[str]```
+
+    :param scale: Multiplier of the size of each corpus
+    :type scale: ```int```
+
+    :param number: Number of timed runs of each benchmark, the fastest is reported
+    :type number: ```int```
+
+    :return: Name of each benchmark to its fastest time, in seconds
+    :rtype: ```OrderedDict[str, float]```
+    """
+    timings = OrderedDict()  # type: OrderedDict[str, float]
+    for name in names:
+        with TemporaryDirectory() as temp_dir:
+            directory: str = path.join(temp_dir, name)
+            makedirs(directory)
+            with open(devnull, "wt") as null, redirect_stdout(null), redirect_stderr(
+                null
+            ):  # What the commands print, e.g., per-file summaries, isn't wanted here
+                run, reset = BENCHMARKS[name](directory, scale)
+                timings[name] = min(repeat(run, setup=reset, number=1, repeat=number))
+    return timings
+
+
+def _build_parser():
+    """
+    Parser for the command-line interface
+
+    :return: Parser of the CLI arguments
+    :rtype: ```ArgumentParser```
+    """
+    parser = ArgumentParser(
+        prog="python -m cdd.tests.benchmarks.bench_suite",
+        description="Benchmark cdd on synthetic corpora.",
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        metavar="benchmark",
+        help="Benchmarks to run, of: {}. Defaults to all.".format(
+            ", ".join(BENCHMARKS)
+        ),
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        help="Multiplier of the size of each corpus; 20 generates thousands of classes and functions.",
+    )
+    parser.add_argument(
+        "--number",
+        type=int,
+        default=3,
+        help="Number of timed runs of each benchmark, the fastest is reported.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Write the results to this JSON file, e.g., as a baseline to `compare` against.",
+    )
+    return parser
+
+
+def main(cli_argv=None):
+    """
+    Run the benchmarks, printing the fastest time of each; and writing them—with the cdd version, Python version,
+    platform, and scale—as JSON, if `--output` is given
+
+    :param cli_argv: CLI arguments. If None uses `sys.argv`.
+    :type cli_argv: ```Optional[list[str]]```
+
+    :return: Results, as written to `--output`
+    :rtype: ```dict```
+    """
+    parser: ArgumentParser = _build_parser()
+    args: Namespace = parser.parse_args(cli_argv)
+    unknown = sorted(frozenset(args.names) - frozenset(BENCHMARKS))  # type: list[str]
+    if unknown:
+        parser.error("unknown benchmark(s): {}".format(", ".join(unknown)))
+    timings = OrderedDict()  # type: OrderedDict[str, float]
+    for name in args.names or BENCHMARKS:
+        timings.update(run_benchmarks((name,), scale=args.scale, number=args.number))
+        print("{name:<16}{seconds:10.3f}s".format(name=name, seconds=timings[name]))
+    results = {
+        "cdd": __version__,
+        "python": python_version(),
+        "platform": platform(),
+        "scale": args.scale,
+        "number": args.number,
+        "benchmarks": timings,
+    }  # type: dict
+    if args.output is not None:
+        with open(args.output, "wt") as f:
+            dump(results, f, indent=4)
+            f.write("\n")
+    return results
+
+
+if __name__ == "__main__":
+    main()
+
+__all__ = [
+    "BENCHMARKS",
+    "main",
+    "prepare_cli_import",
+    "prepare_cst_parse",
+    "prepare_doctrans",
+    "prepare_exmod",
+    "prepare_gen",
+    "prepare_ground_truth",
+    "prepare_openapi_bulk",
+    "prepare_parse_docstring",
+    "run_benchmarks",
+]  # type: list[str]
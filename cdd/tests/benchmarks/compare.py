@@ -0,0 +1,116 @@
+"""
+Compare benchmark results—as written by `python -m cdd.tests.benchmarks.bench_suite -o`—against a baseline, exiting
+non-zero if any benchmark is slower than the baseline by more than the threshold.
+
+    $ python -m cdd.tests.benchmarks.compare baseline.json current.json [--threshold 0.2]
+"""
+
+import sys
+from argparse import ArgumentParser, Namespace
+from json import load
+
+
+def compare(baseline, current, threshold=0.2):
+    """
+    Compare the time of each benchmark against its baseline
+
+    :param baseline: Results to compare against, see `cdd.tests.benchmarks.bench_suite.main`
+    :type baseline: ```dict```
+
+    :param current: Results to compare
+    :type current: ```dict```
+
+    :param threshold: Fraction slower than the baseline that is a regression, e.g., 0.2 for 20% slower
+    :type threshold: ```float```
+
+    :return: Name, baseline seconds, current seconds, ratio (current / baseline), and whether it regressed—for each
+      benchmark in both; in the order of `current`
+    :rtype: ```list[tuple[str, float, float, float, bool]]```
+    """
+    return list(
+        map(
+            lambda name: (
+                name,
+                baseline["benchmarks"][name],
+                current["benchmarks"][name],
+                current["benchmarks"][name] / baseline["benchmarks"][name],
+                current["benchmarks"][name]
+                > baseline["benchmarks"][name] * (1 + threshold),
+            ),
+            filter(baseline["benchmarks"].__contains__, current["benchmarks"]),
+        )
+    )
+
+
+def _build_parser():
+    """
+    Parser for the command-line interface
+
+    :return: Parser of the CLI arguments
+    :rtype: ```ArgumentParser```
+    """
+    parser = ArgumentParser(
+        prog="python -m cdd.tests.benchmarks.compare",
+        description="Flag benchmarks slower than the baseline by more than the threshold.",
+    )
+    parser.add_argument("baseline", help="JSON results to compare against.")
+    parser.add_argument("current", help="JSON results to compare.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Fraction slower than the baseline that is a regression. Defaults to 0.2, i.e., 20%% slower.",
+    )
+    return parser
+
+
+def main(cli_argv=None):
+    """
+    Print each benchmark's time against its baseline; exiting 1 if any regressed
+
+    :param cli_argv: CLI arguments. If None uses `sys.argv`.
+    :type cli_argv: ```Optional[list[str]]```
+    """
+    args: Namespace = _build_parser().parse_args(cli_argv)
+    with open(args.baseline, "rt") as f:
+        baseline: dict = load(f)
+    with open(args.current, "rt") as f:
+        current: dict = load(f)
+    for key in "scale", "python", "platform":
+        if baseline.get(key) != current.get(key):
+            print(
+                "Warning: {key} differs: {baseline!r} in the baseline, {current!r} now".format(
+                    key=key, baseline=baseline.get(key), current=current.get(key)
+                ),
+                file=sys.stderr,
+            )
+    rows = compare(baseline, current, args.threshold)
+    print(
+        "{name:<16}{baseline:>12}{current:>12}{ratio:>8}".format(
+            name="benchmark", baseline="baseline s", current="current s", ratio="ratio"
+        )
+    )
+    for name, baseline_seconds, current_seconds, ratio, regressed in rows:
+        print(
+            "{name:<16}{baseline:12.3f}{current:12.3f}{ratio:8.2f}{regressed}".format(
+                name=name,
+                baseline=baseline_seconds,
+                current=current_seconds,
+                ratio=ratio,
+                regressed="  REGRESSED" if regressed else "",
+            )
+        )
+    regressions = sum(map(lambda row: row[-1], rows))  # type: int
+    print(
+        "{regressions} of {count} benchmark(s) regressed beyond {threshold:.0%}".format(
+            regressions=regressions, count=len(rows), threshold=args.threshold
+        )
+    )
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
+
+__all__ = ["compare", "main"]  # type: list[str]
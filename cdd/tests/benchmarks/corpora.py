@@ -0,0 +1,478 @@
+"""
+Generators of synthetic corpora, large enough to benchmark on: packages of classes and functions documented in each
+docstring style, argparse functions with hundreds of arguments, SQLalchemy models with dense foreign keys, and bottle
+route files.
+"""
+
+from os import makedirs, path
+
+import cdd.routes.emit.bottle
+from cdd.shared.pure_utils import INIT_FILENAME, tab
+
+DOCSTRING_FORMATS = "rest", "numpydoc", "google"  # type: tuple[str, ...]
+
+# Cycled through by the parameters generated
+_types = "int", "str", "float", "bool", "Optional[int]"  # type: tuple[str, ...]
+_defaults = "5", '"foo"', "1.5", "True", "None"  # type: tuple[str, ...]
+
+
+def _param(i, j):
+    """
+    Internal function to generate the `j`th parameter of the `i`th function or class
+
+    :param i: Index of the function or class
+    :type i: ```int```
+
+    :param j: Index of the parameter
+    :type j: ```int```
+
+    :return: Name, type, default (None for the first parameter), and description of the parameter
+    :rtype: ```tuple[str, str, Optional[str], str]```
+    """
+    return (
+        "a{j}".format(j=j),
+        _types[j % len(_types)],
+        None if j == 0 else _defaults[j % len(_defaults)],
+        "Parameter a{j} for symbol {i}".format(i=i, j=j),
+    )
+
+
+def generate_docstring(docstring_format, summary, params, returns=None, indent=1):
+    """
+    Generate a docstring in the format given
+
+    :param docstring_format: Format of docstring
+    :type docstring_format: ```Literal['rest', 'numpydoc', 'google']```
+
+    :param summary: First line of the docstring
+    :type summary: ```str```
+
+    :param params: Name, type, default, and description of each parameter, see `_param`
+    :type params: ```Iterable[tuple[str, str, Optional[str], str]]```
+
+    :param returns: Type and description of the return value, if any
+    :type returns: ```Optional[tuple[str, str]]```
+
+    :param indent: Number of tabs to indent the docstring by
+    :type indent: ```int```
+
+    :return: Docstring, with its triple quotes
+    :rtype: ```str```
+    """
+    params = tuple(
+        map(
+            lambda param: param[:3]
+            + (
+                (
+                    param[3]
+                    if param[2] is None
+                    else "{doc}. Defaults to {default}".format(
+                        doc=param[3], default=param[2]
+                    )
+                ),
+            ),
+            params,
+        )
+    )
+    if docstring_format == "numpydoc":
+        lines = (
+            (summary, "", "Parameters", "----------")
+            + tuple(
+                "{name} : {typ}\n{tab}{doc}".format(
+                    name=name, typ=typ, tab=tab, doc=doc
+                )
+                for name, typ, _, doc in params
+            )
+            + (
+                ()
+                if returns is None
+                else ("", "Returns", "-------", "{}\n{tab}{}".format(*returns, tab=tab))
+            )
+        )
+    elif docstring_format == "google":
+        lines = (
+            (summary, "", "Args:")
+            + tuple(
+                "  {name} ({typ}): {doc}".format(name=name, typ=typ, doc=doc)
+                for name, typ, _, doc in params
+            )
+            + (
+                ()
+                if returns is None
+                else ("", "Returns:", "  {}:\n   {}".format(*returns))
+            )
+        )
+    else:
+        lines = (
+            (summary, "")
+            + tuple(
+                ":param {name}: {doc}\n:type {name}: ```{typ}```\n".format(
+                    name=name, typ=typ, doc=doc
+                )
+                for name, typ, _, doc in params
+            )
+            + (
+                ()
+                if returns is None
+                else (":return: {1}\n:rtype: ```{0}```".format(*returns),)
+            )
+        )
+    return "\n".join(
+        map(
+            lambda line: "{tab}{line}".format(tab=tab * indent, line=line).rstrip(),
+            '"""\n{body}\n"""'.format(body="\n".join(lines)).split("\n"),
+        )
+    )
+
+
+def generate_function(docstring_format, i, params=8):
+    """
+    Generate a function—with `params` parameters, documented in the format given—and its return
+
+    :param docstring_format: Format of docstring
+    :type docstring_format: ```Literal['rest', 'numpydoc', 'google']```
+
+    :param i: Index of the function, giving it its name, e.g., `f5`
+    :type i: ```int```
+
+    :param params: Number of parameters
+    :type params: ```int```
+
+    :return: Python source of the function
+    :rtype: ```str```
+    """
+    _params = tuple(map(lambda j: _param(i, j), range(params)))
+    return "def f{i}({args}):\n{docstring}\n{tab}return a0\n".format(
+        i=i,
+        args=", ".join(
+            (
+                name
+                if default is None
+                else "{name}={default}".format(name=name, default=default)
+            )
+            for name, _, default, _ in _params
+        ),
+        docstring=generate_docstring(
+            docstring_format,
+            "Function {i}".format(i=i),
+            _params,
+            returns=(_params[0][1], "The a0"),
+        ),
+        tab=tab,
+    )
+
+
+def generate_class(docstring_format, i, params=8):
+    """
+    Generate a class—with `params` annotated attributes, documented in the format given
+
+    :param docstring_format: Format of docstring
+    :type docstring_format: ```Literal['rest', 'numpydoc', 'google']```
+
+    :param i: Index of the class, giving it its name, e.g., `C5`
+    :type i: ```int```
+
+    :param params: Number of attributes
+    :type params: ```int```
+
+    :return: Python source of the class
+    :rtype: ```str```
+    """
+    _params = tuple(map(lambda j: _param(i, j), range(params)))
+    return "class C{i}(object):\n{docstring}\n\n{attributes}\n".format(
+        i=i,
+        docstring=generate_docstring(
+            docstring_format, "Class {i}".format(i=i), _params
+        ),
+        attributes="\n".join(
+            "{tab}{name}: {typ} = {default}".format(
+                tab=tab,
+                name=name,
+                typ=typ,
+                default=_defaults[j % len(_defaults)] if default is None else default,
+            )
+            for j, (name, typ, default, _) in enumerate(_params)
+        ),
+    )
+
+
+def generate_module(docstring_format, start, classes, functions, params=8):
+    """
+    Generate a module of classes and functions, documented in the format given
+
+    :param docstring_format: Format of docstring
+    :type docstring_format: ```Literal['rest', 'numpydoc', 'google']```
+
+    :param start: Index of the first class and function, so names are unique across modules
+    :type start: ```int```
+
+    :param classes: Number of classes
+    :type classes: ```int```
+
+    :param functions: Number of functions
+    :type functions: ```int```
+
+    :param params: Number of parameters of each function, and attributes of each class
+    :type params: ```int```
+
+    :return: Python source of the module, and the names it defines
+    :rtype: ```tuple[str, list[str]]```
+    """
+    return (
+        "\n\n".join(
+            (
+                '"""\nGenerated module, documented in {docstring_format}\n"""\n\n'
+                "from typing import Optional\n".format(
+                    docstring_format=docstring_format
+                ),
+            )
+            + tuple(
+                generate_class(docstring_format, i, params)
+                for i in range(start, start + classes)
+            )
+            + tuple(
+                generate_function(docstring_format, i, params)
+                for i in range(start, start + functions)
+            )
+        ),
+        list(map("C{}".format, range(start, start + classes)))
+        + list(map("f{}".format, range(start, start + functions))),
+    )
+
+
+def write_package(
+    directory, name, docstring_format, modules, classes, functions, params=8
+):
+    """
+    Write a package of modules of classes and functions—documented in the format given—whose `__init__` exports
+    them all
+
+    :param directory: Directory to create the package within
+    :type directory: ```str```
+
+    :param name: Name of the package
+    :type name: ```str```
+
+    :param docstring_format: Format of docstring
+    :type docstring_format: ```Literal['rest', 'numpydoc', 'google']```
+
+    :param modules: Number of modules
+    :type modules: ```int```
+
+    :param classes: Number of classes per module
+    :type classes: ```int```
+
+    :param functions: Number of functions per module
+    :type functions: ```int```
+
+    :param params: Number of parameters of each function, and attributes of each class
+    :type params: ```int```
+
+    :return: Filepaths of the modules written, excluding `__init__`
+    :rtype: ```list[str]```
+    """
+    package_directory: str = path.join(directory, name)
+    makedirs(package_directory, exist_ok=True)
+    filenames, init_lines, exported = (
+        [],
+        [],
+        [],
+    )  # type: list[str], list[str], list[str]
+    for m in range(modules):
+        source, names = generate_module(
+            docstring_format,
+            m * max(classes, functions),
+            classes,
+            functions,
+            params,
+        )
+        filename: str = path.join(
+            package_directory, "mod{m}{extsep}py".format(m=m, extsep=path.extsep)
+        )
+        with open(filename, "wt") as f:
+            f.write(source)
+        filenames.append(filename)
+        init_lines.append(
+            "from .mod{m} import {names}".format(m=m, names=", ".join(names))
+        )
+        exported += names
+    with open(path.join(package_directory, INIT_FILENAME), "wt") as f:
+        f.write(
+            '"""\nGenerated package\n"""\n\n{imports}\n\n__all__ = {exported!r}\n'.format(
+                imports="\n".join(init_lines), exported=exported
+            )
+        )
+    return filenames
+
+
+def generate_argparse_function(arguments, name="set_cli_args"):
+    """
+    Generate an argparse function, adding `arguments` arguments to its parser
+
+    :param arguments: Number of `add_argument` calls
+    :type arguments: ```int```
+
+    :param name: Name of the function
+    :type name: ```str```
+
+    :return: Python source of the argparse function
+    :rtype: ```str```
+    """
+    return (
+        'def {name}(argument_parser):\n{tab}"""\n'
+        "{tab}Set CLI arguments\n\n"
+        "{tab}:param argument_parser: argument parser\n"
+        "{tab}:type argument_parser: ```ArgumentParser```\n\n"
+        "{tab}:return: argument_parser\n"
+        '{tab}:rtype: ```ArgumentParser```\n{tab}"""\n'
+        '{tab}argument_parser.description = "Generated CLI of {arguments} arguments"\n'
+        "{add_arguments}\n"
+        "{tab}return argument_parser\n".format(
+            name=name,
+            tab=tab,
+            arguments=arguments,
+            add_arguments="\n".join(
+                "{tab}argument_parser.add_argument(\n"
+                '{tab}{tab}"--a{j}",\n'
+                "{tab}{tab}type={typ},\n"
+                '{tab}{tab}help="The a{j}.",\n'
+                "{tab}{tab}{required_or_default},\n"
+                "{tab})".format(
+                    tab=tab,
+                    j=j,
+                    typ=("int", "str", "float")[j % 3],
+                    required_or_default=(
+                        "required=True"
+                        if j % 4 == 0
+                        else "default={}".format(("5", '"foo"', "1.5")[j % 3])
+                    ),
+                )
+                for j in range(arguments)
+            ),
+        )
+    )
+
+
+def generate_sqlalchemy_models(models, start=0, columns=8, foreign_keys=4):
+    """
+    Generate SQLalchemy `Table`s, each with `foreign_keys` of its columns referencing earlier tables
+
+    :param models: Number of tables
+    :type models: ```int```
+
+    :param start: Index of the first table, so names are unique across files
+    :type start: ```int```
+
+    :param columns: Number of columns of each table, besides its primary key and foreign keys
+    :type columns: ```int```
+
+    :param foreign_keys: Number of foreign keys of each table—fewer for the first tables, which have fewer to refer to
+    :type foreign_keys: ```int```
+
+    :return: Python source of the tables
+    :rtype: ```str```
+    """
+    return "\n".join(
+        (
+            "\n".join(
+                map(
+                    "def {}(*args, **kwargs): pass\n".format,
+                    ("Table", "Column", "ForeignKey", "Integer", "String", "Boolean"),
+                )
+            ),
+        )
+        + tuple(
+            "model{i}_tbl = Table(\n"
+            '{tab}"model{i}_tbl",\n'
+            "{tab}metadata,\n"
+            '{tab}Column("id", Integer, primary_key=True, comment="Primary key of model {i}"),\n'
+            "{foreign_keys}"
+            "{columns}"
+            ")\n".format(
+                i=i,
+                tab=tab,
+                foreign_keys="".join(
+                    '{tab}Column("model{k}_id", Integer, ForeignKey("model{k}_tbl.id"),'
+                    ' comment="The model{k} of model {i}"),\n'.format(tab=tab, i=i, k=k)
+                    for k in range(max(start, i - foreign_keys), i)
+                ),
+                columns="".join(
+                    '{tab}Column("c{j}", {typ}, comment="The c{j} of model {i}", default={default}),\n'.format(
+                        tab=tab,
+                        i=i,
+                        j=j,
+                        typ=("Integer", "String", "Boolean")[j % 3],
+                        default=("5", '"foo"', "True")[j % 3],
+                    )
+                    for j in range(columns)
+                ),
+            )
+            for i in range(start, start + models)
+        )
+    )
+
+
+def generate_routes(models, start=0, app="rest_api"):
+    """
+    Generate a bottle route file, with create, read, and destroy routes for each model
+
+    :param models: Number of models, named as `generate_sqlalchemy_models` names them
+    :type models: ```int```
+
+    :param start: Index of the first model
+    :type start: ```int```
+
+    :param app: Variable name of the bottle app
+    :type app: ```str```
+
+    :return: Python source of the routes
+    :rtype: ```str```
+    """
+    return "\n".join(
+        (
+            '{app} = type("App", tuple(),\n'
+            "{sep}{{ method: lambda h: lambda g=None: g \n"
+            '{sep}  for method in ("get", "post", "put", "delete") }})\n'.format(
+                app=app, sep=tab * 4
+            ),
+        )
+        + tuple(
+            "\n".join(
+                (
+                    cdd.routes.emit.bottle.create(
+                        app=app, name="Model{i}".format(i=i), route=route, variant=-1
+                    ),
+                    cdd.routes.emit.bottle.read(
+                        app=app,
+                        name="Model{i}".format(i=i),
+                        route=route,
+                        primary_key="id",
+                        variant=-1,
+                    ),
+                    cdd.routes.emit.bottle.destroy(
+                        app=app,
+                        name="Model{i}".format(i=i),
+                        route=route,
+                        primary_key="id",
+                        variant=-1,
+                    ),
+                )
+            )
+            for i, route in map(
+                lambda i: (i, "/api/model{i}".format(i=i)), range(start, start + models)
+            )
+        )
+    )
+
+
+__all__ = [
+    "DOCSTRING_FORMATS",
+    "generate_argparse_function",
+    "generate_class",
+    "generate_docstring",
+    "generate_function",
+    "generate_module",
+    "generate_routes",
+    "generate_sqlalchemy_models",
+    "write_package",
+]  # type: list[str]
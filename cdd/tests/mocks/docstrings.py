@@ -5,9 +5,14 @@ Note: TensorFlow code is taken from `5a56eb1`; the same that tf 2.15.0 was relea
 """
 
 from itertools import chain
-from textwrap import indent
 
-from cdd.shared.pure_utils import identity, tab
+from cdd.shared.pure_utils import tab
+from cdd.shared.templates import (
+    docstring_create_from_attr_google_str,
+    docstring_create_from_attr_str,
+    docstring_repr_google_str,
+    docstring_repr_str,
+)
 
 docstring_header_no_nl_str: str = (
     "Acquire from the official tensorflow_datasets model zoo,"
@@ -709,64 +714,6 @@ docstring_no_type_no_default_str: str = docstring_no_type_no_default_tpl_str.for
     header_doc_str=docstring_header_str
 )
 
-docstring_repr_str: str = (
-    indent(
-        "\n".join(
-            (
-                "",
-                "Emit a string representation of the current instance",
-                "",
-                ":return: String representation of instance",
-                ":rtype: ```str```",
-                "",
-            )
-        ),
-        tab * 2,
-        identity,
-    )
-    + tab * 2
-)
-
-docstring_create_from_attr_str: str = (
-    indent(
-        "\n".join(
-            (
-                "",
-                "Construct an instance from an object with identical columns (as attributes) as this `class`/`Table`",
-                "",
-                ":return: A new instance made from the input object's attributes",
-                ":rtype: ```self```",
-                "",
-            )
-        ),
-        tab * 2,
-        identity,
-    )
-    + tab * 2
-)
-
-# docstring_repr_google_str = emit.docstring(parse.docstring(docstring_repr_str), docstring_format="google")
-# docstring_repr_google_str = (
-#     "\nConstruct an instance from an object with identical columns (as attributes) as this `class`/`Table`\n\n\n\n\n"
-#     "Returns:\n"
-#     "  self:\n"
-#     "   A new instance made from the input object's attributes\n"
-# )
-
-docstring_create_from_attr_google_str: str = (
-    "\nEmit a string representation of the current instance\n\n\n\n\n"
-    "Returns:\n"
-    "  str:\n"
-    "   String representation of instance\n"
-)
-
-docstring_repr_google_str: str = (
-    "\nEmit a string representation of the current instance\n\n\n\n\n"
-    "Returns:\n"
-    "  str:\n"
-    "   String representation of instance\n"
-)
-
 docstring_reduction_v2_str: str = (
     "Types of loss reduction."
     "\n"
@@ -5,6 +5,7 @@ Mocks for JSON Schema
 from copy import deepcopy
 
 from cdd.json_schema.utils.shared_utils import JSON_schema
+from cdd.shared.templates import server_error_schema
 from cdd.tests.mocks.docstrings import docstring_header_and_return_no_nl_str
 
 config_schema: JSON_schema = {
@@ -51,30 +52,6 @@ for param, typ in (
     config_schema_with_sql_types["properties"][param]["x_typ"] = {"sql": {"type": typ}}
 
 
-server_error_schema: JSON_schema = {
-    "$id": "https://offscale.io/error_json.schema.json",
-    "$schema": "https://json-schema.org/draft/2020-12/schema",
-    "description": "Error schema",
-    "type": "object",
-    "properties": {
-        "error": {"description": "Name of the error", "type": "string"},
-        "error_description": {
-            "description": "Description of the error",
-            "type": "string",
-        },
-        "error_code": {
-            "description": "Code of the error (usually is searchable in a KB for further information)",
-            "type": "string",
-        },
-        "status_code": {
-            "description": "Status code (usually for HTTP)",
-            "type": "number",
-        },
-    },
-    "required": ["error", "error_description"],
-}
-
-
 __all__ = [
     "config_schema",
     "server_error_schema",
@@ -4,6 +4,7 @@ Mock routes
 
 import cdd.routes.emit.bottle
 from cdd.shared.pure_utils import tab
+from cdd.shared.templates import route_prelude
 
 route_config = {
     "app": "rest_api",
@@ -25,11 +26,6 @@ route_mock_prelude: str = (
     '{sep}  for method in ("get", "post", "put", "delete") }})\n'.format(sep=tab * 4)
 )
 
-route_prelude: str = (
-    "from bottle import Bottle, request, response\n\n"
-    "rest_api = Bottle(catchall=False, autojson=True)\n"
-)
-
 __all__ = [
     "create_route",
     "read_route",
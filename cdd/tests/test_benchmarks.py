@@ -0,0 +1,99 @@
+""" Tests for the benchmark corpora and comparison """
+
+from ast import ClassDef, FunctionDef, get_docstring, parse
+from io import StringIO
+from json import dump
+from os import listdir, path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from cdd.shared.docstring_parsers import parse_docstring
+from cdd.tests.benchmarks.compare import compare, main
+from cdd.tests.benchmarks.corpora import (
+    DOCSTRING_FORMATS,
+    generate_argparse_function,
+    generate_function,
+    generate_routes,
+    generate_sqlalchemy_models,
+    write_package,
+)
+from cdd.tests.utils_for_tests import unittest_main
+
+
+class TestBenchmarks(TestCase):
+    """
+    Tests for the benchmark corpora and comparison
+    """
+
+    def test_corpora(self) -> None:
+        """
+        Tests the generated corpora are valid Python, of the sizes asked for, documented as asked for
+        """
+        for docstring_format in DOCSTRING_FORMATS:
+            ir: dict = parse_docstring(
+                get_docstring(parse(generate_function(docstring_format, 3)).body[0])
+            )
+            self.assertListEqual(list(ir["params"]), list(map("a{}".format, range(8))))
+            self.assertEqual(ir["params"]["a1"]["default"], "foo")
+            self.assertEqual(ir["returns"]["return_type"]["typ"], "int")
+
+        with TemporaryDirectory() as temp_dir:
+            filenames = write_package(
+                temp_dir, "pkg", "google", modules=2, classes=3, functions=4
+            )
+            self.assertListEqual(
+                sorted(listdir(path.join(temp_dir, "pkg"))),
+                ["__init__.py", "mod0.py", "mod1.py"],
+            )
+            with open(filenames[1], "rt") as f:
+                body = parse(f.read()).body
+        self.assertListEqual(
+            list(map(type, body[2:])), [ClassDef] * 3 + [FunctionDef] * 4
+        )
+
+        self.assertEqual(
+            generate_argparse_function(300).count("argument_parser.add_argument("),
+            300,
+        )
+        models: str = generate_sqlalchemy_models(10, start=5, foreign_keys=3)
+        parse(models)
+        self.assertEqual(models.count("_tbl = Table("), 10)
+        self.assertEqual(
+            models.count('ForeignKey("'), 0 + 1 + 2 + 3 * 7
+        )  # Tables 5, 6, and 7 have fewer before them to refer to
+        self.assertEqual(len(parse(generate_routes(4)).body), 1 + 3 * 4)
+
+    def test_compare(self) -> None:
+        """
+        Tests only benchmarks slower than the baseline by more than the threshold are flagged, exiting 1 if any
+        """
+        baseline = {"scale": 1, "benchmarks": {"a": 1.0, "b": 2.0, "c": 1.0}}
+        current = {"scale": 1, "benchmarks": {"b": 2.5, "a": 1.1, "d": 5.0}}
+        self.assertListEqual(
+            compare(baseline, current, threshold=0.2),
+            [("b", 2.0, 2.5, 1.25, True), ("a", 1.0, 1.1, 1.1, False)],
+        )
+
+        with TemporaryDirectory() as temp_dir:
+            baseline_filename: str = path.join(temp_dir, "baseline.json")
+            current_filename: str = path.join(temp_dir, "current.json")
+            for filename, results in (
+                (baseline_filename, baseline),
+                (current_filename, current),
+            ):
+                with open(filename, "wt") as f:
+                    dump(results, f)
+            with patch("sys.stdout", new_callable=StringIO) as stdout:
+                main([baseline_filename, current_filename, "--threshold", "0.3"])
+            self.assertTrue(
+                stdout.getvalue().endswith("0 of 2 benchmark(s) regressed beyond 30%\n")
+            )
+            with patch("sys.stdout", new_callable=StringIO) as stdout:
+                self.assertRaises(
+                    SystemExit, main, [baseline_filename, current_filename]
+                )
+            self.assertIn("REGRESSED", stdout.getvalue())
+
+
+unittest_main()
@@ -4,13 +4,21 @@ import os
 from argparse import ArgumentParser
 from importlib.machinery import SourceFileLoader
 from importlib.util import module_from_spec, spec_from_loader
+from io import StringIO
+from json import load
+from operator import itemgetter
 from os.path import extsep
-from unittest import TestCase
+from subprocess import PIPE, run
+from sys import executable, version_info
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipUnless
 from unittest.mock import MagicMock, patch
 
+import cdd
 from cdd import __description__, __version__
 from cdd.__main__ import _build_parser
 from cdd.shared.pure_utils import PY3_8
+from cdd.shared.tracing import count, span
 from cdd.tests.utils_for_tests import run_cli_test, unittest_main
 
 
@@ -33,6 +41,81 @@ class TestCli(TestCase):
             output_checker=lambda output: output[output.rfind(" ") + 1 :][:-1],
         )
 
+    def test_cache_dir(self) -> None:
+        """Tests CLI interface sets the IR cache directory, without passing it on to the command"""
+        with patch("cdd.__main__.exmod", new_callable=MagicMock()) as exmod_mock, patch(
+            "cdd.__main__.set_ir_cache_dir"
+        ) as set_ir_cache_dir_mock:
+            run_cli_test(
+                self,
+                [
+                    "--cache-dir",
+                    "cache",
+                    "exmod",
+                    "--module",
+                    "foo",
+                    "--emit",
+                    "argparse",
+                    "--output-directory",
+                    "foo",
+                ],
+                exit_code=None,
+                output=None,
+            )
+        set_ir_cache_dir_mock.assert_called_once_with("cache")
+        self.assertNotIn("cache_dir", exmod_mock.call_args.kwargs)
+
+    def test_timings_trace_out(self) -> None:
+        """Tests CLI interface prints a summary of the phases and writes their Chrome trace, not passing those on"""
+
+        def _exmod(**kwargs):
+            """
+            :param kwargs: Arguments of `exmod`
+            :type kwargs: ```dict```
+            """
+            with span("exmod"):
+                count("symbols emitted", 3)
+
+        with TemporaryDirectory() as temp_dir, patch(
+            "cdd.__main__.exmod", MagicMock(side_effect=_exmod)
+        ) as exmod_mock, patch("sys.stderr", new_callable=StringIO) as stderr:
+            trace_out: str = os.path.join(temp_dir, "trace.json")
+            run_cli_test(
+                self,
+                [
+                    "--timings",
+                    "--trace-out",
+                    trace_out,
+                    "exmod",
+                    "--module",
+                    "foo",
+                    "--emit",
+                    "argparse",
+                    "--output-directory",
+                    "foo",
+                ],
+                exit_code=None,
+                output=None,
+            )
+            with open(trace_out, "rt") as f:
+                trace = load(f)  # type: dict
+        self.assertFalse(
+            frozenset(("print_timings", "trace_out"))
+            & frozenset(exmod_mock.call_args.kwargs)
+        )
+        self.assertListEqual(
+            list(map(lambda line: line.split()[:2], stderr.getvalue().splitlines())),
+            [
+                ["phase", "calls"],
+                ["exmod", "1"],
+                ["counter", "value"],
+                ["symbols", "emitted"],
+            ],
+        )
+        self.assertListEqual(
+            list(map(itemgetter("name"), trace["traceEvents"])), ["exmod", "counters"]
+        )
+
     def test_name_main(self) -> None:
         """Test the `if __name__ == '__main___'` block"""
 
@@ -60,5 +143,77 @@ class TestCli(TestCase):
             "command",
         )
 
+    @skipUnless(version_info[:2] >= (3, 7), "`-X importtime` is new in Python 3.7")
+    def test_import_time(self) -> None:
+        """
+        Tests `python -m cdd` imports only what it needs to parse its arguments—not the subcommands, nor the slow
+        modules they import. How long that takes is benchmarked, see `cdd.tests.benchmarks.bench_suite`.
+        """
+        import_times = run(
+            [executable, "-X", "importtime", "-c", "import cdd.__main__"],
+            cwd=os.path.dirname(os.path.dirname(cdd.__file__)),
+            stderr=PIPE,
+            universal_newlines=True,
+        ).stderr.splitlines()
+        module_to_cumulative_us = dict(
+            map(
+                lambda columns: (columns[2].strip(), int(columns[1])),
+                filter(
+                    lambda columns: len(columns) == 3 and columns[1].strip().isdigit(),
+                    map(
+                        lambda line: line.partition("import time:")[2].split("|"),
+                        import_times,
+                    ),
+                ),
+            )
+        )
+        self.assertIn("cdd.__main__", module_to_cumulative_us, import_times)
+        self.assertListEqual(
+            list(
+                filter(
+                    module_to_cumulative_us.__contains__,
+                    (
+                        "black",
+                        "cdd.compound.doctrans",
+                        "cdd.compound.exmod",
+                        "cdd.compound.gen",
+                        "cdd.shared.ast_utils",
+                        "cdd.tests.mocks",
+                        "pkg_resources",
+                        "setuptools",
+                        "yaml",
+                    ),
+                )
+            ),
+            [],
+        )
+
+    def test_subcommands_import_alone(self) -> None:
+        """Tests each module `python -m cdd` imports on demand imports into a fresh interpreter"""
+        modules = (
+            "cdd.compound.batch",
+            "cdd.compound.doctrans",
+            "cdd.compound.exmod",
+            "cdd.compound.gen",
+            "cdd.compound.openapi.gen_openapi",
+            "cdd.compound.openapi.gen_routes",
+            "cdd.compound.serve",
+            "cdd.compound.sync_properties",
+            "cdd.shared.conformance",
+        )
+        self.assertListEqual(
+            list(
+                filter(
+                    lambda module: run(
+                        [executable, "-c", "import {module}".format(module=module)],
+                        cwd=os.path.dirname(os.path.dirname(cdd.__file__)),
+                        stderr=PIPE,
+                    ).returncode,
+                    modules,
+                )
+            ),
+            [],
+        )
+
 
 unittest_main()
@@ -0,0 +1,30 @@
+""" Tests for CLI batch subparser (__main__.py) """
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from cdd.tests.utils_for_tests import run_cli_test, unittest_main
+
+
+class TestCliBatch(TestCase):
+    """Test class for __main__.py"""
+
+    def test_batch_is_called(self) -> None:
+        """Tests CLI interface batch function gets called, exiting non-zero if any job didn't succeed"""
+        with patch(
+            "cdd.__main__.batch", MagicMock(return_value=(3, 0, 0))
+        ) as batch_mock:
+            run_cli_test(
+                self,
+                ["batch", "manifest.yaml", "--jobs", "4"],
+                exit_code=None,
+                output=None,
+            )
+        batch_mock.assert_called_once_with(manifest="manifest.yaml", jobs=4)
+
+        for counts in (1, 1, 1), (2, 0, 1):
+            with patch("cdd.__main__.batch", MagicMock(return_value=counts)):
+                run_cli_test(self, ["batch", "manifest.json"], exit_code=1, output=None)
+
+
+unittest_main()
@@ -1,9 +1,10 @@
 """ Tests for CLI doctrans subparser (__main__.py) """
 
-from os import path
+from collections import deque
+from os import extsep, path
 from tempfile import TemporaryDirectory
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from cdd.tests.utils_for_tests import mock_function, run_cli_test, unittest_main
 
@@ -24,7 +25,7 @@ class TestCliDocTrans(TestCase):
     def test_doctrans_fails_with_file_missing(self) -> None:
         """Tests CLI interface file missing failure case"""
 
-        with patch("cdd.__main__.doctrans", mock_function):
+        with patch("cdd.__main__.doctrans_files", mock_function):
             self.assertTrue(
                 run_cli_test(
                     self,
@@ -47,7 +48,9 @@ class TestCliDocTrans(TestCase):
         with TemporaryDirectory() as tempdir:
             filename: str = path.join(tempdir, "foo")
             open(filename, "a").close()
-            with patch("cdd.__main__.doctrans", mock_function):
+            with patch(
+                "cdd.__main__.doctrans_files", MagicMock(return_value=(1, 0))
+            ) as doctrans_files_mock:
                 self.assertTrue(
                     run_cli_test(
                         self,
@@ -63,6 +66,55 @@ class TestCliDocTrans(TestCase):
                         output=None,
                     ),
                 )
+            self.assertListEqual(
+                doctrans_files_mock.call_args.kwargs["filenames"], [filename]
+            )
+
+    def test_doctrans_many_files_check(self) -> None:
+        """Tests CLI interface expands directories and globs, and `--check` exits non-zero on would-be changes"""
+
+        with TemporaryDirectory() as tempdir:
+            filenames = tuple(
+                map(
+                    lambda name: path.join(
+                        tempdir, "{name}{extsep}py".format(name=name, extsep=extsep)
+                    ),
+                    "ab",
+                )
+            )
+            deque(
+                map(lambda filename: open(filename, "a").close(), filenames), maxlen=0
+            )
+            argv = [
+                "doctrans",
+                "--filename",
+                tempdir,
+                "--filename",
+                path.join(tempdir, "*"),
+                "--format",
+                "numpydoc",
+                "--type-annotations",
+                "--jobs",
+                "2",
+                "--check",
+            ]
+            for changed, exit_code in (0, None), (1, 1):
+                with patch(
+                    "cdd.__main__.doctrans_files",
+                    MagicMock(return_value=(changed, 0)),
+                ) as doctrans_files_mock:
+                    run_cli_test(self, argv, exit_code=exit_code, output=None)
+                self.assertDictEqual(
+                    doctrans_files_mock.call_args.kwargs,
+                    {
+                        "filenames": list(filenames),
+                        "docstring_format": "numpydoc",
+                        "type_annotations": True,
+                        "no_word_wrap": False,
+                        "jobs": 2,
+                        "check": True,
+                    },
+                )
 
 
 unittest_main()
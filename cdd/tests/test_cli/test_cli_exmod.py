@@ -38,5 +38,26 @@ class TestCliExMod(TestCase):
                 ),
             )
 
+    def test_exmod_jobs_arg(self) -> None:
+        """Tests CLI interface exmod passes `--jobs` through"""
+        with patch("cdd.__main__.exmod", new_callable=MagicMock()) as exmod_mock:
+            run_cli_test(
+                self,
+                [
+                    "exmod",
+                    "--module",
+                    "foo",
+                    "--emit",
+                    "argparse",
+                    "--output-directory",
+                    "foo",
+                    "--jobs",
+                    "4",
+                ],
+                exit_code=None,
+                output=None,
+            )
+        self.assertEqual(exmod_mock.call_args.kwargs["jobs"], 4)
+
 
 unittest_main()
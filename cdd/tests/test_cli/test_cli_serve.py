@@ -0,0 +1,57 @@
+""" Tests for CLI serve subparser (__main__.py), and forwarding to it with `--server` """
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from cdd.tests.utils_for_tests import run_cli_test, unittest_main
+
+
+class TestCliServe(TestCase):
+    """Test class for __main__.py"""
+
+    def test_serve_is_called(self) -> None:
+        """Tests CLI interface serve function gets called"""
+        with patch("cdd.__main__.serve", new_callable=MagicMock()) as serve_mock:
+            run_cli_test(
+                self,
+                ["serve", "--socket", "cdd.sock"],
+                exit_code=None,
+                output=None,
+            )
+        serve_mock.assert_called_once_with(socket_path="cdd.sock")
+
+    def test_server_forwards(self) -> None:
+        """Tests CLI interface forwards the command, without `--server`, to the daemon; exiting as it did"""
+        argv = [
+            "doctrans",
+            "--filename",
+            "foo.py",
+            "--format",
+            "google",
+            "--type-annotations",
+        ]
+        with patch(
+            "cdd.__main__.forward", MagicMock(return_value=0)
+        ) as forward_mock, patch("cdd.__main__.doctrans_files") as doctrans_files_mock:
+            run_cli_test(
+                self, ["--server", "cdd.sock"] + argv, exit_code=None, output=None
+            )
+            run_cli_test(
+                self,
+                ["--server=cdd.sock", "--cache-dir", "cache"] + argv,
+                exit_code=None,
+                output=None,
+            )
+        self.assertListEqual(
+            list(map(lambda call: call[0], forward_mock.call_args_list)),
+            [("cdd.sock", argv), ("cdd.sock", ["--cache-dir", "cache"] + argv)],
+        )
+        doctrans_files_mock.assert_not_called()
+
+        with patch("cdd.__main__.forward", MagicMock(return_value=1)):
+            run_cli_test(
+                self, ["--server", "cdd.sock"] + argv, exit_code=1, output=None
+            )
+
+
+unittest_main()
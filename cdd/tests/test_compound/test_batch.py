@@ -0,0 +1,317 @@
+""" Tests for batch """
+
+from io import StringIO
+from json import dump
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from cdd.compound.batch import (
+    BatchJob,
+    _run_job,
+    job_dependencies,
+    load_manifest,
+    run_batch,
+)
+from cdd.tests.utils_for_tests import unittest_main
+
+function_src: str = '''
+def f(a):
+    """
+    Foo
+
+    :param a: An a
+    :type a: ```int```
+
+    :return: The a
+    :rtype: ```int```
+    """
+    return a
+'''
+
+
+def _job(name, reads=(), writes=()):
+    """
+    :param name: Name of the job
+    :type name: ```str```
+
+    :param reads: Paths the job reads
+    :type reads: ```tuple[str, ...]```
+
+    :param writes: Paths the job writes
+    :type writes: ```tuple[str, ...]```
+
+    :return: Job that runs nothing, reading & writing the paths
+    :rtype: ```BatchJob```
+    """
+    return BatchJob(
+        name=name,
+        command=None,
+        argv=[],
+        reads=frozenset(reads),
+        writes=frozenset(writes),
+    )
+
+
+class TestBatch(TestCase):
+    """Test class for batch.py"""
+
+    def test_load_manifest(self) -> None:
+        """Tests `load_manifest` converts each job to the CLI arguments that run it, and the files it touches"""
+        with TemporaryDirectory() as temp_dir:
+            manifest: str = path.join(temp_dir, "manifest.json")
+            src: str = path.realpath(path.join(temp_dir, "src.py"))
+            out: str = path.realpath(path.join(temp_dir, "out.py"))
+            with open(src, "wt") as f:
+                f.write(function_src)
+            with open(manifest, "wt") as f:
+                dump(
+                    {
+                        "jobs": [
+                            {
+                                "command": "gen",
+                                "name": "gen f",
+                                "name-tpl": "{name}Config",
+                                "input_mapping": src,
+                                "emit": "class",
+                                "decorator": ["a", "b"],
+                                "emit-call": False,
+                                "o": out,
+                            },
+                            {
+                                "command": "doctrans",
+                                "filename": [out],
+                                "format": "google",
+                                "type_annotations": True,
+                            },
+                        ]
+                    },
+                    f,
+                )
+            self.assertListEqual(
+                load_manifest(manifest),
+                [
+                    BatchJob(
+                        name="gen f",
+                        command="gen",
+                        argv=[
+                            "gen",
+                            "--name-tpl",
+                            "{name}Config",
+                            "--input-mapping",
+                            src,
+                            "--emit",
+                            "class",
+                            "--decorator",
+                            "a",
+                            "--decorator",
+                            "b",
+                            "--output-filename",
+                            out,
+                        ],
+                        reads=frozenset((src,)),
+                        writes=frozenset((out,)),
+                    ),
+                    BatchJob(
+                        name="doctrans #2",
+                        command="doctrans",
+                        argv=[
+                            "doctrans",
+                            "--filename",
+                            out,
+                            "--format",
+                            "google",
+                            "--type-annotations",
+                        ],
+                        reads=frozenset((out,)),
+                        writes=frozenset((out,)),
+                    ),
+                ],
+            )
+
+            for job in (
+                {"command": "serve"},
+                {"command": "gen", "nope": True},
+                {"command": "doctrans", "filename": out},
+            ):
+                with open(manifest, "wt") as f:
+                    dump([job], f)
+                with patch("sys.stderr", new_callable=StringIO):
+                    self.assertRaises(ValueError, load_manifest, manifest)
+
+    def test_job_dependencies(self) -> None:
+        """
+        Tests `job_dependencies` puts the job creating a file before those touching it, wherever it is in the manifest;
+        otherwise keeping to the order of the manifest; and rejects jobs waiting on each other
+        """
+        self.assertListEqual(
+            job_dependencies(
+                [
+                    _job("edit out", reads=("out",), writes=("out",)),
+                    _job("gen out", reads=("src",), writes=("out",)),
+                    _job("edit src", reads=("src",), writes=("src",)),
+                    _job("exmod", reads=("src",), writes=("out_dir",)),
+                    _job(
+                        "read out_dir/foo.py", reads=(path.join("out_dir", "foo.py"),)
+                    ),
+                    _job("unrelated", reads=("other",)),
+                ]
+            ),
+            [
+                frozenset((1,)),
+                frozenset(),
+                frozenset((1,)),
+                frozenset((2,)),
+                frozenset((3,)),
+                frozenset(),
+            ],
+        )
+        self.assertRaises(
+            ValueError,
+            job_dependencies,
+            [
+                _job("a", reads=("a",), writes=("b",)),
+                _job("b", reads=("b",), writes=("c",)),
+                _job("c", reads=("c",), writes=("a",)),
+            ],
+        )
+
+    def test_run_batch(self) -> None:
+        """
+        Tests `run_batch` runs the jobs in order—serially and on workers—reporting each; skipping the jobs depending
+        on one that failed
+        """
+        for max_workers in None, 2:
+            with TemporaryDirectory() as temp_dir:
+                src: str = path.join(temp_dir, "src.py")
+                out: str = path.join(temp_dir, "out.py")
+                with open(src, "wt") as f:
+                    f.write(function_src)
+                jobs = [
+                    BatchJob(
+                        name="doctrans out",
+                        command="doctrans",
+                        argv=[
+                            "doctrans",
+                            "--filename",
+                            out,
+                            "--format",
+                            "google",
+                            "--type-annotations",
+                        ],
+                        reads=frozenset((out,)),
+                        writes=frozenset((out,)),
+                    ),
+                    BatchJob(
+                        name="gen out",
+                        command="gen",
+                        argv=[
+                            "gen",
+                            "--name-tpl",
+                            "{name}Config",
+                            "--input-mapping",
+                            src,
+                            "--emit",
+                            "class",
+                            "--output-filename",
+                            out,
+                        ],
+                        reads=frozenset((src,)),
+                        writes=frozenset((out,)),
+                    ),
+                    BatchJob(
+                        name="doctrans nope",
+                        command="doctrans",
+                        argv=[
+                            "doctrans",
+                            "--filename",
+                            src + "nope",
+                            "--format",
+                            "google",
+                            "--type-annotations",
+                        ],
+                        reads=frozenset((src + "nope",)),
+                        writes=frozenset((src + "nope",)),
+                    ),
+                    BatchJob(
+                        name="sync_properties nope",
+                        command="sync_properties",
+                        argv=[
+                            "sync_properties",
+                            "--input-filename",
+                            src + "nope",
+                            "--input-param",
+                            "a",
+                            "--output-filename",
+                            src,
+                            "--output-param",
+                            "f.a",
+                        ],
+                        reads=frozenset((src, src + "nope")),
+                        writes=frozenset((src,)),
+                    ),
+                ]
+                with patch("sys.stdout", new_callable=StringIO) as stdout:
+                    self.assertTupleEqual(
+                        run_batch(jobs, max_workers=max_workers), (2, 1, 1)
+                    )
+                lines = stdout.getvalue().splitlines()
+                statuses = list(
+                    map(
+                        lambda line: (
+                            line.split()[0],
+                            line.partition("s  ")[2].partition("\t")[0],
+                        ),
+                        filter(
+                            lambda line: line.startswith(
+                                ("succeeded", "failed", "skipped")
+                            ),
+                            lines,
+                        ),
+                    )
+                )
+                expected_statuses = [
+                    ("succeeded", "gen out"),
+                    ("succeeded", "doctrans out"),
+                    ("failed", "doctrans nope"),
+                    ("skipped", "sync_properties nope"),
+                ]
+                if max_workers is None:
+                    self.assertListEqual(statuses, expected_statuses)
+                else:  # Independent jobs complete in any order
+                    self.assertListEqual(sorted(statuses), sorted(expected_statuses))
+                self.assertTrue(
+                    lines[-1].startswith(
+                        "4 job(s): 2 succeeded, 1 failed, 1 skipped in "
+                    )
+                )
+                with open(out, "rt") as f:
+                    self.assertIn("class fConfig", f.read())
+
+    def test_run_job_output(self) -> None:
+        """Tests each job captures what exmod prints, not only the first job to import it"""
+        with TemporaryDirectory() as temp_dir:
+            results = list(
+                map(
+                    lambda _: _run_job(
+                        [
+                            "exmod",
+                            "--module",
+                            "cdd.tests.mocks.classes",
+                            "--emit",
+                            "argparse",
+                            "--output-directory",
+                            path.join(temp_dir, "out"),
+                            "--dry-run",
+                        ]
+                    ),
+                    range(2),
+                )
+            )
+        self.assertListEqual(list(map(lambda result: result[0], results)), [True] * 2)
+        self.assertIn("mkdir\t", results[0][2])
+        self.assertEqual(results[0][2], results[1][2])
+
+
+unittest_main()
@@ -1,13 +1,15 @@
 """ Tests for doctrans """
 
 from copy import deepcopy
-from os import path
+from io import StringIO
+from os import makedirs, path
 from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import patch
 
-from cdd.compound.doctrans import doctrans
+from cdd.compound.doctrans import doctrans, doctrans_filenames, doctrans_files
 from cdd.shared.ast_utils import annotate_ancestry
+from cdd.shared.ir_cache import set_ir_cache_dir
 from cdd.shared.source_transformer import to_code
 from cdd.tests.mocks.doctrans import function_type_annotated
 from cdd.tests.mocks.methods import return_ast
@@ -29,7 +31,7 @@ class TestDocTrans(TestCase):
             filename: str = path.join(temp_dir, "foo")
             with open(filename, "wt") as f:
                 f.write("5*5")
-            self.assertIsNone(
+            self.assertFalse(
                 doctrans(
                     filename=filename,
                     no_word_wrap=None,
@@ -48,7 +50,7 @@ class TestDocTrans(TestCase):
             original_node = annotate_ancestry(deepcopy(function_type_annotated))
             with open(filename, "wt") as f:
                 f.write(to_code(original_node))
-            self.assertIsNone(
+            self.assertTrue(
                 doctrans(
                     filename=filename,
                     no_word_wrap=None,
@@ -63,5 +65,90 @@ class TestDocTrans(TestCase):
             #     self, new_node, gold=function_type_in_docstring, skip_black=True
             # )
 
+    def test_doctrans_conformant_cache(self) -> None:
+        """Tests doctrans remembers conformant files, skipping them unparsed until their contents change"""
+
+        with TemporaryDirectory() as temp_dir:
+            filename: str = path.join(
+                temp_dir, "fun{extsep}py".format(extsep=path.extsep)
+            )
+            with open(filename, "wt") as f:
+                f.write(to_code(annotate_ancestry(deepcopy(function_type_annotated))))
+            kwargs = dict(
+                filename=filename,
+                no_word_wrap=None,
+                docstring_format="rest",
+                type_annotations=True,
+            )
+            set_ir_cache_dir(path.join(temp_dir, "cache"))
+            try:
+                self.assertFalse(doctrans(**kwargs))
+                with patch(
+                    "cdd.compound.doctrans.ast_parse", side_effect=AssertionError
+                ):
+                    self.assertFalse(doctrans(**kwargs))
+                    self.assertRaises(
+                        AssertionError, doctrans, **dict(kwargs, type_annotations=False)
+                    )
+                    with open(filename, "at") as f:
+                        f.write("\n")
+                    self.assertRaises(AssertionError, doctrans, **kwargs)
+            finally:
+                set_ir_cache_dir(None)
+
+    def test_doctrans_files(self) -> None:
+        """Tests doctrans_files on directories and globs, with `check` and on a pool of workers"""
+
+        with TemporaryDirectory() as temp_dir:
+            src: str = to_code(annotate_ancestry(deepcopy(function_type_annotated)))
+            filenames = tuple(
+                map(
+                    lambda name: path.join(
+                        temp_dir, name, "fun{extsep}py".format(extsep=path.extsep)
+                    ),
+                    ("a", path.join("a", "b"), "c"),
+                )
+            )
+            for filename in filenames:
+                makedirs(path.dirname(filename), exist_ok=True)
+                with open(filename, "wt") as f:
+                    f.write(src)
+            open(path.join(temp_dir, "a", "README"), "a").close()
+
+            self.assertListEqual(
+                doctrans_filenames(path.join(temp_dir, "a")),
+                list(filenames[:2]),
+            )
+            self.assertListEqual(
+                doctrans_filenames(path.join(temp_dir, "*", "fun*")),
+                [filenames[0], filenames[2]],
+            )
+            self.assertListEqual(doctrans_filenames(path.join(temp_dir, "z*")), [])
+
+            kwargs = dict(
+                no_word_wrap=None, docstring_format="rest", type_annotations=False
+            )
+            with patch("sys.stdout", new_callable=StringIO) as out:
+                self.assertTupleEqual(
+                    doctrans_files(list(filenames), check=True, **kwargs), (3, 0)
+                )
+            self.assertEqual(out.getvalue().count("would change"), 4)
+            for filename in filenames:
+                with open(filename, "rt") as f:
+                    self.assertEqual(f.read(), src)
+
+            with patch("sys.stdout", new_callable=StringIO):
+                self.assertTupleEqual(
+                    doctrans_files(
+                        list(filenames) + [path.join(temp_dir, "a", "README")],
+                        jobs=2,
+                        **kwargs
+                    ),
+                    (3, 0),
+                )
+                self.assertTupleEqual(
+                    doctrans_files(list(filenames), check=True, **kwargs), (0, 0)
+                )
+
 
 unittest_main()
@@ -16,13 +16,20 @@ from unittest.mock import patch
 
 import cdd.class_.parse
 from cdd.compound.exmod import exmod
+from cdd.compound.exmod_utils import (
+    EXMOD_MANIFEST_FILENAME,
+    emit_file_on_hierarchy,
+)
 from cdd.shared.ast_utils import maybe_type_comment, set_value
+from cdd.shared.parse.utils.parser_utils import get_parser
 from cdd.shared.pkg_utils import relative_filename
 from cdd.shared.pure_utils import (
     ENCODING,
     INIT_FILENAME,
     PY_GTE_3_8,
     PY_GTE_3_12,
+    find_module_filepath,
+    read_file_to_str,
     rpartial,
     unquote,
 )
@@ -111,6 +118,174 @@ class TestExMod(TestCase):
             # sys.path.remove(existent_module_dir)
             self._pip(["uninstall", "-y", self.package_root_name])
 
+    @skipIf(
+        github_actions_and_non_windows_and_gte_3_12,
+        github_actions_err,
+    )
+    def test_exmod_jobs(self) -> None:
+        """Tests `exmod` with a worker pool emits the same tree as the serial run"""
+
+        try:
+            with TemporaryDirectory(prefix="search_root", suffix="search_path") as root:
+                existent_module_dir, new_module_dir = self.create_and_install_pkg(root)
+                _exmod = partial(
+                    exmod,
+                    module=self.module_name,
+                    emit_name="class",
+                    blacklist=tuple(),
+                    whitelist=tuple(),
+                    mock_imports=True,
+                    emit_sqlalchemy_submodule=False,
+                    target_module_name="gold",
+                    extra_modules=None,
+                    no_word_wrap=None,
+                    recursive=True,
+                    dry_run=False,
+                )
+                serial_dir, parallel_dir = map(
+                    lambda directory: path.join(root, directory, "gold"),
+                    ("serial", "parallel"),
+                )
+                _exmod(output_directory=serial_dir)
+                _exmod(output_directory=parallel_dir, jobs=2)
+
+                def tree_contents(directory):
+                    """
+                    :param directory: Root directory to walk
+                    :type directory: ```str```
+
+                    :return: Sorted relative filepaths paired with their contents
+                    :rtype: ```list[tuple[str, str]]```
+                    """
+                    return sorted(
+                        (
+                            path.relpath(path.join(dirpath, filename), directory),
+                            read_file_to_str(path.join(dirpath, filename)),
+                        )
+                        for dirpath, _, filenames in walk(directory)
+                        for filename in filenames
+                        if "__pycache__" not in dirpath
+                    )
+
+                self.assertListEqual(*map(tree_contents, (serial_dir, parallel_dir)))
+        finally:
+            self._pip(["uninstall", "-y", self.package_root_name])
+
+    @skipIf(
+        github_actions_and_non_windows_and_gte_3_12,
+        github_actions_err,
+    )
+    def test_exmod_incremental(self) -> None:
+        """Tests `exmod` incremental only regenerates changed sources"""
+
+        try:
+            with TemporaryDirectory(prefix="search_root", suffix="search_path") as root:
+                existent_module_dir, new_module_dir = self.create_and_install_pkg(root)
+                _exmod = partial(
+                    exmod,
+                    module=self.module_name,
+                    emit_name="class",
+                    blacklist=tuple(),
+                    whitelist=tuple(),
+                    mock_imports=True,
+                    emit_sqlalchemy_submodule=False,
+                    output_directory=new_module_dir,
+                    target_module_name="gold",
+                    extra_modules=None,
+                    no_word_wrap=None,
+                    recursive=False,
+                    dry_run=False,
+                    incremental=True,
+                )
+                _exmod()
+                self.assertTrue(
+                    path.isfile(path.join(new_module_dir, EXMOD_MANIFEST_FILENAME))
+                )
+                self._check_emission(existent_module_dir, new_module_dir)
+
+                with patch(
+                    "cdd.compound.exmod_utils.emit_file_on_hierarchy",
+                    wraps=emit_file_on_hierarchy,
+                ) as emit_file_mock:
+                    _exmod()
+                emit_file_mock.assert_not_called()
+
+                # The package is installed (copied), so edit the source that exmod read
+                parent_filepath: str = find_module_filepath(
+                    ".".join((self.module_name, self.parent_dir)), self.parent_name
+                )
+                parent_source: str = read_file_to_str(parent_filepath)
+                with open(parent_filepath, "wt") as f:
+                    f.write(parent_source.replace("name of dataset", "dataset name"))
+
+                with patch(
+                    "cdd.compound.exmod_utils.emit_file_on_hierarchy",
+                    wraps=emit_file_on_hierarchy,
+                ) as emit_file_mock:
+                    _exmod()
+                emit_file_mock.assert_called_once()
+                self.assertIn(
+                    "dataset name",
+                    read_file_to_str(
+                        path.join(
+                            new_module_dir,
+                            self.parent_dir,
+                            "{name}{extsep}py".format(
+                                name=self.parent_name, extsep=extsep
+                            ),
+                        )
+                    ),
+                )
+        finally:
+            self._pip(["uninstall", "-y", self.package_root_name])
+
+    @skipIf(
+        github_actions_and_non_windows_and_gte_3_12,
+        github_actions_err,
+    )
+    def test_exmod_multiple_emit(self) -> None:
+        """Tests `exmod` parses each symbol once for every one of multiple `emit_name`"""
+
+        try:
+            with TemporaryDirectory(prefix="search_root", suffix="search_path") as root:
+                existent_module_dir, new_module_dir = self.create_and_install_pkg(root)
+                with patch(
+                    "cdd.compound.exmod_utils.get_parser", wraps=get_parser
+                ) as get_parser_mock, patch(
+                    "cdd.compound.exmod_utils.emit_file_on_hierarchy",
+                    wraps=emit_file_on_hierarchy,
+                ) as emit_file_mock:
+                    exmod(
+                        module=self.module_name,
+                        emit_name=["class", "function"],
+                        blacklist=tuple(),
+                        whitelist=tuple(),
+                        mock_imports=True,
+                        emit_sqlalchemy_submodule=False,
+                        output_directory=new_module_dir,
+                        target_module_name="gold",
+                        extra_modules=None,
+                        no_word_wrap=None,
+                        recursive=False,
+                        dry_run=False,
+                    )
+                self.assertGreater(get_parser_mock.call_count, 0)
+                self.assertEqual(
+                    emit_file_mock.call_count, 2 * get_parser_mock.call_count
+                )
+                self.assertListEqual(
+                    list(
+                        map(
+                            lambda call: call.kwargs["emit_name"],
+                            emit_file_mock.call_args_list[:2],
+                        )
+                    ),
+                    ["class", "function"],
+                )
+                self._check_emission(existent_module_dir, new_module_dir)
+        finally:
+            self._pip(["uninstall", "-y", self.package_root_name])
+
     @skipIf(
         github_actions_and_non_windows_and_gte_3_12,
         github_actions_err,
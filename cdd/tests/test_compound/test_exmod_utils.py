@@ -1,9 +1,9 @@
 """ Tests for exmod_utils """
 
-from ast import Module
-from collections import deque
+from ast import ClassDef, Module
+from collections import OrderedDict, deque
 from io import StringIO
-from os import path
+from os import listdir, path
 from os.path import extsep
 from tempfile import TemporaryDirectory
 from unittest import TestCase
@@ -12,9 +12,13 @@ from unittest.mock import MagicMock, patch
 from cdd.compound.exmod_utils import (
     _emit_symbol,
     emit_file_on_hierarchy,
+    flush_staged_modules,
     get_module_contents,
+    remove_exmod_outputs,
 )
-from cdd.shared.pure_utils import INIT_FILENAME, quote, rpartial
+from cdd.shared.ast_utils import get_value
+from cdd.shared.pure_utils import INIT_FILENAME, quote, read_file_to_str, rpartial
+from cdd.shared.source_transformer import ast_parse, ast_parse_file
 from cdd.shared.types import IntermediateRepr
 from cdd.tests.utils_for_tests import unittest_main
 
@@ -73,6 +77,59 @@ class TestExmodUtils(TestCase):
             )
             self.assertTrue(path.isdir(tempdir))
 
+    def test_emit_file_on_hierarchy_staged(self) -> None:
+        """Test `emit_file_on_hierarchy` defers writing to `flush_staged_modules`"""
+
+        staged_modules = OrderedDict()
+        with patch(
+            "cdd.compound.exmod_utils.EXMOD_OUT_STREAM", new_callable=StringIO
+        ), TemporaryDirectory() as tempdir:
+            emit_filename: str = path.join(
+                tempdir, "foo{extsep}py".format(extsep=extsep)
+            )
+            for name in "Foo", "Bar":
+                emit_file_on_hierarchy(
+                    (
+                        "foo.{name}".format(name=name),
+                        "foo{extsep}py".format(extsep=extsep),
+                        {
+                            "name": name,
+                            "doc": "{name} class".format(name=name),
+                            "params": OrderedDict((("a", {"typ": "int"}),)),
+                            "returns": None,
+                        },
+                    ),
+                    "class",
+                    "",
+                    "",
+                    False,
+                    filesystem_layout="as_input",
+                    output_directory=tempdir,
+                    first_output_directory=tempdir,
+                    no_word_wrap=None,
+                    dry_run=False,
+                    extra_modules_to_all=None,
+                    staged_modules=staged_modules,
+                )
+            self.assertFalse(path.isfile(emit_filename))
+            self.assertIn(emit_filename, staged_modules)
+
+            flush_staged_modules(staged_modules)
+            self.assertDictEqual(staged_modules, {})
+            mod: Module = ast_parse(read_file_to_str(emit_filename))
+            self.assertListEqual(
+                list(
+                    map(
+                        lambda node: node.name,
+                        filter(rpartial(isinstance, ClassDef), mod.body),
+                    )
+                ),
+                ["Foo", "Bar"],
+            )
+            self.assertListEqual(
+                list(map(get_value, mod.body[-1].value.elts)), ["Bar", "Foo"]
+            )
+
     def test__emit_symbols_isfile_emit_filename_true(self) -> None:
         """Test `_emit_symbol` when `isfile_emit_filename is True`"""
         with patch(
@@ -111,9 +168,52 @@ class TestExmodUtils(TestCase):
             func__infer_imports.assert_called_once()
             func__deduplicate_sorted_imports.assert_called_once()
 
+    def test_remove_exmod_outputs(self) -> None:
+        """Test `remove_exmod_outputs` keeps outputs still claimed by another source"""
+        with TemporaryDirectory() as tempdir:
+            for filename in "a.py", "b.py", INIT_FILENAME:
+                open(path.join(tempdir, filename), "a").close()
+            remove_exmod_outputs(
+                tempdir,
+                stale_sources={"a_src.py": {"outputs": ["a.py", INIT_FILENAME]}},
+                kept_sources={"b_src.py": {"outputs": ["b.py", INIT_FILENAME]}},
+            )
+            self.assertListEqual(
+                sorted(listdir(tempdir)), sorted(("b.py", INIT_FILENAME))
+            )
+
     def test_get_module_contents_empty(self) -> None:
         """`get_module_contents`"""
         self.assertDictEqual(get_module_contents(None, "nonexistent", {}), {})
 
+    def test_get_module_contents_symbol_table(self) -> None:
+        """`get_module_contents` parses each file once per symbol table; reparsing when it changes"""
+        with TemporaryDirectory() as tempdir:
+            filepath: str = path.join(tempdir, "a{extsep}py".format(extsep=extsep))
+            with open(filepath, "wt") as f:
+                f.write("class A(object): pass\n")
+            symbol_table = {}
+            with patch(
+                "cdd.compound.exmod_utils.ast_parse_file", wraps=ast_parse_file
+            ) as ast_parse_mock:
+                self.assertListEqual(
+                    list(
+                        get_module_contents(None, filepath, symbol_table=symbol_table)
+                    ),
+                    ["A"],
+                )
+                get_module_contents(None, filepath, symbol_table=symbol_table)
+                self.assertEqual(ast_parse_mock.call_count, 1)
+
+                with open(filepath, "at") as f:
+                    f.write("class B(object): pass\n")
+                self.assertListEqual(
+                    list(
+                        get_module_contents(None, filepath, symbol_table=symbol_table)
+                    ),
+                    ["A", "B"],
+                )
+                self.assertEqual(ast_parse_mock.call_count, 2)
+
 
 unittest_main()
@@ -16,6 +16,7 @@ from ast import (
     Store,
 )
 from copy import deepcopy
+from functools import partial
 from io import StringIO
 from json import dump
 from os.path import extsep
@@ -294,6 +295,70 @@ class TestGen(TestCase):
             gold=gold,
         )
 
+    def test_gen_sqlalchemy_directory(self) -> None:
+        """Tests `gen` to a directory writes a file per SQLalchemy model, importing the models they use"""
+        with TemporaryDirectory() as tempdir:
+            input_dir, output_dir = map(
+                partial(os.path.join, tempdir), ("models_in", "models_out")
+            )
+            os.mkdir(input_dir)
+            os.mkdir(output_dir)
+            with open(
+                os.path.join(input_dir, "models{extsep}py".format(extsep=extsep)), "wt"
+            ) as f:
+                f.write(
+                    "class Element(object):\n"
+                    '    """\n'
+                    "    :cvar element_id: The id. Defaults to 0\n"
+                    '    """\n'
+                    "    element_id: int = 0\n\n\n"
+                    "class Node(object):\n"
+                    '    """\n'
+                    "    :cvar node_id: The id. Defaults to 0\n"
+                    "    :cvar primary_element: The element\n"
+                    '    """\n'
+                    "    node_id: int = 0\n"
+                    "    primary_element: Element\n"
+                )
+            with patch("sys.stdout", new_callable=StringIO):
+                filenames = gen(
+                    name_tpl="{name}",
+                    input_mapping=input_dir,
+                    parse_name="class",
+                    emit_name="sqlalchemy",
+                    output_filename=output_dir,
+                )
+                self.assertRaises(
+                    IOError,
+                    gen,
+                    name_tpl="{name}",
+                    input_mapping=input_dir,
+                    parse_name="class",
+                    emit_name="sqlalchemy",
+                    output_filename=output_dir,
+                )
+            self.assertListEqual(
+                filenames,
+                list(
+                    map(
+                        lambda name: os.path.join(
+                            output_dir,
+                            "{name}{extsep}py".format(name=name, extsep=extsep),
+                        ),
+                        ("element", "node"),
+                    )
+                ),
+            )
+            with open(filenames[1], "rt") as f:
+                node_mod: Module = ast.parse(f.read())
+            self.assertEqual(
+                to_code(node_mod.body[0]).rstrip("\n"),
+                "from models_out.element import Element",
+            )
+            self.assertEqual(
+                next(filter(rpartial(isinstance, ClassDef), node_mod.body)).name, "Node"
+            )
+
     def test_gen_phase_mocked(self) -> None:
         """Tests that different phases are branched to correctly (doesn't test their internals though)"""
         with patch(
@@ -1,8 +1,13 @@
 """ Tests for gen_utils """
 
+from ast import Assign, ClassDef, Expr, parse
+from copy import deepcopy
 from unittest import TestCase
 
-from cdd.compound.gen_utils import get_input_mapping_from_path
+from cdd.compound.gen_utils import gen_module, get_input_mapping_from_path
+from cdd.shared.source_transformer import to_code
+from cdd.tests.mocks.classes import class_ast
+from cdd.tests.mocks.sqlalchemy import config_decl_base_ast
 from cdd.tests.utils_for_tests import unittest_main
 
 
@@ -27,5 +32,33 @@ class TestGenUtils(TestCase):
         self.assertIn("f", name_to_node)
         self.assertIsInstance(name_to_node["f"], dict)
 
+    def test_gen_module(self) -> None:
+        """test `gen_module` assembles the module: docstring, then `__future__` & other imports, then the rest"""
+        module = gen_module(
+            decorator_list=None,
+            emit_and_infer_imports=True,
+            emit_call=False,
+            emit_default_doc=False,
+            emit_name="class",
+            functions_and_classes=(deepcopy(class_ast), deepcopy(config_decl_base_ast)),
+            imports="import os\n",
+            input_mapping_it=None,
+            name_tpl=None,
+            no_word_wrap=None,
+            parse_name=None,
+            prepend='"""\nGenerated\n"""\nfrom __future__ import annotations\n',
+            global__all__=["ConfigClass", "Config"],
+        )
+        self.assertIsInstance(module.body[0], Expr)
+        self.assertListEqual(
+            list(map(type, module.body[-3:])), [ClassDef, ClassDef, Assign]
+        )
+        self.assertEqual(module.body[1].module, "__future__")
+        self.assertListEqual(
+            list(map(lambda node: getattr(node, "module", None), module.body[2:-3])),
+            [None, "sqlalchemy", "typing"],
+        )
+        self.assertEqual(to_code(parse(to_code(module))), to_code(module))
+
 
 unittest_main()
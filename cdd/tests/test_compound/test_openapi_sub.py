@@ -8,6 +8,7 @@ from os.path import extsep
 from tempfile import TemporaryDirectory
 from unittest import TestCase
 
+import cdd.shared.tracing
 from cdd.compound.openapi.gen_openapi import openapi_bulk
 from cdd.shared.pure_utils import INIT_FILENAME
 from cdd.tests.mocks.openapi import openapi_dict_with_sql_types
@@ -72,5 +73,46 @@ class TestOpenApiBulk(TestCase):
 
             self.assertDictEqual(gen, gold)
 
+    def test_openapi_bulk_jobs(self) -> None:
+        """
+        Tests `openapi_bulk` on a pool of workers produces what it does serially, tracing each file
+        """
+        with TemporaryDirectory() as tempdir:
+            temp_dir_join = partial(path.join, tempdir)
+            models_filename, *routes_filenames = map(
+                lambda name: temp_dir_join(
+                    "{name}{extsep}py".format(name=name, extsep=extsep)
+                ),
+                ("models", "routes0", "routes1"),
+            )
+
+            with open(models_filename, "wt") as f:
+                f.write(
+                    "\n".join((sqlalchemy_imports_str, config_tbl_with_comments_str))
+                )
+            for routes_filename, routes in zip(
+                routes_filenames, ((create_route,), (read_route, destroy_route))
+            ):
+                with open(routes_filename, "wt") as f:
+                    f.write("\n".join((route_mock_prelude,) + routes))
+
+            cdd.shared.tracing.enable_tracing()
+            try:
+                gen = openapi_bulk(
+                    app_name="rest_api",
+                    model_paths=(models_filename,),
+                    routes_paths=tuple(routes_filenames),
+                    jobs=2,
+                )
+            finally:
+                cdd.shared.tracing.disable_tracing()
+
+        self.assertDictEqual(gen, openapi_dict_with_sql_types)
+        summary: str = cdd.shared.tracing.tracing_summary()
+        for filename in [models_filename] + routes_filenames:
+            self.assertIn(
+                "openapi_bulk.parse:{filename}".format(filename=filename), summary
+            )
+
 
 unittest_main()
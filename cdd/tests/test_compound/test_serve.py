@@ -0,0 +1,224 @@
+""" Tests for serve """
+
+import socket
+from io import StringIO
+from json import dumps, loads
+from os import path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import sleep
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+import cdd.shared.ir_cache
+import cdd.shared.tracing
+from cdd import __version__
+from cdd.compound.serve import (
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    SERVER_ERROR,
+    call,
+    forward,
+    handle_request,
+    serve_stdio,
+    serve_unix_socket,
+)
+from cdd.tests.utils_for_tests import unittest_main
+
+
+class TestServe(TestCase):
+    """Test class for serve.py"""
+
+    def test_handle_request(self) -> None:
+        """Tests `handle_request` calls the entry point, capturing what it prints and how it exits"""
+        response = handle_request(
+            {"jsonrpc": "2.0", "method": "main", "params": [["--version"]], "id": 1}
+        )
+        self.assertDictEqual(
+            response,
+            {
+                "jsonrpc": "2.0",
+                "result": {
+                    "return": None,
+                    "stdout": "python -m cdd {__version__}\n".format(
+                        __version__=__version__
+                    ),
+                    "stderr": "",
+                    "exit_code": 0,
+                },
+                "id": 1,
+            },
+        )
+        self.assertIsNone(
+            handle_request(
+                {"jsonrpc": "2.0", "method": "main", "params": {"argv": ["--version"]}}
+            )
+        )
+        self.assertEqual(
+            handle_request({"jsonrpc": "2.0", "method": "nope", "id": 2})["error"][
+                "code"
+            ],
+            METHOD_NOT_FOUND,
+        )
+        self.assertEqual(handle_request([])["error"]["code"], INVALID_REQUEST)
+        error = handle_request(
+            {
+                "jsonrpc": "2.0",
+                "method": "main",
+                "params": {"argv": ["serve"]},
+                "id": 3,
+            }
+        )["error"]
+        self.assertEqual(error["code"], SERVER_ERROR)
+        self.assertEqual(error["data"]["type"], "ValueError")
+
+    def test_handle_request_exmod(self) -> None:
+        """Tests what exmod prints is captured by each request, not only the first to import it"""
+        with TemporaryDirectory() as temp_dir:
+            responses = list(
+                map(
+                    lambda request_id: handle_request(
+                        {
+                            "jsonrpc": "2.0",
+                            "method": "main",
+                            "params": [
+                                [
+                                    "exmod",
+                                    "--module",
+                                    "cdd.tests.mocks.classes",
+                                    "--emit",
+                                    "argparse",
+                                    "--output-directory",
+                                    path.join(temp_dir, "out"),
+                                    "--dry-run",
+                                ]
+                            ],
+                            "id": request_id,
+                        }
+                    )["result"]["stdout"],
+                    (1, 2),
+                )
+            )
+        self.assertIn("mkdir\t", responses[0])
+        self.assertEqual(*responses)
+
+    def test_handle_request_global_options(self) -> None:
+        """Tests the global options of a request—`--cache-dir` and `--timings`—don't leak into the next"""
+        with TemporaryDirectory() as temp_dir:
+
+            def request(request_id, global_options):
+                """
+                :param request_id: `id` of the request
+                :type request_id: ```int```
+
+                :param global_options: Global options to run exmod with
+                :type global_options: ```list[str]```
+
+                :return: What the request printed to stderr
+                :rtype: ```str```
+                """
+                return handle_request(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": "main",
+                        "params": [
+                            global_options
+                            + [
+                                "exmod",
+                                "--module",
+                                "cdd.tests.mocks.classes",
+                                "--emit",
+                                "argparse",
+                                "--output-directory",
+                                path.join(temp_dir, "out"),
+                                "--dry-run",
+                            ]
+                        ],
+                        "id": request_id,
+                    }
+                )["result"]["stderr"]
+
+            cdd.shared.tracing.enable_tracing()
+            try:
+                cdd.shared.tracing.count("daemon")
+                self.assertIn(
+                    "exmod",
+                    request(
+                        1, ["--cache-dir", path.join(temp_dir, "cache"), "--timings"]
+                    ),
+                )
+                self.assertIsNone(cdd.shared.ir_cache.IR_CACHE_DIR)
+                self.assertTrue(cdd.shared.tracing.TRACING)
+                self.assertIn("daemon", cdd.shared.tracing.tracing_summary())
+                self.assertNotIn("exmod", cdd.shared.tracing.tracing_summary())
+            finally:
+                cdd.shared.tracing.disable_tracing()
+            self.assertEqual(request(2, []), "")
+            self.assertIsNone(cdd.shared.ir_cache.IR_CACHE_DIR)
+            self.assertFalse(cdd.shared.tracing.TRACING)
+
+    def test_serve_stdio(self) -> None:
+        """Tests `serve_stdio` answers each request line, skipping notifications, until `shutdown`"""
+        stdout = StringIO()
+        serve_stdio(
+            StringIO(
+                "\n".join(
+                    (
+                        dumps({"jsonrpc": "2.0", "method": "nope", "id": 1}),
+                        "{",
+                        dumps({"jsonrpc": "2.0", "method": "nope"}),
+                        "",
+                        dumps({"jsonrpc": "2.0", "method": "shutdown", "id": 2}),
+                        dumps({"jsonrpc": "2.0", "method": "nope", "id": 3}),
+                    )
+                )
+            ),
+            stdout,
+        )
+        responses = list(map(loads, stdout.getvalue().splitlines()))
+        self.assertListEqual(
+            list(map(lambda response: response["id"], responses)), [1, None, 2]
+        )
+        self.assertEqual(responses[1]["error"]["code"], PARSE_ERROR)
+        self.assertIsNone(responses[2]["result"])
+
+    @skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets are unsupported")
+    def test_serve_unix_socket(self) -> None:
+        """Tests `serve_unix_socket` serves `call`s and CLI commands `forward`ed to it, until `shutdown`"""
+        with TemporaryDirectory() as temp_dir:
+            socket_path: str = path.join(temp_dir, "cdd.sock")
+            server = Thread(target=serve_unix_socket, args=(socket_path,))
+            server.start()
+            try:
+                for _ in range(100):
+                    try:
+                        result = call(socket_path, "main", {"argv": ["--version"]})
+                        break
+                    except OSError:  # Not listening yet
+                        sleep(0.01)
+                self.assertDictEqual(
+                    result,
+                    {
+                        "return": None,
+                        "stdout": "python -m cdd {__version__}\n".format(
+                            __version__=__version__
+                        ),
+                        "stderr": "",
+                        "exit_code": 0,
+                    },
+                )
+                self.assertRaises(RuntimeError, call, socket_path, "nope")
+                with patch("sys.stderr", new_callable=StringIO) as stderr:
+                    self.assertEqual(
+                        forward(socket_path, ["doctrans", "--filename", "nope.py"]),
+                        2,
+                    )
+                self.assertIn("error: ", stderr.getvalue())
+            finally:
+                self.assertIsNone(call(socket_path, "shutdown"))
+                server.join()
+            self.assertFalse(path.exists(socket_path))
+
+
+unittest_main()
@@ -3,9 +3,16 @@ Tests for the Intermediate Representation produced by the parsers
 """
 
 from collections import OrderedDict
+from copy import deepcopy
 from unittest import TestCase
 
 import cdd.docstring.parse
+from cdd.shared.docstring_parsers import (
+    disable_docstring_cache,
+    docstring_cache_info,
+    enable_docstring_cache,
+    parse_docstring,
+)
 from cdd.shared.types import IntermediateRepr
 from cdd.tests.mocks.docstrings import (
     docstring_keras_rmsprop_class_str,
@@ -58,5 +65,34 @@ class TestParseDocstring(TestCase):
             docstring_keras_rmsprop_method_ir,
         )
 
+    def test_parse_docstring_cache(self) -> None:
+        """Tests `parse_docstring` memoizes per docstring and options, returning independent copies"""
+
+        enable_docstring_cache(maxsize=2)
+        try:
+            first: IntermediateRepr = parse_docstring(docstring_keras_rmsprop_class_str)
+            expected: IntermediateRepr = deepcopy(first)
+            first["params"].clear()
+            second: IntermediateRepr = parse_docstring(
+                docstring_keras_rmsprop_class_str
+            )
+            self.assertIsNot(second, first)
+            self.assertDictEqual(second, expected)
+            parse_docstring(
+                docstring_keras_rmsprop_class_str, default_search_announce=["Default"]
+            )
+            parse_docstring(
+                docstring_keras_rmsprop_class_str, default_search_announce=["Default"]
+            )
+            self.assertTupleEqual(docstring_cache_info()[:4], (2, 2, 2, 2))
+
+            disable_docstring_cache()
+            self.assertIsNone(docstring_cache_info())
+            self.assertDictEqual(
+                parse_docstring(docstring_keras_rmsprop_class_str), expected
+            )
+        finally:
+            enable_docstring_cache()
+
 
 unittest_main()
@@ -42,6 +42,7 @@ import cdd.tests.utils_for_tests
 from cdd.shared.ast_utils import (
     NoneStr,
     RewriteAtQuery,
+    SymbolIndex,
     _parse_default_from_ast,
     annotate_ancestry,
     ast_type_to_python_type,
@@ -73,6 +74,8 @@ from cdd.shared.ast_utils import (
     set_docstring,
     set_slice,
     set_value,
+    symbol_index,
+    symbol_to_import,
     to_annotation,
 )
 from cdd.shared.pure_utils import PY3_8, PY_GTE_3_8, tab
@@ -455,6 +458,34 @@ class TestAstUtils(TestCase):
             ),
         )
 
+    def test_symbol_index(self) -> None:
+        """
+        Test that `SymbolIndex` resolves symbols as scanning `modules_to_all` in order would, also once extended
+        """
+        modules_to_all = (
+            ("typing", frozenset(("List", "Optional"))),
+            ("ast", frozenset(("List", "Name"))),
+        )  # type: tuple[tuple[str, frozenset], ...]
+        index: SymbolIndex = symbol_index(modules_to_all)
+        self.assertIs(symbol_index(modules_to_all), index)
+        self.assertIs(symbol_index(index), index)
+        self.assertTupleEqual(index("List"), ("List", "typing"))
+        self.assertTupleEqual(index("Name"), ("Name", "ast"))
+        self.assertIsNone(index("Column"))
+        self.assertTupleEqual(
+            symbol_to_import("List", (("ast", {"List"}),)), ("List", "ast")
+        )
+
+        extended: SymbolIndex = index.copy()
+        extended.register("ast", frozenset(("Optional",)), prepend=True)
+        extended.register("sqlalchemy", frozenset(("Column", "List")))
+        self.assertTupleEqual(extended("Optional"), ("Optional", "ast"))
+        self.assertTupleEqual(extended("List"), ("List", "typing"))
+        self.assertTupleEqual(extended("Column"), ("Column", "sqlalchemy"))
+        self.assertTupleEqual(index("Optional"), ("Optional", "typing"))
+        self.assertEqual(len(extended.modules_to_all), 4)
+        self.assertTupleEqual(symbol_to_import("Name", extended), ("Name", "ast"))
+
     def test_node_to_dict(self) -> None:
         """
         Tests `node_to_dict`
@@ -2,12 +2,17 @@
 
 from unittest import TestCase
 
+from cdd.shared.cst import cst_parse
 from cdd.shared.cst_utils import (
+    CstIndex,
     DictExprStatement,
+    FunctionDefinitionStart,
     GenExprStatement,
     ListCompStatement,
     SetExprStatement,
+    TripleQuoted,
     UnchangingLine,
+    cst_scanner,
     infer_cst_type,
 )
 from cdd.tests.utils_for_tests import unittest_main
@@ -33,5 +38,58 @@ class TestCstUtils(TestCase):
                 ),
             )
 
+    def test_cst_scanner(self) -> None:
+        """Test that `cst_scanner` splits into whole statements, losing no characters"""
+        for source, expected in (
+            ("", []),
+            ("a", ["a"]),
+            ("a = 5\nb = 6", ["a = 5", "\nb = 6"]),
+            ("a = (5,\n     6)\n", ["a = (5,\n     6)", "\n"]),
+            ('"""\nfoo\n"""\n# bar\n', ['"""\nfoo\n"""', "\n# bar", "\n"]),
+            ("if a:\n    b", ["if a:", "\n    b"]),
+        ):
+            scanned = cst_scanner(source)
+            self.assertListEqual(scanned, expected)
+            self.assertEqual("".join(scanned), source)
+
+    def test_cst_index(self) -> None:
+        """Test that `CstIndex` finds nodes where they are now, after inserts, deletes, and replacements"""
+        cst_index: CstIndex = CstIndex(
+            cst_parse("def f(a):\n    return a\n\n\ndef g(b):\n    return b\n")
+        )
+        g_idx, g = cst_index.find("FunctionDefinitionStart", "g", 5)
+        self.assertIsInstance(g, FunctionDefinitionStart)
+        self.assertEqual(g.name, "g")
+        self.assertTupleEqual(
+            cst_index.find("FunctionDefinitionStart", "g", 1), (None, None)
+        )
+        self.assertTupleEqual(
+            cst_index.find("ClassDefinitionStart", "g", 5), (None, None)
+        )
+
+        doc_str = TripleQuoted(
+            is_double_q=True,
+            is_docstr=True,
+            line_no_start=1,
+            line_no_end=1,
+            value='\n    """f"""',
+        )
+        cst_index.insert(1, doc_str)
+        cst_index.insert(1, doc_str)
+        self.assertEqual(
+            cst_index.find("FunctionDefinitionStart", "g", 5)[0], g_idx + 2
+        )
+        del cst_index[1]
+        cst_index[0] = cst_index[0]._replace(value="def f(a, c):")
+        self.assertEqual(
+            cst_index.find("FunctionDefinitionStart", "g", 5)[0], g_idx + 1
+        )
+        self.assertEqual(cst_index.find("FunctionDefinitionStart", "f", 1)[0], 0)
+        del cst_index[0]
+        self.assertTupleEqual(
+            cst_index.find("FunctionDefinitionStart", "f", 1), (None, None)
+        )
+        self.assertEqual(cst_index.find("FunctionDefinitionStart", "g", 5), (g_idx, g))
+
 
 unittest_main()
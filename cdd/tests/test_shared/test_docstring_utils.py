@@ -6,6 +6,8 @@ from textwrap import indent
 from unittest import TestCase
 
 from cdd.shared.docstring_utils import (
+    Style,
+    derive_docstring_format,
     ensure_doc_args_whence_original,
     parse_docstring_into_header_args_footer,
 )
@@ -271,5 +273,20 @@ class TestDocstringUtils(TestCase):
             "\n" + "\n".join(docstring_google_tf_mean_squared_error_footer_tuple),
         )
 
+    def test_derive_docstring_format(self) -> None:
+        """
+        Tests that `derive_docstring_format` prefers ReST tokens anywhere, then Google tokens, else numpydoc
+        """
+        for docstring, style in (
+            (None, Style.rest),
+            ("", Style.numpydoc),
+            ("Foo\n\n:param a: bar", Style.rest),
+            ("Foo\n\nArgs:\n    a (int): bar", Style.google),
+            ("Args: a\n\n:rtype: ```int```", Style.rest),
+            ("Args:param a", Style.rest),
+            ("Foo\n\nParameters\n----------\na : int", Style.numpydoc),
+        ):
+            self.assertEqual(derive_docstring_format(docstring), style, docstring)
+
 
 unittest_main()
@@ -0,0 +1,111 @@
+"""
+Tests for ir_cache
+"""
+
+from ast import parse
+from os import path, utime, walk
+from tempfile import TemporaryDirectory
+from time import time
+from unittest import TestCase
+
+import cdd.class_.parse
+from cdd.shared.ir_cache import cached_parser, evict_ir_cache, set_ir_cache_dir
+from cdd.tests.mocks.classes import class_str
+from cdd.tests.utils_for_tests import unittest_main
+
+
+class TestIrCache(TestCase):
+    """
+    Tests for ir_cache
+    """
+
+    def tearDown(self) -> None:
+        """Disable the cache, so it doesn't leak into other tests"""
+        set_ir_cache_dir(None)
+
+    def test_cached_parser(self) -> None:
+        """
+        Tests `cached_parser` only calls the parser on a miss, and gives copies on hits
+        """
+        calls = []  # type: list[str]
+
+        def parser(doc_string, word_wrap=True):
+            """
+            :param doc_string: Docstring
+            :type doc_string: ```str```
+
+            :param word_wrap: Whether to word-wrap
+            :type word_wrap: ```bool```
+
+            :return: IR
+            :rtype: ```dict```
+            """
+            calls.append(doc_string)
+            return {"name": doc_string, "params": {}, "word_wrap": word_wrap}
+
+        cached = cached_parser(parser)
+
+        self.assertDictEqual(cached("doc", word_wrap=False), parser("doc", False))
+        self.assertEqual(len(calls), 2)  # Not cached as cache dir is unset
+
+        with TemporaryDirectory() as tempdir:
+            set_ir_cache_dir(tempdir)
+            first = cached("doc", word_wrap=False)
+            second = cached("doc", word_wrap=False)
+            self.assertEqual(len(calls), 3)
+            self.assertDictEqual(second, first)
+            self.assertIsNot(second, first)
+
+            cached("doc", word_wrap=True)
+            self.assertEqual(len(calls), 4)
+
+    def test_cached_class_parse(self) -> None:
+        """
+        Tests the IR of `cdd.class_.parse.class_` is the same cold and from the cache
+        """
+        with TemporaryDirectory() as tempdir:
+            set_ir_cache_dir(tempdir)
+            cold = cdd.class_.parse.class_(parse(class_str).body[0])
+            self.assertDictEqual(
+                cdd.class_.parse.class_(class_def=parse(class_str).body[0]), cold
+            )
+
+    def test_evict_ir_cache(self) -> None:
+        """
+        Tests `evict_ir_cache` removes the least recently used entries until the cache fits
+        """
+        with TemporaryDirectory() as tempdir:
+            for name in "abc":
+                with open(path.join(tempdir, name), "wb") as f:
+                    f.write(b"0" * 10)
+            evict_ir_cache(tempdir, max_bytes=25)
+            self.assertEqual(sum(map(len, map(lambda w: w[2], walk(tempdir)))), 2)
+
+    def test_evict_ir_cache_temporary(self) -> None:
+        """
+        Tests `evict_ir_cache` leaves the temporary files of writes in progress, removing only those left by a crash
+        """
+        with TemporaryDirectory() as tempdir:
+            for name in "a.tmp", "b.tmp":
+                with open(path.join(tempdir, name), "wb") as f:
+                    f.write(b"0" * 10)
+            utime(path.join(tempdir, "b.tmp"), (time() - 2 * 60 * 60,) * 2)
+            evict_ir_cache(tempdir, max_bytes=0)
+            self.assertListEqual(next(walk(tempdir))[2], ["a.tmp"])
+
+    def test_unwritable_cache_dir(self) -> None:
+        """
+        Tests parsing still succeeds—uncached—when the cache directory can't be created
+        """
+        with TemporaryDirectory() as tempdir:
+            not_a_dir: str = path.join(tempdir, "not_a_dir")
+            open(not_a_dir, "a").close()
+            set_ir_cache_dir(path.join(not_a_dir, "cache"))
+            self.assertDictEqual(
+                cdd.class_.parse.class_(parse(class_str).body[0]),
+                cdd.class_.parse.class_(parse(class_str).body[0]),
+            )
+            self.assertListEqual(next(walk(tempdir))[2], ["not_a_dir"])
+
+
+unittest_main()
@@ -9,6 +9,7 @@ from unittest.mock import patch
 
 from cdd.shared.pure_utils import (
     SetEncoder,
+    ToggleableLruCache,
     append_to_dict,
     assert_equal,
     balanced_parentheses,
@@ -16,11 +17,13 @@ from cdd.shared.pure_utils import (
     deindent,
     diff,
     ensure_valid_identifier,
+    environ_int,
     find_module_filepath,
     get_module,
     identity,
     location_within,
     lstrip_namespace,
+    multi_pattern_matcher,
     multiline,
     namespaced_pascal_to_upper_camelcase,
     namespaced_upper_camelcase_to_pascal,
@@ -51,6 +54,40 @@ class TestPureUtils(TestCase):
             dumps(data, cls=SetEncoder), str(sorted(data)).replace("'", '"')
         )
 
+    def test_ToggleableLruCache(self) -> None:
+        """Tests `ToggleableLruCache` sizes itself from the environment, and can be enabled & disabled"""
+        calls = []  # type: list[int]
+
+        def double(i):
+            """
+            :param i: Number
+            :type i: ```int```
+
+            :return: Doubled number
+            :rtype: ```int```
+            """
+            calls.append(i)
+            return i * 2
+
+        with patch.dict("os.environ", {"CDD_TEST_CACHE_SIZE": "nope"}):
+            cache = ToggleableLruCache(double, "CDD_TEST_CACHE_SIZE", 4)
+        self.assertEqual(cache.cache_info().maxsize, 4)
+        self.assertTupleEqual((cache(1), cache(1)), (2, 2))
+        self.assertListEqual(calls, [1])
+
+        cache.disable()
+        self.assertIsNone(cache.cache_info())
+        self.assertEqual(cache(1), 2)
+        self.assertListEqual(calls, [1, 1])
+
+        cache.enable(2)
+        self.assertEqual(cache.cache_info().currsize, 0)
+
+        with patch.dict("os.environ", {"CDD_TEST_CACHE_SIZE": "0"}):
+            self.assertIsNone(
+                ToggleableLruCache(double, "CDD_TEST_CACHE_SIZE", 4).cache_info()
+            )
+
     def test_balanced_parentheses(self) -> None:
         """Tests that `balanced_parentheses` handles edge cases"""
         self.assertTrue(balanced_parentheses("foo()"))
@@ -84,6 +121,15 @@ class TestPureUtils(TestCase):
             self.assertEqual(ensure_valid_identifier(ident), "_")
         self.assertEqual(ensure_valid_identifier(""), "_")
 
+    def test_environ_int(self) -> None:
+        """Tests `environ_int` falls back to the default when unset or not an integer"""
+        with patch.dict("os.environ", {"CDD_TEST_INT": "5"}):
+            self.assertEqual(environ_int("CDD_TEST_INT", 3), 5)
+        with patch.dict("os.environ", {"CDD_TEST_INT": "five"}):
+            self.assertEqual(environ_int("CDD_TEST_INT", 3), 3)
+        with patch.dict("os.environ", clear=True):
+            self.assertEqual(environ_int("CDD_TEST_INT", 3), 3)
+
     def test_find_module_filepath(self) -> None:
         """tests that it can `find_module_filepath`"""
         self.assertEqual(
@@ -165,6 +211,32 @@ class TestPureUtils(TestCase):
             location_within(map(str, range(10)), map(str, range(10, 20))), none_res
         )
 
+    def test_location_within_ignore_case(self) -> None:
+        """Tests `location_within` with `ignore_case` finds the first pattern in order, not the leftmost match"""
+
+        patterns = "Defaults to ", "bar", "ß"  # type: tuple[str, ...]
+        for container, expected in (
+            ("bar. defaults TO 5", (5, 17, "Defaults to ")),
+            ("foo BAR", (4, 7, "bar")),
+            ("BAR ß", (0, 3, "bar")),
+            ("SS ß", (3, 4, "ß")),
+            ("foo", (-1, -1, None)),
+        ):
+            self.assertTupleEqual(
+                location_within(container, patterns, ignore_case=True), expected
+            )
+            self.assertTupleEqual(
+                location_within(
+                    container, iter(patterns), cmp=lambda a, b: a.lower() == b.lower()
+                ),
+                expected,
+            )
+        self.assertTupleEqual(
+            multi_pattern_matcher(("ab", "b"))("bab"),
+            location_within("bab", ("ab", "b")),
+        )
+        self.assertTupleEqual(multi_pattern_matcher(("ab", "b"))("BAB"), (-1, -1, None))
+
     def test_multiline(self) -> None:
         """Tests that `multiline` multilines"""
         self.assertEqual(
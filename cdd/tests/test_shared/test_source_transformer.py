@@ -3,10 +3,19 @@ Tests for source_transformer
 """
 
 from ast import FunctionDef, Pass, arguments
+from os import path
+from os.path import extsep
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 from cdd.shared.pure_utils import tab
-from cdd.shared.source_transformer import to_code
+from cdd.shared.source_transformer import (
+    ast_parse_file,
+    disable_parse_cache,
+    enable_parse_cache,
+    parse_cache_info,
+    to_code,
+)
 from cdd.tests.utils_for_tests import unittest_main
 
 
@@ -42,5 +51,28 @@ class TestSourceTransformer(TestCase):
             "def funcy():\n" "{tab}pass".format(tab=tab),
         )
 
+    def test_ast_parse_file_cache(self) -> None:
+        """
+        Tests `ast_parse_file` serves unchanged files from the parse cache, and copies unless told not to
+        """
+        enable_parse_cache(maxsize=1)
+        try:
+            with TemporaryDirectory() as tempdir:
+                filename: str = path.join(tempdir, "a{extsep}py".format(extsep=extsep))
+                with open(filename, "wt") as f:
+                    f.write("a = 5\n")
+
+                first = ast_parse_file(filename, copy=False)
+                self.assertIs(ast_parse_file(filename, copy=False), first)
+                self.assertIsNot(ast_parse_file(filename), first)
+                self.assertTupleEqual(parse_cache_info()[:2], (2, 1))
+
+                with open(filename, "at") as f:
+                    f.write("b = 6\n")
+                self.assertEqual(len(ast_parse_file(filename, copy=False).body), 2)
+                self.assertTupleEqual(parse_cache_info(), (2, 2, 1, 1))
+        finally:
+            disable_parse_cache()
+
 
 unittest_main()
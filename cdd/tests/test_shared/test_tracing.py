@@ -0,0 +1,129 @@
+""" Tests for tracing """
+
+from ast import parse
+from json import load
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import cdd.shared.tracing
+from cdd.shared.emit.file import file
+from cdd.shared.source_transformer import (
+    ast_parse_file,
+    disable_parse_cache,
+    enable_parse_cache,
+)
+from cdd.shared.tracing import (
+    chrome_trace,
+    count,
+    disable_tracing,
+    enable_tracing,
+    span,
+    traced,
+    tracing_summary,
+    write_chrome_trace,
+)
+from cdd.tests.utils_for_tests import unittest_main
+
+
+class TestTracing(TestCase):
+    """
+    Tests for tracing
+    """
+
+    def tearDown(self) -> None:
+        """
+        Disable tracing, its default, and forget what was recorded
+        """
+        enable_tracing()
+        disable_tracing()
+
+    def test_disabled(self) -> None:
+        """
+        Tests nothing is recorded when tracing is disabled; `span` giving the one shared no-op
+        """
+        disable_tracing()
+        self.assertIs(span("a"), span("b"))
+        with span("a"):
+            count("a")
+        self.assertEqual(traced("b")(lambda x: x * 2)(3), 6)
+        self.assertEqual(tracing_summary(), "")
+        self.assertListEqual(chrome_trace()["traceEvents"], [])
+
+    def test_enabled(self) -> None:
+        """
+        Tests spans & counters are recorded, summarised slowest phase first, and written as a Chrome trace
+        """
+        enable_tracing()
+        with span("outer"):
+            with span("inner"):
+                count("things", 2)
+            traced("inner")(count)("things")
+        disable_tracing()
+        count("things")  # Not recorded: tracing is disabled again
+
+        summary = tracing_summary().splitlines()
+        self.assertListEqual(
+            list(map(lambda line: line.split()[:2], summary)),
+            [
+                ["phase", "calls"],
+                ["outer", "1"],
+                ["inner", "2"],
+                ["counter", "value"],
+                ["things", "3"],
+            ],
+        )
+        with TemporaryDirectory() as temp_dir:
+            trace_filename: str = path.join(temp_dir, "trace.json")
+            write_chrome_trace(trace_filename)
+            with open(trace_filename, "rt") as f:
+                trace = load(f)
+        self.assertListEqual(
+            list(
+                map(
+                    lambda event: (event["name"], event["ph"]),
+                    trace["traceEvents"],
+                )
+            ),
+            [("inner", "X"), ("inner", "X"), ("outer", "X"), ("counters", "C")],
+        )
+        outer = trace["traceEvents"][2]  # type: dict
+        self.assertTrue(
+            all(
+                outer["ts"] <= event["ts"]
+                and event["ts"] + event["dur"] <= outer["ts"] + outer["dur"]
+                for event in trace["traceEvents"][:2]
+            )
+        )
+        self.assertDictEqual(trace["traceEvents"][3]["args"], {"things": 3})
+
+    def test_counters(self) -> None:
+        """
+        Tests files parsed, parse cache hits, files & bytes written are counted
+        """
+        with TemporaryDirectory() as temp_dir:
+            filename: str = path.join(temp_dir, "mod.py")
+            enable_tracing()
+            file(parse("a = 5"), filename, mode="wt")
+            enable_parse_cache()
+            try:
+                for _ in range(3):
+                    ast_parse_file(filename)
+            finally:
+                disable_parse_cache()
+            ast_parse_file(filename)
+            disable_tracing()
+            with open(filename, "rb") as f:
+                size = len(f.read())  # type: int
+        self.assertDictEqual(
+            dict(cdd.shared.tracing._counters),
+            {
+                "files written": 1,
+                "bytes written": size,
+                "files parsed": 2,
+                "parse cache hits": 2,
+            },
+        )
+
+
+unittest_main()
@@ -0,0 +1,77 @@
+""" Tests for type_expr_cache """
+
+from ast import Name, Subscript
+from unittest import TestCase
+
+from cdd.shared.ast_utils import cmp_ast
+from cdd.shared.defaults_utils import needs_quoting
+from cdd.shared.type_expr_cache import (
+    disable_type_expr_cache,
+    enable_type_expr_cache,
+    parse_type_expr,
+    type_expr_cache_info,
+    type_expr_names,
+    type_expr_needs_quoting,
+)
+from cdd.tests.utils_for_tests import unittest_main
+
+
+class TestTypeExprCache(TestCase):
+    """
+    Tests for type_expr_cache
+    """
+
+    def tearDown(self) -> None:
+        """
+        Restore the default type-expression cache
+        """
+        enable_type_expr_cache()
+
+    def test_parse_type_expr(self) -> None:
+        """
+        Tests `parse_type_expr` parses each type expression once, handing out copies unless told not to
+        """
+        enable_type_expr_cache(maxsize=2)
+        shared = parse_type_expr("Optional[str]", copy=False)
+        self.assertIsInstance(shared, Subscript)
+        self.assertIs(parse_type_expr("Optional[str]", copy=False), shared)
+        copied = parse_type_expr("Optional[str]")
+        self.assertIsNot(copied, shared)
+        self.assertTrue(cmp_ast(copied, shared))
+        copied.value.id = "List"
+        self.assertEqual(parse_type_expr("Optional[str]").value.id, "Optional")
+        self.assertTupleEqual(type_expr_cache_info(), (3, 1, 2, 1))
+
+        self.assertTrue(
+            cmp_ast(
+                parse_type_expr("Optional[str", fix_unbalanced=True),
+                parse_type_expr("Optional[str]"),
+            )
+        )
+        self.assertRaises(SyntaxError, parse_type_expr, "Optional[str")
+
+        disable_type_expr_cache()
+        self.assertIsNone(type_expr_cache_info())
+        self.assertIsInstance(parse_type_expr("str", copy=False), Name)
+
+    def test_type_expr_facts(self) -> None:
+        """
+        Tests the facts derived from type expressions, as used by `needs_quoting`
+        """
+        self.assertSetEqual(
+            type_expr_names("Union[int, Dict[str, np.ndarray]]"),
+            {"Union", "int", "Dict", "str", "np"},
+        )
+        for typ, expected in (
+            ("str", True),
+            ("int", False),
+            ("Optional[List[str]]", True),
+            ("Literal['a', 'b']", True),
+            ("Literal[5]", False),
+            ("Dict[str", True),
+        ):
+            self.assertEqual(type_expr_needs_quoting(typ), expected, typ)
+            self.assertEqual(needs_quoting(typ), expected, typ)
+
+
+unittest_main()
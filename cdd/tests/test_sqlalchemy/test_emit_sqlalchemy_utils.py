@@ -508,6 +508,85 @@ class TestEmitSqlAlchemyUtils(TestCase):
             gold=node_pk_tbl_class,
         )
 
+    def test_update_imports_and_fks_for_files(self) -> None:
+        """
+        Tests `cdd.sqlalchemy.utils.emit_utils.update_imports_and_fks_for_files` fuses phases 1 & 2, resolving
+
+        ```
+        primary_element = Column(Element, ForeignKey('element.not_the_right_primary_key'))
+        ```
+
+        Into this—and its import—from the other model in memory; never importing nor parsing its file again:
+        ```
+        primary_element = Column(Integer, ForeignKey('element.element_id'))
+        ```
+        """
+        with TemporaryDirectory() as tempdir:
+            mod_name: str = "test_update_imports_and_fks_for_files"
+            temp_mod_dir: str = path.join(tempdir, mod_name)
+            mkdir(temp_mod_dir)
+            node_filename, element_filename = map(
+                lambda name: path.join(
+                    temp_mod_dir, "{name}{sep}py".format(name=name, sep=path.extsep)
+                ),
+                ("node", "element"),
+            )
+            node_pk_with_phase0_fk: ClassDef = deepcopy(node_pk_tbl_class)
+            node_pk_with_phase0_fk.body[2].value.args = [
+                Name(id="Element", ctx=Load(), lineno=None, col_offset=None),
+                Call(
+                    func=Name(
+                        id="ForeignKey", ctx=Load(), lineno=None, col_offset=None
+                    ),
+                    args=[set_value("element.not_the_right_primary_key")],
+                    keywords=[],
+                    lineno=None,
+                    col_offset=None,
+                ),
+            ]
+            element_class: ClassDef = (
+                cdd.sqlalchemy.utils.emit_utils.sqlalchemy_table_to_class(
+                    deepcopy(element_pk_fk_ass)
+                )
+            )
+            element_class.name = "Element"
+            for filename, class_def in (node_filename, node_pk_with_phase0_fk), (
+                element_filename,
+                element_class,
+            ):
+                with open(filename, "wt") as f:
+                    f.write(to_code(class_def))
+
+            with patch(
+                "cdd.sqlalchemy.utils.emit_utils.find_module_filepath",
+                side_effect=AssertionError,
+            ):
+                cdd.sqlalchemy.utils.emit_utils.update_imports_and_fks_for_files(
+                    (node_filename, element_filename)
+                )
+
+            with open(node_filename, "rt") as f:
+                gen_mod: Module = ast.parse(f.read())
+
+        self.assertEqual(len(gen_mod.body), 2)
+        run_ast_test(
+            self,
+            gen_mod.body[0],
+            ImportFrom(
+                module=".".join((mod_name, "element")),
+                names=[
+                    alias(
+                        "Element",
+                        None,
+                        identifier=None,
+                        identifier_name=None,
+                    )
+                ],
+                level=0,
+            ),
+        )
+        run_ast_test(self, gen_mod.body[1], gold=node_pk_tbl_class)
+
     def test_sqlalchemy_table_to_class(self) -> None:
         """Tests that `cdd.sqlalchemy.utils.emit_utils.sqlalchemy_table_to_class` works"""
         run_ast_test(
@@ -573,5 +652,59 @@ class TestEmitSqlAlchemyUtils(TestCase):
             gold=column_fk_gold,
         )
 
+    def test_resolve_sqlalchemy_model(self) -> None:
+        """
+        Tests `resolve_sqlalchemy_model` finds & parses each model once per run, until its file changes
+        """
+        sqlalchemy_cls = deepcopy(node_pk_tbl_class)
+        sqlalchemy_cls.name = "TableName0"
+        sqlalchemy_cls.body[0].value = set_value("table_name0")
+        sqlalchemy_cls.body[1:] = [column_fk, id_column]
+
+        with TemporaryDirectory() as temp_dir:
+            init_path: str = path.join(temp_dir, cdd.shared.pure_utils.INIT_FILENAME)
+            with open(init_path, "wt") as f:
+                f.write(to_code(sqlalchemy_cls))
+            cdd.sqlalchemy.utils.emit_utils.clear_sqlalchemy_model_cache()
+            with patch(
+                "cdd.sqlalchemy.utils.emit_utils.find_module_filepath",
+                return_value=init_path,
+            ) as find_module_filepath:
+                for _ in range(3):
+                    self.assertTupleEqual(
+                        cdd.sqlalchemy.utils.emit_utils.resolve_sqlalchemy_model(
+                            "table_name0", "TableName0"
+                        ),
+                        ("table_name0", "table_name0", "id", "Integer"),
+                    )
+                self.assertEqual(find_module_filepath.call_count, 1)
+
+                sqlalchemy_cls.body[0].value = set_value("renamed_table_name0")
+                with open(init_path, "wt") as f:
+                    f.write(to_code(sqlalchemy_cls))
+                self.assertEqual(
+                    cdd.sqlalchemy.utils.emit_utils.resolve_sqlalchemy_model(
+                        "table_name0", "TableName0"
+                    ).table_name,
+                    "renamed_table_name0",
+                )
+                self.assertEqual(find_module_filepath.call_count, 2)
+
+                cdd.sqlalchemy.utils.emit_utils.clear_sqlalchemy_model_cache()
+                cdd.sqlalchemy.utils.emit_utils.resolve_sqlalchemy_model(
+                    "table_name0", "TableName0"
+                )
+                self.assertEqual(find_module_filepath.call_count, 3)
+
+            # Each run starts afresh, as a module may resolve to another file by then
+            empty_path: str = path.join(
+                temp_dir, "empty{sep}py".format(sep=path.extsep)
+            )
+            open(empty_path, "wt").close()
+            cdd.sqlalchemy.utils.emit_utils.update_fk_for_file(empty_path)
+            self.assertDictEqual(
+                cdd.sqlalchemy.utils.emit_utils._sqlalchemy_model_cache, {}
+            )
+
 
 unittest_main()